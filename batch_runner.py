@@ -0,0 +1,234 @@
+"""
+Regenerate many decks in one run, spread over a process pool.
+
+Jobs are read from a JSONL file, one object per line:
+
+    {"id": "emea", "template": "month_end_closing", "output": "output/emea.pptx"}
+    {"id": "apac", "query": "Create a bar chart of APAC sales ...", "input": "input/apac.pptx", "output": "output/apac.pptx"}
+    {"id": "na", "spec": "specs/month_end_closing.yaml", "output": "output/na.pptx"}
+
+Each job has exactly one of `query`, `template` or `spec`, an optional `input` template and
+an `output` path. Provider calls from all workers share one token bucket.
+
+Usage:
+    python batch_runner.py jobs.jsonl --workers 8 --rate 2 --retries 2
+    python batch_runner.py jobs.jsonl --replay benchmarks/recordings.jsonl   # offline
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import tracing
+
+
+class TokenBucket:
+    """
+    Token bucket shared by every worker process: allows `rate` acquisitions per second
+    on average and bursts of up to `capacity`.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = multiprocessing.Value("d", self.capacity, lock=False)
+        self._updated = multiprocessing.Value("d", time.monotonic(), lock=False)
+        self._lock = multiprocessing.Lock()
+
+    def acquire(self, tokens=1):
+        """
+        Block until `tokens` tokens are available and take them
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                available = min(self.capacity, self._tokens.value + (now - self._updated.value) * self.rate)
+                self._updated.value = now
+                if available >= tokens:
+                    self._tokens.value = available - tokens
+                    return
+                self._tokens.value = available
+                wait = (tokens - available) / self.rate
+            time.sleep(wait)
+
+
+class RateLimitedChatModel:
+    """
+    Chat model wrapper that takes a token from a TokenBucket before every provider call
+    """
+
+    def __init__(self, llm, bucket):
+        self.llm = llm
+        self.bucket = bucket
+
+    def bind_tools(self, tools, **kwargs):
+        return RateLimitedChatModel(self.llm.bind_tools(tools, **kwargs), self.bucket)
+
+    def invoke(self, messages, **kwargs):
+        if self.bucket is not None:
+            self.bucket.acquire()
+        return self.llm.invoke(messages, **kwargs)
+
+
+def load_jobs(path):
+    jobs = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            job = json.loads(line)
+            job.setdefault("id", str(line_number))
+            kinds = [kind for kind in ("query", "template", "spec") if kind in job]
+            if len(kinds) != 1:
+                raise ValueError(f"{path}:{line_number}: a job needs exactly one of query, template or spec")
+            if "output" not in job:
+                raise ValueError(f"{path}:{line_number}: a job needs an output path")
+            jobs.append(job)
+    return jobs
+
+
+# Per worker process state, set by _init_worker
+_BUCKET = None
+_VERBOSE = False
+
+
+def _init_worker(bucket, verbose, trace_settings=None):
+    global _BUCKET, _VERBOSE
+    _BUCKET = bucket
+    _VERBOSE = verbose
+    tracing.configure_worker(trace_settings)
+
+
+def _make_llm(llm_name, replay_path):
+    from ppt_agent import create_chat_model
+
+    if replay_path:
+        from fake_llm import ReplayChatModel
+        llm = ReplayChatModel.from_jsonl(replay_path)
+    else:
+        llm = create_chat_model(llm_name)
+    return RateLimitedChatModel(llm, _BUCKET)
+
+
+def _build(job, llm_name, replay_path):
+    from session import PresentationSession
+
+    os.makedirs(os.path.dirname(job["output"]) or ".", exist_ok=True)
+
+    if "spec" in job:
+        from deck_spec import build_deck, load_spec
+        spec = load_spec(job["spec"]) if isinstance(job["spec"], str) else job["spec"]
+        # The spec's own input and config apply unless the job overrides the input
+        if isinstance(spec, list):
+            spec = {"slides": spec}
+        if job.get("input"):
+            spec = {**spec, "input": job["input"]}
+        return build_deck(spec, output_path=job["output"])
+
+    session = PresentationSession(input_path=job.get("input"), save_path=job["output"])
+    llm = _make_llm(job.get("llm", llm_name), replay_path)
+    if "template" in job:
+        from workflow import TemplateWorkflow
+        workflow = TemplateWorkflow(llm=llm)
+        workflow.run(job["template"], session=session)
+        if workflow.failed_prompts:
+            raise RuntimeError(f"{len(workflow.failed_prompts)} template prompts failed: "
+                               + "; ".join(f"{prompt!r}: {error}" for prompt, error in workflow.failed_prompts.items()))
+        return session.save_path
+
+    from ppt_agent import PresentationAgent
+    agent = PresentationAgent(llm=llm, session=session)
+    # plan/execute directly rather than process_query, so failures reach the retry loop
+    agent.execute_tool_calls(agent.plan_query(job["query"]))
+    return session.save_path
+
+
+def run_job(job, llm_name="gemini", replay_path=None, retries=2, backoff=1.0):
+    """
+    Run one job in a worker, retrying with exponential backoff.
+    Returns:
+        Result record: id, status ("ok" or "failed"), attempts, seconds, output, error
+    """
+    try:
+        return _run_job(job, llm_name, replay_path, retries, backoff)
+    finally:
+        # Pool workers can exit without running atexit handlers, so spans are written after every job
+        tracing.flush()
+
+
+def _run_job(job, llm_name, replay_path, retries, backoff):
+    start = time.perf_counter()
+    error = None
+    for attempt in range(1, retries + 2):
+        output = contextlib.nullcontext() if _VERBOSE else contextlib.redirect_stdout(io.StringIO())
+        try:
+            with output:
+                path = _build(job, llm_name, replay_path)
+            if not os.path.isfile(path):
+                raise RuntimeError(f"no deck was written to {path}")
+            return {"id": job["id"], "status": "ok", "attempts": attempt,
+                    "seconds": time.perf_counter() - start, "output": path, "error": None}
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if attempt <= retries:
+                time.sleep(backoff * 2 ** (attempt - 1))
+    return {"id": job["id"], "status": "failed", "attempts": retries + 1,
+            "seconds": time.perf_counter() - start, "output": None, "error": error}
+
+
+def print_summary(results, wall):
+    ok = [r for r in results if r["status"] == "ok"]
+    failed = [r for r in results if r["status"] == "failed"]
+    latencies = sorted(r["seconds"] for r in results)
+    retried = sum(1 for r in results if r["attempts"] > 1)
+
+    print(f"\n{len(results)} jobs in {wall:.1f}s: {len(ok)} ok, {len(failed)} failed, {retried} retried")
+    if results:
+        print(f"Throughput: {len(ok) / wall:.2f} decks/s ({len(ok) / wall * 3600:.0f} decks/hour)")
+        print(f"Job latency: median {latencies[len(latencies) // 2]:.2f}s, "
+              f"p95 {latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]:.2f}s, max {latencies[-1]:.2f}s")
+    for r in failed:
+        print(f"  FAILED {r['id']}: {r['error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build decks for a JSONL queue of jobs on a process pool")
+    parser.add_argument("jobs", help="JSONL file of jobs")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes")
+    parser.add_argument("--llm", default="gemini", help="Provider for query and template jobs (gemini or llama)")
+    parser.add_argument("--replay", help="Replay recorded tool calls from this JSONL instead of calling a provider")
+    parser.add_argument("--rate", type=float, default=1.0, help="Provider calls per second across all workers")
+    parser.add_argument("--burst", type=float, help="Token bucket capacity (defaults to the rate)")
+    parser.add_argument("--retries", type=int, default=2, help="Retries per job")
+    parser.add_argument("--backoff", type=float, default=1.0, help="Initial retry backoff in seconds")
+    parser.add_argument("--results", help="Write one JSON result per job to this file")
+    parser.add_argument("--verbose", action="store_true", help="Show tool output from the workers")
+    args = parser.parse_args()
+
+    jobs = load_jobs(args.jobs)
+    bucket = TokenBucket(args.rate, args.burst) if args.rate > 0 else None
+
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker,
+                             initargs=(bucket, args.verbose, tracing.settings())) as pool:
+        futures = [pool.submit(run_job, job, args.llm, args.replay, args.retries, args.backoff) for job in jobs]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            print(f"[{len(results)}/{len(jobs)}] {result['id']}: {result['status']} in {result['seconds']:.2f}s")
+    wall = time.perf_counter() - start
+    tracing.merge_worker_traces()
+
+    print_summary(results, wall)
+    if args.results:
+        with open(args.results, "w", encoding="utf-8") as f:
+            for result in results:
+                f.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
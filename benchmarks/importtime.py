@@ -0,0 +1,81 @@
+"""
+Import-time report: how long a cold `import <module>` takes and which dependencies it pays for.
+
+Each module is imported in a fresh interpreter with `python -X importtime`.
+
+Usage (from the repository root):
+    python -m benchmarks.importtime
+    python -m benchmarks.importtime tools ppt_agent --top 15 --budget-ms 800
+"""
+import argparse
+import subprocess
+import sys
+
+DEFAULT_MODULES = ["tools", "ppt_agent", "workflow", "deck_spec"]
+
+
+def measure(module):
+    """
+    Import a module in a fresh interpreter.
+
+    Returns:
+        List of (module_name, self_us, cumulative_us, depth) in import order
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr.strip().splitlines()[-1]}")
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+
+def report(module, entries, top):
+    total = next((cumulative for name, _, cumulative, _ in reversed(entries) if name == module), 0)
+
+    # Attribute self time to top-level packages
+    packages = {}
+    for name, self_us, _, _ in entries:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+
+    print(f"\nimport {module}: {total / 1000:.1f} ms, {len(entries)} modules")
+    print("  heaviest packages (self time):")
+    for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+        print(f"    {package:<32} {self_us / 1000:8.1f} ms")
+    print("  heaviest direct imports (cumulative):")
+    direct = [entry for entry in entries if entry[3] == 1]
+    for name, _, cumulative, _ in sorted(direct, key=lambda entry: -entry[2])[:top]:
+        print(f"    {name:<32} {cumulative / 1000:8.1f} ms")
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-module import cost report")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES, help="Modules to import")
+    parser.add_argument("--top", type=int, default=10, help="Rows per section")
+    parser.add_argument("--budget-ms", type=float, help="Exit with status 1 if any import exceeds this")
+    args = parser.parse_args()
+
+    over_budget = []
+    for module in args.modules:
+        total = report(module, measure(module), args.top)
+        if args.budget_ms is not None and total / 1000 > args.budget_ms:
+            over_budget.append(module)
+
+    if over_budget:
+        print(f"\nOver the {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+End-to-end throughput benchmark for TemplateWorkflow, run offline against recorded LLM responses.
+
+Usage (from the repository root):
+    python -m benchmarks.pipeline --runs 5 --latency 0.8
+    python -m benchmarks.pipeline --templates month_end_closing --json results.json
+"""
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from fake_llm import ReplayChatModel
+from ppt_agent import PresentationAgent
+from template_prompts import TEMPLATE_PROMPTS
+from tools import Presentationtools
+from workflow import TemplateWorkflow
+
+RECORDINGS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "recordings.jsonl")
+
+
+class StageTimer:
+    """
+    Accumulates wall time per stage by wrapping methods. Thread safe, because planning runs on a pool.
+    """
+
+    def __init__(self):
+        self.totals = {}
+        self._lock = threading.Lock()
+        self._patched = []
+
+    def patch(self, cls, method_name, stage):
+        original = getattr(cls, method_name)
+
+        @functools.wraps(original)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.totals[stage] = self.totals.get(stage, 0.0) + elapsed
+
+        setattr(cls, method_name, wrapper)
+        self._patched.append((cls, method_name, original))
+
+    def reset(self):
+        with self._lock:
+            self.totals = {}
+
+    def restore(self):
+        for cls, method_name, original in reversed(self._patched):
+            setattr(cls, method_name, original)
+        self._patched = []
+
+
+def run_template(template, llm, max_concurrency, timer, verbose=False):
+    timer.reset()
+    tracemalloc.start()
+    start = time.perf_counter()
+    out = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    with out:
+        TemplateWorkflow(max_concurrency=max_concurrency, llm=llm).run(template)
+    wall = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    path = Presentationtools(mode=template).get_save_path()
+    return {
+        "wall": wall,
+        "stages": dict(timer.totals),
+        "peak_memory": peak,
+        "output_size": os.path.getsize(path) if os.path.exists(path) else 0,
+    }
+
+
+def summarize(template, runs):
+    walls = sorted(run["wall"] for run in runs)
+    stages = {}
+    for run in runs:
+        for stage, seconds in run["stages"].items():
+            stages.setdefault(stage, []).append(seconds)
+    return {
+        "template": template,
+        "prompts": len(TEMPLATE_PROMPTS[template]),
+        "runs": len(runs),
+        "decks_per_second": len(runs) / sum(walls),
+        "wall_median": walls[len(walls) // 2],
+        "wall_max": walls[-1],
+        "stage_mean": {stage: sum(values) / len(values) for stage, values in stages.items()},
+        "peak_memory_max": max(run["peak_memory"] for run in runs),
+        "output_size": runs[-1]["output_size"],
+    }
+
+
+def print_report(summaries, latency):
+    print(f"\nTemplateWorkflow benchmark (synthetic LLM latency {latency:.2f}s)")
+    for s in summaries:
+        print(f"\n{s['template']}  ({s['prompts']} prompts, {s['runs']} runs)")
+        print(f"  decks/second      : {s['decks_per_second']:.3f}")
+        print(f"  wall median / max : {s['wall_median'] * 1000:.1f} ms / {s['wall_max'] * 1000:.1f} ms")
+        for stage, seconds in sorted(s["stage_mean"].items()):
+            print(f"  {stage:<18}: {seconds * 1000:.1f} ms")
+        print(f"  peak memory       : {s['peak_memory_max'] / 1024 / 1024:.1f} MiB")
+        print(f"  output size       : {s['output_size'] / 1024:.1f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline TemplateWorkflow throughput benchmark")
+    parser.add_argument("--templates", nargs="*", default=list(TEMPLATE_PROMPTS), help="Templates to benchmark")
+    parser.add_argument("--runs", type=int, default=3, help="Decks built per template")
+    parser.add_argument("--latency", type=float, default=0.0, help="Synthetic LLM latency per call in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Maximum random extra LLM latency in seconds")
+    parser.add_argument("--concurrency", type=int, default=4, help="TemplateWorkflow max_concurrency")
+    parser.add_argument("--recordings", default=RECORDINGS_PATH, help="JSONL file with recorded tool calls")
+    parser.add_argument("--json", help="Write the summary to this JSON file")
+    parser.add_argument("--verbose", action="store_true", help="Show the workflow output")
+    args = parser.parse_args()
+
+    llm = ReplayChatModel.from_jsonl(args.recordings, latency=args.latency, jitter=args.jitter)
+
+    timer = StageTimer()
+    timer.patch(PresentationAgent, "plan_query", "llm (summed)")
+    timer.patch(PresentationAgent, "execute_tool_calls", "tools")
+    timer.patch(Presentationtools, "flush", "save")
+
+    # Decks are written to output/ relative to the working directory; keep them out of the repo
+    cwd = os.getcwd()
+    summaries = []
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            os.chdir(workdir)
+            os.makedirs("output", exist_ok=True)
+            for template in args.templates:
+                runs = [run_template(template, llm, args.concurrency, timer, args.verbose) for _ in range(args.runs)]
+                summaries.append(summarize(template, runs))
+            os.chdir(cwd)
+    finally:
+        os.chdir(cwd)
+        timer.restore()
+
+    print_report(summaries, args.latency)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summaries, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Table construction benchmark: the per-cell python-pptx proxy fill used before against
+the bulk XML writer in table_xml.
+
+Usage (from the repository root):
+    python -m benchmarks.tables
+    python -m benchmarks.tables --sizes 50x10 2000x20 --repeat 5
+"""
+import argparse
+import random
+import string
+import time
+from pptx import Presentation
+from pptx.util import Inches, Pt
+from table_xml import column_widths, fill_table
+
+DEFAULT_SIZES = ["50x10", "2000x20"]
+
+
+def make_table(rows, cols, seed=0):
+    rng = random.Random(seed)
+    headers = [f"Column {i + 1}" for i in range(cols)]
+    values = [["".join(rng.choices(string.ascii_letters, k=rng.randint(1, 12))) for _ in range(cols)]
+              for _ in range(rows)]
+    return headers, values
+
+
+def proxy_fill(slide, headers, values):
+    """
+    Previous implementation: one global width, every cell styled through proxies
+    """
+    cols = len(headers)
+    max_text_len = max(max((len(val) for vals in values for val in vals[:cols]), default=0),
+                       max(len(key) for key in headers))
+    cell_width = min(max(1.5, max_text_len * 0.15), 11 / cols)
+    table = slide.shapes.add_table(len(values) + 1, cols, Inches(1), Inches(1),
+                                   Inches(cell_width * cols), Inches(5)).table
+    for i, key in enumerate(headers):
+        cell = table.cell(0, i)
+        cell.text = key
+        paragraph = cell.text_frame.paragraphs[0]
+        paragraph.font.bold = True
+        paragraph.font.size = Pt(12)
+        for j, row in enumerate(values):
+            cell = table.cell(j + 1, i)
+            cell.text = row[i] if i < len(row) else ""
+            cell.text_frame.paragraphs[0].font.size = Pt(11)
+    for row in table.rows:
+        for cell in row.cells:
+            cell.margin_left = cell.margin_right = Inches(0.1)
+            cell.margin_top = cell.margin_bottom = Inches(0.05)
+            cell.vertical_anchor = 1
+            for paragraph in cell.text_frame.paragraphs:
+                paragraph.alignment = 1
+    return table
+
+
+def bulk_fill(slide, headers, values):
+    widths = column_widths(headers, values)
+    table = slide.shapes.add_table(1, len(headers), Inches(1), Inches(1), Inches(sum(widths)), Inches(5)).table
+    return fill_table(table, headers, values, widths, 5 / (len(values) + 1))
+
+
+def best_of(fill, headers, values, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        start = time.perf_counter()
+        fill(slide, headers, values)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-cell proxy fill vs bulk XML table writer")
+    parser.add_argument("--sizes", nargs="*", default=DEFAULT_SIZES, help="Table sizes as ROWSxCOLS")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size, the best one is reported")
+    args = parser.parse_args()
+
+    print(f"{'size':>10} {'cells':>8} {'proxy':>10} {'bulk':>10} {'speedup':>8}")
+    for size in args.sizes:
+        rows, cols = (int(n) for n in size.lower().split("x"))
+        headers, values = make_table(rows, cols)
+        proxy = best_of(proxy_fill, headers, values, args.repeat)
+        bulk = best_of(bulk_fill, headers, values, args.repeat)
+        print(f"{size:>10} {rows * cols:>8} {proxy * 1000:>8.1f}ms {bulk * 1000:>8.1f}ms {proxy / bulk:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
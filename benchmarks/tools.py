@@ -0,0 +1,285 @@
+"""
+Micro-benchmarks for every Presentationtools tool (slide builders, move/delete/duplicate) and insert_slide.
+
+Each tool runs against decks that already hold 10, 100 and 1000 slides, with tiny, medium and
+large inputs. For every case the suite reports the median build time (saving is excluded, it
+is measured as its own "save" case), the peak memory allocated during the call and the size of
+the saved deck. Caches (slides, rendered charts, images) are cleared before every call so runs
+measure cold builds; --warm keeps them.
+
+Results can be stored as a baseline and later runs compared against it; any case slower than
+the baseline by more than the threshold makes the run exit with status 1.
+
+Usage (from the repository root):
+    python -m benchmarks.tools --save-baseline benchmarks/baseline_tools.json
+    python -m benchmarks.tools --baseline benchmarks/baseline_tools.json --threshold 0.25
+    python -m benchmarks.tools --tools add_table_slide add_bar_chart --decks 10 100 --sizes tiny large
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from chart_render import RENDER_CACHE
+from image_pipeline import IMAGE_PIPELINE
+from session import PresentationSession
+from slide_cache import SLIDE_CACHE
+from tools import Presentationtools, SLIDE_TOOLS
+
+DECK_SIZES = [10, 100, 1000]
+INPUT_SIZES = {"tiny": 3, "medium": 30, "large": 300}
+
+
+def _numbers(n, scale=1.0):
+    return ", ".join(f"{(i * 37 % 101) * scale:.1f}" for i in range(n))
+
+
+def _labels(n, prefix="Item"):
+    return ", ".join(f"{prefix} {i}" for i in range(n))
+
+
+def _bullets(n):
+    return "; ".join(f"Point {i}: revenue grew in the region compared with last month" for i in range(n))
+
+
+class Inputs:
+    """
+    Tool arguments for an input size n, with the image and CSV files they need written to a work directory
+    """
+
+    def __init__(self, workdir):
+        self.workdir = workdir
+
+    def _image(self, n):
+        from PIL import Image
+
+        path = os.path.join(self.workdir, f"image_{n}.png")
+        if not os.path.exists(path):
+            side = min(4000, 20 * n + 40)
+            Image.radial_gradient("L").resize((side, side)).convert("RGB").save(path)
+        return path
+
+    def _csv(self, rows):
+        path = os.path.join(self.workdir, f"table_{rows}.csv")
+        if not os.path.exists(path):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("Region, Sales, Costs, Margin, Growth\n")
+                for i in range(rows):
+                    f.write(f"Region {i}, {i * 7 % 900}, {i * 3 % 500}, {i % 40}%, {i % 13}%\n")
+        return path
+
+    def args(self, tool, n):
+        series = "; ".join(f"S{k}: {_numbers(n, k + 1)}" for k in range(3))
+        if tool == "add_image_slide":
+            return {"image_path": self._image(n), "caption": "Figure " * n, "title": "Image"}
+        if tool == "add_text_with_image_slide":
+            return {"text_content": "\n\n".join(f"Paragraph {i} about the results." for i in range(n)),
+                    "image_path": self._image(n), "title": "Text and image"}
+        if tool == "add_bullet_slide":
+            return {"title": "Bullets", "content": _bullets(n)}
+        if tool == "add_two_content_bullet_slide":
+            return {"title": "Two columns", "left_content": _bullets(n), "right_content": _bullets(n)}
+        if tool == "add_table_slide":
+            rows = "; ".join(f"Region {i}, {i * 7}, {i * 3}, {i % 40}%, {i % 13}%" for i in range(n))
+            return {"table_data": f"Region, Sales, Costs, Margin, Growth; {rows}", "title": "Table"}
+        if tool == "add_table_from_source":
+            return {"source": self._csv(n * 10), "title": "Streamed table"}
+        if tool == "add_bar_chart":
+            return {"categories_str": _labels(n), "series_data_str": series, "title": "Bar"}
+        if tool == "add_line_chart":
+            m = n * 10
+            return {"categories_str": _labels(m), "series_data_str": "; ".join(f"S{k}: {_numbers(m, k + 1)}" for k in range(3)),
+                    "title": "Line"}
+        if tool == "add_pie_chart":
+            return {"categories_str": _labels(n), "values_str": _numbers(n), "right_content": _bullets(min(n, 8)),
+                    "title": "Pie", "plot_name": "Share"}
+        if tool == "add_area_chart":
+            return {"categories_str": _labels(n), "values_str": _numbers(n), "title": "Area", "plot_name": "Area"}
+        if tool == "add_scatter_chart":
+            m = n * 10
+            return {"input_x": f"X; {_numbers(m)}", "input_y": f"Y; {_numbers(m, 2)}", "title": "Scatter", "plot_title": "XY"}
+        if tool == "add_waterfall_chart":
+            values = ", ".join(str(v) for v in [1000] + [(-1) ** i * (i * 13 % 97) for i in range(1, n)])
+            return {"categories_str": _labels(n), "values_str": values, "title": "Waterfall"}
+        if tool == "add_title_slide":
+            return {"title": "Quarterly Review " * max(1, n // 3)}
+        raise ValueError(f"No inputs for {tool}")
+
+
+def build_deck(path, slides):
+    """
+    Deck of `slides` slides mixing bullets, tables and charts, used as the existing deck
+    """
+    session = PresentationSession(save_path=path)
+    tools = Presentationtools(session=session)
+    with tools.batch():
+        for i in range(slides):
+            kind = i % 3
+            if kind == 0:
+                tools.add_bullet_slide(f"Slide {i}", _bullets(4))
+            elif kind == 1:
+                tools.add_table_slide(f"A, B, C; {i}, 2, 3; 4, 5, 6", f"Slide {i}")
+            else:
+                tools.add_bar_chart("Q1, Q2, Q3", f"Sales: {i}, 2, 3", f"Slide {i}")
+    return path
+
+
+@contextlib.contextmanager
+def deferred_save(session):
+    """
+    Run tool calls without writing the deck; save cost is measured separately
+    """
+    with session.lock:
+        session.batch_depth += 1
+        try:
+            yield
+        finally:
+            session.batch_depth -= 1
+            session.dirty = False
+
+
+def undo_new_slides(prs, before):
+    """
+    Remove the slides added since `before` (a set of slide relationship ids) from the deck
+    """
+    sld_ids = prs.slides._sldIdLst
+    for sld_id in list(sld_ids):
+        if sld_id.rId not in before:
+            sld_ids.remove(sld_id)
+            prs.part.drop_rel(sld_id.rId)
+
+
+def clear_caches():
+    SLIDE_CACHE.clear()
+    RENDER_CACHE.clear()
+    IMAGE_PIPELINE.cache.clear()
+
+
+def measure(tools, call, repeat, warm=False):
+    """
+    Median time, peak traced allocation and saved size of a call on the session's deck, including
+    applying the slide order; added slides are removed after every run. Caches are cleared before
+    each run unless warm is set.
+    """
+    prs = tools.prs
+    prs_order = tools.session.slide_order
+    times = []
+    for _ in range(repeat):
+        before = {sld_id.rId for sld_id in prs.slides._sldIdLst}
+        if not warm:
+            clear_caches()
+        with deferred_save(tools.session):
+            start = time.perf_counter()
+            call()
+            prs_order.apply(prs)
+            times.append(time.perf_counter() - start)
+        undo_new_slides(prs, before)
+
+    before = {sld_id.rId for sld_id in prs.slides._sldIdLst}
+    if not warm:
+        clear_caches()
+    with deferred_save(tools.session):
+        tracemalloc.start()
+        call()
+        prs_order.apply(prs)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    undo_new_slides(prs, before)
+    return {"time": statistics.median(times), "peak_alloc": peak, "output_size": buffer.tell()}
+
+
+def run_suite(tool_names, deck_sizes, input_sizes, repeat, workdir, warm=False, verbose=False):
+    inputs = Inputs(workdir)
+    results = {}
+    quiet = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    for slides in deck_sizes:
+        deck_path = os.path.join(workdir, f"deck_{slides}.pptx")
+        with contextlib.redirect_stdout(io.StringIO()):
+            build_deck(deck_path, slides)
+        session = PresentationSession(input_path=deck_path, save_path=os.path.join(workdir, f"out_{slides}.pptx"))
+        tools = Presentationtools(session=session)
+
+        cases = [(tool, size, lambda tool=tool, args=inputs.args(tool, n): getattr(tools, tool)(**args))
+                 for tool in tool_names for size, n in input_sizes.items()]
+        cases.append(("insert_slide", "-", lambda: tools.insert_slide(tools.prs, 5, position=slides // 2)))
+        cases.append(("move_slide", "-", lambda: tools.move_slide(0, slides - 1)))
+        cases.append(("duplicate_slide", "-", lambda: tools.duplicate_slide(slides // 2)))
+        cases.append(("save", "-", lambda: session.write()))
+        # Deleted slides cannot be restored, so this runs last and shrinks the deck by `repeat` + 1 slides
+        cases.append(("delete_slide", "-", lambda: tools.delete_slide(len(tools.prs.slides) - 1)))
+
+        for tool, size, call in cases:
+            with quiet:
+                result = measure(tools, call, repeat, warm)
+            key = f"{tool}[{size}]@{slides}"
+            results[key] = result
+            print(f"{key:<45} {result['time'] * 1000:>10.2f} ms {result['peak_alloc'] / 1024:>10.0f} KiB "
+                  f"{result['output_size'] / 1024:>10.0f} KiB")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Cases slower than their baseline time by more than threshold (a fraction)
+    """
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None or base["time"] <= 0:
+            continue
+        ratio = result["time"] / base["time"]
+        if ratio > 1 + threshold:
+            regressions.append((key, base["time"], result["time"], ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for the Presentationtools slide builders")
+    parser.add_argument("--tools", nargs="*", default=list(SLIDE_TOOLS), help="Tools to benchmark")
+    parser.add_argument("--decks", nargs="*", type=int, default=DECK_SIZES, help="Slides in the existing deck")
+    parser.add_argument("--sizes", nargs="*", default=list(INPUT_SIZES), choices=list(INPUT_SIZES), help="Input sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case, the median is reported")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    parser.add_argument("--save-baseline", help="Store the results as a baseline JSON file")
+    parser.add_argument("--baseline", help="Compare against this baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown against the baseline (0.25 = 25%%)")
+    parser.add_argument("--warm", action="store_true", help="Keep the slide, chart and image caches between runs")
+    parser.add_argument("--verbose", action="store_true", help="Show the tool output")
+    args = parser.parse_args()
+
+    unknown = [tool for tool in args.tools if tool not in SLIDE_TOOLS]
+    if unknown:
+        parser.error(f"unknown tools: {', '.join(unknown)}")
+
+    print(f"{'case':<45} {'time':>13} {'peak alloc':>14} {'output':>14}")
+    with tempfile.TemporaryDirectory() as workdir:
+        results = run_suite(args.tools, args.decks, {size: INPUT_SIZES[size] for size in args.sizes},
+                            args.repeat, workdir, args.warm, args.verbose)
+
+    for path in (args.json, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} cases regressed by more than {args.threshold:.0%}:")
+            for key, base, now, ratio in regressions:
+                print(f"  {key:<45} {base * 1000:.2f} ms -> {now * 1000:.2f} ms ({ratio:.2f}x)")
+            sys.exit(1)
+        print(f"\nNo regressions above {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+Chart data for the category and XY chart tools.
+
+Series can be given as the string format the LLM tools use ("Sales: 1, 2, 3; Costs: 4, 5, 6",
+or "1, 2, 3" for a single series) or, from Python, as a NumPy array (one row per series),
+a dict of columns, a pandas DataFrame/Series, a pyarrow Table/Array, or the path of a
+CSV/TSV/Parquet file whose first column holds the categories.
+
+Values are converted to one float array per chart and validated in a vectorized way before
+anything is added to the slide.
+"""
+import os
+import numpy as np
+from pptx.chart.data import CategoryChartData, XyChartData
+from table_source import open_table_source
+
+TABLE_EXTENSIONS = (".csv", ".tsv", ".txt", ".parquet", ".pq")
+
+
+class ChartDataError(ValueError):
+    """
+    Raised when chart data cannot be parsed or has the wrong shape; lists every problem found
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__("Invalid chart data:\n" + "\n".join(f"  - {error}" for error in errors))
+
+
+class CategoryData:
+    """
+    Categories, series names and a (series x categories) float array of values
+    """
+
+    def __init__(self, categories, names, values):
+        self.categories = categories
+        self.names = names
+        self.values = values
+
+    def __len__(self):
+        return len(self.categories)
+
+    def take(self, indices):
+        """
+        CategoryData with only the categories at the given indices
+        """
+        return CategoryData([self.categories[i] for i in indices.tolist()], self.names, self.values[:, indices])
+
+    def to_chart_data(self, chart_data_cls=CategoryChartData):
+        """
+        Build python-pptx chart data; each series is converted to a Python list exactly once
+        """
+        chart_data = chart_data_cls()
+        chart_data.categories = self.categories
+        for name, row in zip(self.names, self.values):
+            chart_data.add_series(name, row.tolist())
+        return chart_data
+
+
+def is_table_path(data):
+    return isinstance(data, str) and data.strip().lower().endswith(TABLE_EXTENSIONS) \
+        and ":" not in os.path.basename(data)
+
+
+def load_category_data(categories, series, name="Series 1"):
+    """
+    Parse and validate category chart data.
+    Args:
+        categories: Comma separated string or sequence of categories. May be None when the
+                    series come from a file, Arrow table or DataFrame that carries them
+        series: Series in any of the supported formats (see module docstring)
+        name: Name used for a single unnamed series
+    Returns:
+        CategoryData
+    Raises:
+        ChartDataError: listing all problems found
+    """
+    file_categories = None
+    if is_table_path(series):
+        file_categories, names, values = _read_table(series)
+    elif isinstance(series, str):
+        names, values = _parse_series_str(series, name)
+    elif hasattr(series, "column_names"):  # pyarrow Table
+        columns = list(series.column_names)
+        if categories is None:
+            file_categories = [str(value) for value in series.column(0).to_pylist()]
+            columns = columns[1:]
+        names = columns
+        values = _stack([series.column(column).to_numpy() for column in columns], names)
+    elif hasattr(series, "columns") and hasattr(series, "to_numpy"):  # pandas DataFrame
+        if categories is None:
+            file_categories = [str(value) for value in series.index]
+        names = [str(column) for column in series.columns]
+        values = _stack([series[column].to_numpy() for column in series.columns], names)
+    elif isinstance(series, dict):
+        names = [str(key) for key in series]
+        values = _stack([_to_array(column) for column in series.values()], names)
+    else:
+        values = _to_array(series)
+        if values.ndim == 1:
+            values = values[np.newaxis, :]
+        names = [getattr(series, "name", None) or name] if len(values) == 1 \
+            else [f"Series {i + 1}" for i in range(len(values))]
+
+    if categories is None:
+        if file_categories is None:
+            raise ChartDataError(["categories are required for this kind of series data"])
+        categories = file_categories
+    elif isinstance(categories, str):
+        categories = [c.strip() for c in categories.split(",")]
+    else:
+        categories = [str(c) for c in categories]
+
+    data = CategoryData(categories, [str(n) for n in names], values)
+    validate(data)
+    return data
+
+
+def load_values(data, name="values"):
+    """
+    1-D float array from a comma separated string or any array-like, validated for NaN/inf
+    """
+    if isinstance(data, str):
+        values = _parse_numbers(data.split(","), name)
+    else:
+        values = _to_array(data)
+    if values.ndim != 1:
+        raise ChartDataError([f"{name} must be one-dimensional, got shape {values.shape}"])
+    bad = np.count_nonzero(~np.isfinite(values))
+    if bad:
+        raise ChartDataError([f"{name} has {bad} missing or non-finite values"])
+    return values
+
+
+def load_axis(data, default_label):
+    """
+    Label and values of a scatter axis given as "Label; 1, 2, 3", "1, 2, 3" or any array-like
+    """
+    label = default_label
+    if isinstance(data, str) and ";" in data:
+        label, data = data.split(";")
+    return label.strip(), load_values(data, label.strip())
+
+
+def xy_chart_data(name, x_values, y_values):
+    """
+    XyChartData with one series from two equally long arrays
+    """
+    chart_data = XyChartData()
+    series = chart_data.add_series(name)
+    for x, y in zip(x_values.tolist(), y_values.tolist()):
+        series.add_data_point(x, y)
+    return chart_data
+
+
+def validate(data):
+    """
+    Check the shape of the values against the categories and look for NaN/inf in one pass
+    Raises:
+        ChartDataError: listing all problems found
+    """
+    errors = []
+    values = data.values
+    if values.ndim != 2 or values.shape[0] != len(data.names):
+        errors.append(f"expected one row of values per series, got shape {values.shape}")
+    elif values.shape[1] != len(data.categories):
+        errors.append(f"{len(data.categories)} categories but each series has {values.shape[1]} values")
+    if values.size == 0:
+        errors.append("no values")
+    if not errors:
+        bad = np.count_nonzero(~np.isfinite(values), axis=1)
+        for name, count in zip(data.names, bad.tolist()):
+            if count:
+                errors.append(f"series {name!r} has {count} missing or non-finite values")
+    if errors:
+        raise ChartDataError(errors)
+
+
+def _parse_series_str(text, name):
+    entries = [entry for entry in text.split(";") if entry.strip()]
+    if len(entries) == 1 and ":" not in entries[0]:
+        return [name], _parse_numbers(entries[0].split(","), name)[np.newaxis, :]
+
+    names, columns, errors = [], [], []
+    for entry in entries:
+        series_name, sep, series_values = entry.rpartition(":")
+        if not sep:
+            errors.append(f"series {entry.strip()[:30]!r} is missing a 'Name:' prefix")
+            continue
+        names.append(series_name.strip())
+        try:
+            columns.append(_parse_numbers(series_values.split(","), series_name.strip()))
+        except ChartDataError as e:
+            errors.extend(e.errors)
+    if errors:
+        raise ChartDataError(errors)
+    return names, _stack(columns, names)
+
+
+def _parse_numbers(strings, name):
+    try:
+        return np.asarray(strings, dtype=np.float64)
+    except ValueError as e:
+        raise ChartDataError([f"series {name!r}: {e}"]) from None
+
+
+def _read_table(path):
+    headers, rows = open_table_source(path)
+    table = np.array(list(rows), dtype=np.str_)
+    if table.ndim != 2 or table.shape[1] < 2:
+        raise ChartDataError([f"{path}: expected a category column and at least one series column"])
+    names = headers[1:]
+    values = _stack([_parse_numbers(table[:, i + 1], names[i]) for i in range(len(names))], names)
+    return table[:, 0].tolist(), names, values
+
+
+def _to_array(column):
+    if hasattr(column, "to_numpy") and not isinstance(column, np.ndarray):
+        column = column.to_numpy()  # pandas Series, pyarrow Array/ChunkedArray
+    try:
+        return np.asarray(column, dtype=np.float64)
+    except (TypeError, ValueError) as e:
+        raise ChartDataError([str(e)]) from None
+
+
+def _stack(columns, names):
+    if not columns:
+        raise ChartDataError(["no series"])
+    lengths = {len(column) for column in columns}
+    if len(lengths) > 1:
+        detail = ", ".join(f"{name}: {len(column)}" for name, column in zip(names, columns))
+        raise ChartDataError([f"series have different lengths ({detail})"])
+    return np.vstack([np.asarray(column, dtype=np.float64) for column in columns])
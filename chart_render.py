@@ -0,0 +1,115 @@
+import hashlib
+import io
+import json
+from cache import LRUBytesCache
+
+DEFAULT_WATERFALL_STYLE = {
+    "title": "Waterfall Chart",
+    "ylabel": "Values",
+    "colors": {"total": "green", "increase": "steelblue", "decrease": "darkorange"},
+    "dpi": 100,
+}
+
+
+RENDER_CACHE = LRUBytesCache()
+
+
+def waterfall_layout(values, totals):
+    """
+    Compute where each waterfall bar starts and its kind.
+    Total bars start at 0 and reset the running sum, other bars start at the running sum.
+
+    Returns:
+        (bottoms, kinds) where kinds are "total", "increase" or "decrease"; bar heights are the values
+    """
+    cumulative = 0  # Start from baseline (0)
+    bottoms = []
+    kinds = []
+    for value, total in zip(values, totals):
+        if total is not None:  # Total bar resets to 0
+            bottoms.append(0)
+            kinds.append("total")
+            cumulative = total
+        else:  # Incremental values
+            bottoms.append(cumulative)
+            kinds.append("increase" if value > 0 else "decrease")
+            cumulative += value
+    return bottoms, kinds
+
+
+def waterfall_label(value):
+    return f"{value:+,.0f}" if float(value).is_integer() else f"{value:+,}"
+
+
+def render_waterfall_png(categories, values, totals, size=(16, 6), style=None, cache=RENDER_CACHE):
+    """
+    Render a waterfall chart to PNG bytes.
+    Results are cached by content, so unchanged data is never rendered twice.
+
+    Args:
+        categories: Category names
+        values: Incremental values
+        totals: Total values, None for incremental bars
+        size: Figure size in inches
+        style: Overrides for DEFAULT_WATERFALL_STYLE
+        cache: LRUBytesCache to use, or None to always render
+    """
+    style = {**DEFAULT_WATERFALL_STYLE, **(style or {})}
+    key = hashlib.sha256(
+        json.dumps(["waterfall", list(categories), list(values), list(totals), list(size), style], sort_keys=True).encode()
+    ).hexdigest()
+
+    if cache is not None:
+        data = cache.get(key)
+        if data is not None:
+            return data
+
+    data = _draw_waterfall(categories, values, totals, size, style)
+    if cache is not None:
+        cache.put(key, data)
+    return data
+
+
+def _draw_waterfall(categories, values, totals, size, style):
+    # Figure + Agg canvas instead of pyplot: no global state, so rendering is safe from worker threads
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.patches import Rectangle
+
+    labels = [waterfall_label(v) for v in values]  # Add "+" or "-" to the value labels
+    bar_positions, kinds = waterfall_layout(values, totals)
+    kind_colors = style["colors"]
+    colors = [kind_colors[kind] for kind in kinds]
+
+    fig = Figure(figsize=size, dpi=style["dpi"])
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    bars = ax.bar(categories, values, bottom=bar_positions, color=colors)
+
+    # Add labels to each bar
+    for bar, label in zip(bars, labels):
+        height = bar.get_height()
+        if height > 0:
+            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_y() + height - 10, label, ha="center", va="bottom", fontsize=10)
+        else:
+            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_y() + height - 10, label, ha="center", va="top", fontsize=10)
+
+    # Add title and legend
+    ax.set_title(style["title"], fontsize=14)
+    ax.set_ylabel(style["ylabel"], fontsize=12)
+    ax.legend(
+        handles=[
+            Rectangle((0, 0), 1, 1, color=kind_colors["total"], label="Total"),
+            Rectangle((0, 0), 1, 1, color=kind_colors["increase"], label="Increase"),
+            Rectangle((0, 0), 1, 1, color=kind_colors["decrease"], label="Decrease"),
+        ],
+        loc="upper right",
+    )
+
+    # Add grid
+    ax.grid(axis="y", linestyle="--", alpha=0.7)
+
+    fig.tight_layout()
+    buffer = io.BytesIO()
+    canvas.print_png(buffer)
+    return buffer.getvalue()
@@ -0,0 +1,294 @@
+"""
+Inventory of .pptx decks (slide count, titles, layouts, charts, tables and pictures) without
+loading them with python-pptx.
+
+Slide XML is streamed from the zip with iterparse and summaries are cached in a small SQLite
+database keyed by path, mtime and size, so listing a folder of decks that have not changed
+only reads the database.
+
+Usage:
+    python deck_index.py input/ [more folders or decks...] [--json]
+"""
+import argparse
+import json
+import os
+import posixpath
+import sqlite3
+import threading
+import zipfile
+from lxml import etree
+
+DEFAULT_INDEX_PATH = os.path.join(".cache", "deck_index.sqlite")
+# Bump when the summary format changes so stale rows are rebuilt
+INDEX_VERSION = 1
+
+P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+SLIDE_LAYOUT_RELTYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
+CHART_URI = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+TITLE_TYPES = ("title", "ctrTitle")
+
+
+def _rels_name(part_name):
+    directory, file = posixpath.split(part_name)
+    return posixpath.join(directory, "_rels", f"{file}.rels")
+
+
+def _read_rels(archive, part_name):
+    """
+    {rId: (reltype, target part name)} of a part, targets resolved against the part's folder
+    """
+    try:
+        data = archive.read(_rels_name(part_name))
+    except KeyError:
+        return {}
+    rels = {}
+    for rel in etree.fromstring(data).iter(PKG_REL):
+        if rel.get("TargetMode") == "External":
+            continue
+        target = rel.get("Target")
+        if target.startswith("/"):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(posixpath.dirname(part_name), target))
+        rels[rel.get("Id")] = (rel.get("Type"), target)
+    return rels
+
+
+def _slide_parts(archive):
+    """
+    Part names of the slides in presentation order
+    """
+    rels = _read_rels(archive, "ppt/presentation.xml")
+    parts = []
+    with archive.open("ppt/presentation.xml") as f:
+        for _, element in etree.iterparse(f, tag=f"{P}sldId"):
+            rel = rels.get(element.get(f"{R}id"))
+            if rel is not None:
+                parts.append(rel[1])
+            element.clear()
+    return parts
+
+
+def _layout_name(archive, part_name):
+    with archive.open(part_name) as f:
+        for _, element in etree.iterparse(f, events=("start",), tag=f"{P}cSld"):
+            return element.get("name") or posixpath.basename(part_name)
+    return posixpath.basename(part_name)
+
+
+def _scan_slide(source):
+    """
+    Title, text of the first text shape, and chart/table/picture counts of one slide XML stream
+    """
+    title = None
+    first_text = None
+    charts = tables = pictures = 0
+    in_shape = False
+    is_title = False
+    texts = []
+    for event, element in etree.iterparse(source, events=("start", "end")):
+        tag = element.tag
+        if event == "start":
+            if tag == f"{P}sp":
+                in_shape, is_title, texts = True, False, []
+            continue
+        if tag == f"{P}ph" and in_shape:
+            is_title = element.get("type") in TITLE_TYPES
+        elif tag == f"{A}t" and in_shape:
+            texts.append(element.text or "")
+        elif tag == f"{A}p" and in_shape:
+            texts.append(" ")
+        elif tag == f"{P}sp":
+            text = " ".join("".join(texts).split())
+            if is_title and title is None:
+                title = text
+            elif text and first_text is None:
+                first_text = text
+            in_shape = False
+            element.clear()
+        elif tag == f"{A}graphicData":
+            if element.get("uri") == CHART_URI:
+                charts += 1
+        elif tag == f"{A}tbl":
+            tables += 1
+            element.clear()
+        elif tag == f"{P}pic":
+            pictures += 1
+            element.clear()
+    return {"title": title or first_text or "", "charts": charts, "tables": tables, "pictures": pictures}
+
+
+def index_deck(path):
+    """
+    Summary of a deck: its slides (title, layout, chart/table/picture counts) and totals
+    """
+    layouts = {}
+    slides = []
+    with zipfile.ZipFile(path) as archive:
+        for number, part_name in enumerate(_slide_parts(archive), start=1):
+            layout = None
+            for reltype, target in _read_rels(archive, part_name).values():
+                if reltype == SLIDE_LAYOUT_RELTYPE:
+                    if target not in layouts:
+                        layouts[target] = _layout_name(archive, target)
+                    layout = layouts[target]
+            with archive.open(part_name) as f:
+                slide = _scan_slide(f)
+            slides.append({"number": number, "layout": layout, **slide})
+
+    used_layouts = {}
+    for slide in slides:
+        if slide["layout"] is not None:
+            used_layouts[slide["layout"]] = used_layouts.get(slide["layout"], 0) + 1
+    return {
+        "path": path,
+        "name": os.path.basename(path),
+        "slide_count": len(slides),
+        "layouts": used_layouts,
+        "charts": sum(slide["charts"] for slide in slides),
+        "tables": sum(slide["tables"] for slide in slides),
+        "pictures": sum(slide["pictures"] for slide in slides),
+        "slides": slides,
+    }
+
+
+class DeckIndex:
+    """
+    Deck summaries cached in SQLite by absolute path, mtime and size
+    """
+
+    def __init__(self, db_path=DEFAULT_INDEX_PATH):
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = None
+
+    def _db(self):
+        if self._connection is None:
+            if self.db_path != ":memory:":
+                os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS decks ("
+                "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, version INTEGER, summary TEXT)"
+            )
+        return self._connection
+
+    def get(self, path):
+        """
+        Summary of a deck, indexed again only if the file changed since it was cached
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        with self._lock:
+            row = self._db().execute(
+                "SELECT summary FROM decks WHERE path = ? AND mtime_ns = ? AND size = ? AND version = ?",
+                (path, stat.st_mtime_ns, stat.st_size, INDEX_VERSION),
+            ).fetchone()
+            if row is not None:
+                self.hits += 1
+                return json.loads(row[0])
+            self.misses += 1
+
+        summary = index_deck(path)
+        with self._lock:
+            db = self._db()
+            db.execute(
+                "INSERT OR REPLACE INTO decks (path, mtime_ns, size, version, summary) VALUES (?, ?, ?, ?, ?)",
+                (path, stat.st_mtime_ns, stat.st_size, INDEX_VERSION, json.dumps(summary)),
+            )
+            db.commit()
+        return summary
+
+    def scan(self, folder):
+        """
+        Summaries of the .pptx files in a folder, sorted by name; unreadable files are skipped
+        """
+        summaries = []
+        for name in sorted(os.listdir(folder)):
+            if not name.endswith(".pptx") or name.startswith("~$"):
+                continue
+            try:
+                summaries.append(self.get(os.path.join(folder, name)))
+            except (OSError, zipfile.BadZipFile, KeyError, etree.XMLSyntaxError) as e:
+                print(f"Skipping {name}: {e}")
+        return summaries
+
+    def prune(self):
+        """
+        Drop cached summaries of decks that no longer exist
+        Returns:
+            Number of rows removed
+        """
+        with self._lock:
+            db = self._db()
+            missing = [(path,) for (path,) in db.execute("SELECT path FROM decks") if not os.path.exists(path)]
+            db.executemany("DELETE FROM decks WHERE path = ?", missing)
+            db.commit()
+            return len(missing)
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+def describe(summary, max_slides=50):
+    """
+    Text description of a deck for the agent prompt: one line per slide
+    """
+    lines = [f"{summary['name']}: {summary['slide_count']} slides"]
+    for slide in summary["slides"][:max_slides]:
+        contents = [f"{count} {kind}" if count > 1 else kind.rstrip("s")
+                    for kind in ("charts", "tables", "pictures") if (count := slide[kind])]
+        details = ", ".join(filter(None, [slide["layout"], *contents]))
+        lines.append(f"- index {slide['number'] - 1}: {slide['title'] or '(no title)'} [{details}]")
+    if summary["slide_count"] > max_slides:
+        lines.append(f"- ... {summary['slide_count'] - max_slides} more slides")
+    return "\n".join(lines)
+
+
+def summary_line(summary):
+    """
+    One-line summary of a deck, used when listing decks
+    """
+    parts = [f"{summary['slide_count']} slides"]
+    for kind in ("charts", "tables", "pictures"):
+        if summary[kind]:
+            parts.append(f"{summary[kind]} {kind}")
+    titles = [slide["title"] for slide in summary["slides"] if slide["title"]][:3]
+    if titles:
+        parts.append("; ".join(titles) + ("; ..." if summary["slide_count"] > 3 else ""))
+    return f"{summary['name']} ({', '.join(parts)})"
+
+
+DECK_INDEX = DeckIndex()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List .pptx decks with their slide titles, layouts, charts and tables")
+    parser.add_argument("paths", nargs="+", help="Folders or .pptx files")
+    parser.add_argument("--json", action="store_true", help="Print the summaries as JSON")
+    parser.add_argument("--db", default=DEFAULT_INDEX_PATH, help="Index database")
+    args = parser.parse_args()
+
+    index = DeckIndex(args.db)
+    summaries = []
+    for path in args.paths:
+        summaries.extend(index.scan(path) if os.path.isdir(path) else [index.get(path)])
+
+    if args.json:
+        print(json.dumps(summaries, indent=2))
+    else:
+        for summary in summaries:
+            print(describe(summary))
+            print()
+    stats = index.stats()
+    print(f"{len(summaries)} decks, {stats['hits']} from the index, {stats['misses']} indexed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Build decks from a declarative spec without calling an LLM.
+
+A spec is a JSON or YAML document:
+
+    input: input/presentation.pptx        # optional template or deck to extend
+    output: output/month_end.pptx         # optional, defaults to output/presentation_test.pptx
+    config: {title_font_size: 36}         # optional overrides for session.DEFAULT_CONFIG
+    slides:
+      - tool: add_title_slide
+        title: November 2024 Financial Review
+      - tool: add_bar_chart
+        args: {categories_str: "Q1, Q2", series_data_str: "Sales: 5, 7", title: Sales}
+        insert_at: 1
+
+Each slide names one of the Presentationtools add_* methods, or move_slide / delete_slide /
+duplicate_slide to rearrange the deck; its arguments are given either flat next to `tool` or
+under `args`. A bare list is accepted as the list of slides.
+
+Usage:
+    python deck_spec.py specs/month_end_closing.yaml [more specs...] [--output out.pptx]
+"""
+import argparse
+import inspect
+import json
+import os
+import sys
+from chart_data import ChartDataError, load_axis, load_category_data
+from session import PresentationSession, DEFAULT_SAVE_PATH
+from tools import Presentationtools, SLIDE_TOOLS, DECK_TOOLS, parse_table_data, parse_waterfall_data
+import tracing
+
+IMAGE_ARGS = ("image_path",)
+
+
+class DeckSpecError(ValueError):
+    """
+    Raised when a spec is invalid; lists every problem found, not just the first one
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__("Invalid deck spec:\n" + "\n".join(f"  - {error}" for error in errors))
+
+
+def load_spec(path):
+    """
+    Read a spec from a .json, .yaml or .yml file
+    """
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            import yaml
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+def normalize_spec(spec):
+    """
+    Return (input_path, output_path, config, slides) with every slide as {"tool", "args", "insert_at"}
+    """
+    if isinstance(spec, list):
+        spec = {"slides": spec}
+    if not isinstance(spec, dict) or not isinstance(spec.get("slides"), list):
+        raise DeckSpecError(["spec must be a list of slides or a mapping with a 'slides' list"])
+
+    slides = []
+    for entry in spec["slides"]:
+        if not isinstance(entry, dict):
+            slides.append({"tool": None, "args": entry, "insert_at": None})
+            continue
+        entry = dict(entry)
+        tool = entry.pop("tool", None)
+        args = dict(entry.pop("args", {}) or {})
+        insert_at = entry.pop("insert_at", args.pop("insert_at", None))
+        args.update(entry)
+        slides.append({"tool": tool, "args": args, "insert_at": insert_at})
+
+    return spec.get("input"), spec.get("output") or DEFAULT_SAVE_PATH, spec.get("config") or {}, slides
+
+
+def _call_args(slide):
+    """
+    Keyword arguments of a slide's tool call; insert_at is only passed when given
+    """
+    if slide["insert_at"] is None:
+        return slide["args"]
+    return {**slide["args"], "insert_at": slide["insert_at"]}
+
+
+def _data_errors(tool, args):
+    """
+    Problems in the chart or table data of a slide, found with the parsers its tool uses
+    """
+    try:
+        if tool in ("add_bar_chart", "add_line_chart"):
+            load_category_data(args["categories_str"], args["series_data_str"])
+        elif tool in ("add_pie_chart", "add_area_chart"):
+            load_category_data(args["categories_str"], args["values_str"], name=args["plot_name"])
+        elif tool == "add_scatter_chart":
+            load_axis(args["input_x"], "X-Axis")
+            load_axis(args["input_y"], "Y-Axis")
+        elif tool == "add_waterfall_chart":
+            parse_waterfall_data(args["categories_str"], args["values_str"], args.get("totals_str"))
+        elif tool == "add_table_slide":
+            headers, values = parse_table_data(args["table_data"])
+            return [f"table row {row} has {len(cells)} cells but there are {len(headers)} headers"
+                    for row, cells in enumerate(values, start=1) if len(cells) > len(headers)]
+    except ChartDataError as e:
+        return e.errors
+    except (ValueError, TypeError, AttributeError, OSError) as e:
+        return [str(e)]
+    return []
+
+
+def validate_slides(slides):
+    """
+    Check every slide against the signature of its tool, and its chart or table data against the
+    parsers of the tool, before anything is built.
+    Raises:
+        DeckSpecError: listing all problems found
+    """
+    errors = []
+    for i, slide in enumerate(slides, start=1):
+        tool = slide["tool"]
+        if tool not in SLIDE_TOOLS + DECK_TOOLS:
+            errors.append(f"slide {i}: unknown tool {tool!r}, expected one of {', '.join(SLIDE_TOOLS + DECK_TOOLS)}")
+            continue
+
+        signature = inspect.signature(getattr(Presentationtools, tool))
+        try:
+            signature.bind(None, **_call_args(slide))
+        except TypeError as e:
+            errors.append(f"slide {i} ({tool}): {e}")
+        else:
+            errors.extend(f"slide {i} ({tool}): {error}" for error in _data_errors(tool, slide["args"]))
+
+        if slide["insert_at"] is not None:
+            try:
+                int(slide["insert_at"])
+            except (TypeError, ValueError):
+                errors.append(f"slide {i} ({tool}): insert_at must be an integer, got {slide['insert_at']!r}")
+
+        for name in IMAGE_ARGS:
+            path = slide["args"].get(name)
+            if path is not None and not os.path.isfile(path):
+                errors.append(f"slide {i} ({tool}): {name} {path!r} does not exist")
+
+    if errors:
+        raise DeckSpecError(errors)
+
+
+def build_deck(spec, session=None, output_path=None):
+    """
+    Validate a spec and render all of its slides in one pass with a single save.
+    Args:
+        spec: Spec mapping or list of slides (see module docstring)
+        session: Session to build into; by default one is created from the spec
+        output_path: Overrides the output path of the spec
+    Returns:
+        Path the deck was saved to
+    """
+    input_path, spec_output, config, slides = normalize_spec(spec)
+    validate_slides(slides)
+
+    if session is None:
+        if input_path is not None and not os.path.isfile(input_path):
+            raise DeckSpecError([f"input {input_path!r} does not exist"])
+        session = PresentationSession(input_path=input_path, save_path=output_path or spec_output, config=config)
+    elif output_path:
+        session.save_path = output_path
+
+    # The deck is written once at the end of the batch, and not at all if a slide fails
+    tools = Presentationtools(session=session)
+    with tools.batch():
+        for i, slide in enumerate(slides, start=1):
+            with tracing.span(f"tool.{slide['tool']}", "tool") as sp:
+                if sp:
+                    sp.set(tool=slide["tool"], arg_sizes=tracing.arg_sizes(slide["args"]))
+                result = getattr(tools, slide["tool"])(**_call_args(slide))
+            # Some tools report bad input in their result instead of raising
+            if isinstance(result, str) and result.startswith("Error:"):
+                raise DeckSpecError([f"slide {i} ({slide['tool']}): {result[len('Error:'):].strip()}"])
+    return session.save_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build decks from JSON/YAML slide specs without an LLM")
+    parser.add_argument("specs", nargs="+", help="Spec files")
+    parser.add_argument("--output", help="Output path (only with a single spec)")
+    args = parser.parse_args()
+    if args.output and len(args.specs) > 1:
+        parser.error("--output can only be used with a single spec")
+
+    failed = False
+    for path in args.specs:
+        try:
+            save_path = build_deck(load_spec(path), output_path=args.output)
+        except (DeckSpecError, ChartDataError) as e:
+            print(f"{path}: {e}", file=sys.stderr)
+            failed = True
+            continue
+        print(f"{path} -> {save_path}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import numpy as np
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Indices of the points kept by Largest-Triangle-Three-Buckets downsampling.
+
+    The first and last points are always kept; every bucket in between keeps the point that
+    forms the largest triangle with the previously kept point and the average of the next
+    bucket, which preserves peaks and the overall shape of the curve.
+    Args:
+        x: Sorted x values
+        y: y values
+        n_out: Number of points to keep
+    Returns:
+        Sorted integer index array
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 buckets over the interior points [1, n - 1)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    sizes = np.diff(edges)
+    mean_x = np.add.reduceat(x[:-1], edges[:-1]) / sizes
+    mean_y = np.add.reduceat(y[:-1], edges[:-1]) / sizes
+
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 1 < n_out - 2:
+            next_x, next_y = mean_x[i + 1], mean_y[i + 1]
+        else:
+            next_x, next_y = x[-1], y[-1]
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - next_x) * (y[start:end] - ay) - (ax - x[start:end]) * (next_y - ay))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def downsample_indices(x, ys, max_points):
+    """
+    Indices to keep so that several series sharing the same x fit in max_points.
+    Each series gets an equal share of the budget and the kept indices are merged. With more
+    series than the budget has room for (fewer than 3 points each), the upper envelope of all
+    series is sampled instead, so the result never exceeds max_points.
+    Args:
+        x: Sorted x values
+        ys: 2-D array, one row per series
+        max_points: Point budget for the chart
+    """
+    ys = np.atleast_2d(ys)
+    n = ys.shape[1]
+    if not max_points or n <= max_points:
+        return np.arange(n)
+    if max_points < 3:
+        return np.unique(np.linspace(0, n - 1, max_points).astype(np.intp))
+    per_series = max_points // len(ys)
+    if per_series < 3:
+        return lttb_indices(x, ys.max(axis=0), max_points)
+    return np.unique(np.concatenate([lttb_indices(x, y, per_series) for y in ys]))
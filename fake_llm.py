@@ -0,0 +1,130 @@
+import json
+import random
+import threading
+import time
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
+
+
+class ReplayChatModel:
+    """
+    Offline, deterministic stand-in for a tool-calling chat model.
+
+    Replays recorded tool calls keyed by the user query, so PresentationAgent and
+    TemplateWorkflow can run without provider keys. Pass an instance as the `llm` option:
+
+        agent = PresentationAgent(llm=ReplayChatModel.from_jsonl("benchmarks/recordings.jsonl", latency=0.8))
+    """
+
+    def __init__(self, recordings=None, latency=0.0, jitter=0.0, seed=0, strict=False):
+        """
+        Args:
+            recordings: Dict mapping a query to its list of tool calls ({"name": ..., "args": {...}})
+            latency: Synthetic latency in seconds added to every invoke
+            jitter: Maximum random extra latency in seconds (seeded, so runs are repeatable)
+            seed: Seed for the jitter
+            strict: Raise KeyError for unknown queries instead of answering with a bullet slide
+        """
+        self.recordings = dict(recordings or {})
+        self.latency = latency
+        self.jitter = jitter
+        self.strict = strict
+        self.model = "replay"
+        self.calls = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_jsonl(cls, path, **kwargs):
+        """
+        Load recordings from a JSONL file with one {"query": ..., "tool_calls": [...]} object per line.
+        """
+        recordings = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                recordings[record["query"]] = record["tool_calls"]
+        return cls(recordings, **kwargs)
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _delay(self):
+        with self._lock:
+            self.calls += 1
+            return self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def _tool_calls(self, query):
+        if query in self.recordings:
+            return self.recordings[query]
+        if self.strict:
+            raise KeyError(f"No recorded response for query: {query}")
+        return [{"name": "add_bullet_slide", "args": {"title": query[:60], "content": query}}]
+
+    def invoke(self, messages, **kwargs):
+        query = _last_query(messages)
+        delay = self._delay()
+        if delay:
+            time.sleep(delay)
+        tool_calls = self._tool_calls(query)
+
+        return AIMessage(
+            content="",
+            tool_calls=[
+                {"name": call["name"], "args": dict(call["args"]), "id": f"call_{i}"}
+                for i, call in enumerate(tool_calls)
+            ],
+        )
+
+    def stream(self, messages, **kwargs):
+        """
+        Yield the recorded tool calls as message chunks, each call's arguments split in two, with
+        the latency spread evenly over the calls like a provider streaming its answer.
+        """
+        query = _last_query(messages)
+        delay = self._delay()
+        tool_calls = self._tool_calls(query)
+        for i, call in enumerate(tool_calls):
+            if delay:
+                time.sleep(delay / len(tool_calls))
+            args = json.dumps(call["args"])
+            half = len(args) // 2
+            yield AIMessageChunk(content="", tool_call_chunks=[
+                {"name": call["name"], "args": args[:half], "id": f"call_{i}", "index": i}])
+            yield AIMessageChunk(content="", tool_call_chunks=[
+                {"name": None, "args": args[half:], "id": None, "index": i}])
+
+
+class RecordingChatModel:
+    """
+    Wraps a live chat model and appends every query and its tool calls to a JSONL file
+    that ReplayChatModel.from_jsonl can load.
+    """
+
+    def __init__(self, llm, path):
+        self.llm = llm
+        self.path = path
+        self._lock = threading.Lock()
+
+    def bind_tools(self, tools, **kwargs):
+        bound = RecordingChatModel(self.llm.bind_tools(tools, **kwargs), self.path)
+        bound._lock = self._lock
+        return bound
+
+    def invoke(self, messages, **kwargs):
+        response = self.llm.invoke(messages, **kwargs)
+        record = {
+            "query": _last_query(messages),
+            "tool_calls": [{"name": call["name"], "args": call["args"]} for call in response.tool_calls],
+        }
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        return response
+
+
+def _last_query(messages):
+    for message in reversed(messages):
+        if isinstance(message, HumanMessage):
+            return message.content
+    return ""
@@ -0,0 +1,108 @@
+import hashlib
+import io
+import os
+import threading
+from cache import LRUBytesCache
+
+
+class ImagePipeline:
+    """
+    Prepares images before they are embedded in a slide: resamples them to the picture box
+    at a target DPI, strips metadata and re-encodes as JPEG (photos) or PNG (transparency,
+    logos and other flat-colour images). Results are cached by file hash, mtime and target size.
+    """
+
+    def __init__(self, dpi=150, jpeg_quality=85, max_entries=64, max_bytes=128 * 1024 * 1024):
+        self.dpi = dpi
+        self.jpeg_quality = jpeg_quality
+        self.cache = LRUBytesCache(max_entries=max_entries, max_bytes=max_bytes)
+        self._hashes = {}
+        self._lock = threading.Lock()
+
+    def prepare(self, image_path, width_in, height_in, dpi=None):
+        """
+        Args:
+            image_path: Path to the source image
+            width_in: Width of the picture box in inches
+            height_in: Height of the picture box in inches
+            dpi: Overrides the pipeline DPI
+        Returns:
+            (image, original_size, embedded_size) where image is a path or file-like object for add_picture
+        """
+        dpi = dpi or self.dpi
+        stat = os.stat(image_path)
+        key = f"{self._file_hash(image_path, stat)}:{stat.st_mtime_ns}:{width_in}x{height_in}@{dpi}"
+
+        data = self.cache.get(key)
+        if data is None:
+            data = self._process(image_path, round(width_in * dpi), round(height_in * dpi))
+            if data is None:
+                # Not something Pillow can re-encode, embed the original
+                return image_path, stat.st_size, stat.st_size
+            self.cache.put(key, data)
+        return io.BytesIO(data), stat.st_size, len(data)
+
+    def _file_hash(self, image_path, stat):
+        path = os.path.abspath(image_path)
+        with self._lock:
+            cached = self._hashes.get(path)
+        if cached and cached[0] == (stat.st_mtime_ns, stat.st_size):
+            return cached[1]
+
+        digest = hashlib.sha256()
+        with open(image_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        file_hash = digest.hexdigest()
+        with self._lock:
+            self._hashes[path] = ((stat.st_mtime_ns, stat.st_size), file_hash)
+        return file_hash
+
+    def _process(self, image_path, max_width, max_height):
+        from PIL import Image, ImageOps, UnidentifiedImageError
+
+        try:
+            with Image.open(image_path) as img:
+                img.load()
+                source_format = img.format
+                # Apply EXIF orientation before the metadata is dropped
+                img = ImageOps.exif_transpose(img)
+        except (UnidentifiedImageError, OSError):
+            return None
+
+        # add_picture stretches the image to the box, so pixels beyond it are never shown
+        target = (min(img.width, max_width), min(img.height, max_height))
+        resized = target != img.size
+        if resized:
+            img = img.resize(target, Image.LANCZOS)
+
+        buffer = io.BytesIO()
+        if self._is_flat(img):
+            if img.mode not in ("RGB", "RGBA", "L", "LA", "P"):
+                img = img.convert("RGBA")
+            img.save(buffer, format="PNG", optimize=True)
+            out_format = "PNG"
+        else:
+            img.convert("RGB").save(buffer, format="JPEG", quality=self.jpeg_quality, optimize=True, progressive=True)
+            out_format = "JPEG"
+        data = buffer.getvalue()
+
+        if not resized and out_format == source_format and len(data) >= os.path.getsize(image_path):
+            # Re-encoding did not help, keep the original bytes
+            with open(image_path, "rb") as f:
+                return f.read()
+        return data
+
+    @staticmethod
+    def _is_flat(img):
+        """
+        PNG for images with transparency or few colours (logos, diagrams), JPEG for photos.
+        """
+        if img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info:
+            return True
+        if img.mode in ("1", "P"):
+            return True
+        return img.getcolors(maxcolors=256) is not None
+
+
+IMAGE_PIPELINE = ImagePipeline()
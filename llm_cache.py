@@ -0,0 +1,180 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "llm")
+# The directory is walked again after this many puts, to pick up entries written by other processes
+RESCAN_EVERY = 256
+# Eviction trims the cache to this fraction of max_bytes so the next puts do not evict again right away
+EVICT_TO = 0.9
+
+
+class ResponseCache:
+    """
+    On-disk cache of chat model responses, one JSON file per request.
+
+    Entries are keyed by a hash of the messages, the schemas of the bound tools and the model
+    settings, so rebuilding an unchanged template answers from disk without calling the provider.
+    Entries older than `ttl` seconds are ignored and removed; when the cache grows beyond
+    `max_bytes` the least recently written entries are evicted. The total size is tracked in
+    memory, so the directory is only walked on the first put, when the cache is full and every
+    RESCAN_EVERY puts.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, ttl=7 * 24 * 3600, max_bytes=100 * 1024 * 1024):
+        """
+        Args:
+            directory: Cache directory
+            ttl: Seconds an entry stays valid, None to keep entries until evicted for size
+            max_bytes: Total size the cache directory is trimmed to
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.scans = 0
+        self._lock = threading.Lock()
+        self._size = None  # total bytes on disk, None until the directory has been walked
+        self._puts_since_scan = 0
+
+    @staticmethod
+    def key(messages, tool_schemas, model):
+        """
+        Hash identifying a request
+        Args:
+            messages: Messages sent to the model
+            tool_schemas: JSON schemas of the bound tools
+            model: Dict of model settings (provider, name, temperature)
+        """
+        payload = json.dumps({
+            "messages": [{"type": message.type, "content": message.content} for message in messages],
+            "tools": tool_schemas,
+            "model": model,
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key):
+        """
+        Cached response message for a key, or None
+        """
+        from langchain_core.messages import messages_from_dict
+
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        if self.ttl is not None and time.time() - entry["created"] > self.ttl:
+            size = _file_size(path)
+            try:
+                os.remove(path)
+            except OSError:
+                size = 0
+            with self._lock:
+                self.misses += 1
+                if self._size is not None:
+                    self._size -= size
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return messages_from_dict([entry["message"]])[0]
+
+    def put(self, key, message):
+        """
+        Store a response message and trim the cache to max_bytes
+        """
+        from langchain_core.messages import message_to_dict
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        replaced = _file_size(path)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"created": time.time(), "message": message_to_dict(message)}, f)
+        os.replace(tmp_path, path)
+        written = _file_size(path)
+
+        with self._lock:
+            self._puts_since_scan += 1
+            if self._size is not None:
+                self._size += written - replaced
+            if self._size is None or self._size > self.max_bytes or self._puts_since_scan >= RESCAN_EVERY:
+                self._evict()
+
+    def _evict(self):
+        """
+        Walk the directory to measure the cache and, when it is over max_bytes, remove the
+        oldest entries until it is under EVICT_TO of it. Called with the lock held.
+        """
+        self.scans += 1
+        self._puts_since_scan = 0
+        entries = []
+        total = 0
+        for root, _, files in os.walk(self.directory):
+            for file in files:
+                path = os.path.join(root, file)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+        if total > self.max_bytes:
+            for _, size, path in sorted(entries):
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                if total <= self.max_bytes * EVICT_TO:
+                    break
+        self._size = total
+
+    def clear(self):
+        with self._lock:
+            for root, _, files in os.walk(self.directory):
+                for file in files:
+                    os.remove(os.path.join(root, file))
+            self._size = 0
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+def _file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def model_settings(llm):
+    """
+    The settings of a chat model that change its answers, used as part of the cache key
+    """
+    return {
+        "class": type(llm).__name__,
+        "model": getattr(llm, "model", None) or getattr(llm, "model_name", None),
+        "temperature": getattr(llm, "temperature", None),
+    }
+
+
+def tool_schemas(tools):
+    """
+    OpenAI-style JSON schemas of LangChain tools, in a stable order
+    """
+    from langchain_core.utils.function_calling import convert_to_openai_tool
+
+    return sorted((convert_to_openai_tool(tool) for tool in tools), key=lambda schema: schema["function"]["name"])
@@ -0,0 +1,178 @@
+"""
+Incremental .pptx writer.
+
+python-pptx re-serializes and re-deflates every part on each save. This writer serializes the
+parts, compares each one by CRC-32 and size against the archive it wrote last (or the input
+template), and copies the members that did not change as raw compressed bytes. Only new or
+modified parts are compressed, so the cost of a save follows the size of the change rather
+than the size of the deck.
+"""
+import contextlib
+import os
+import struct
+import threading
+import time
+import zipfile
+import zlib
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+
+# Members that are already compressed are stored as they are
+STORED_EXTENSIONS = (".jpeg", ".jpg", ".png", ".gif", ".mp4", ".m4a", ".mp3", ".wmv", ".xlsx", ".zip")
+
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_CENTRAL_HEADER = struct.Struct("<4s6H3L5H2L")
+_END_RECORD = struct.Struct("<4s4H2LH")
+_ZIP32_LIMIT = 0xFFFFFFFF
+
+
+class _MemberRef:
+    """
+    Location of a member's compressed data inside an archive on disk
+    """
+
+    __slots__ = ("path", "offset", "method", "crc", "compress_size", "file_size")
+
+    def __init__(self, path, offset, method, crc, compress_size, file_size):
+        self.path = path
+        self.offset = offset
+        self.method = method
+        self.crc = crc
+        self.compress_size = compress_size
+        self.file_size = file_size
+
+
+def index_archive(path):
+    """
+    Map of member name to _MemberRef for every member of a zip file that can be copied raw
+    """
+    members = {}
+    with open(path, "rb") as f, zipfile.ZipFile(f) as archive:
+        for info in archive.infolist():
+            if info.flag_bits & 0x1 or info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                continue  # encrypted or compressed with a method we do not write
+            f.seek(info.header_offset)
+            header = f.read(_LOCAL_HEADER.size)
+            name_length, extra_length = struct.unpack("<HH", header[26:30])
+            offset = info.header_offset + _LOCAL_HEADER.size + name_length + extra_length
+            members[info.filename] = _MemberRef(path, offset, info.compress_type, info.CRC,
+                                                info.compress_size, info.file_size)
+    return members
+
+
+class IncrementalPackageWriter:
+    """
+    Saves one deck repeatedly, reusing the compressed members of the previous save.
+    Keep one writer per deck (a PresentationSession owns one).
+    """
+
+    def __init__(self, compresslevel=6):
+        self.compresslevel = compresslevel
+        self._lock = threading.Lock()
+        self._indexes = {}  # archive path -> (mtime_ns, size, members)
+        self.last_stats = None
+
+    def save(self, prs, path, template_path=None):
+        """
+        Write a Presentation to path.
+        Args:
+            prs: python-pptx Presentation
+            path: Output .pptx path
+            template_path: Archive the deck was loaded from, used as a source of unchanged members
+        Returns:
+            Dict with the number of members reused and compressed and the bytes written
+        """
+        package = prs.part.package
+        parts = tuple(package.iter_parts())
+        members = [(CONTENT_TYPES_URI.membername, serialize_part_xml(_ContentTypesItem.xml_for(parts))),
+                   (PACKAGE_URI.rels_uri.membername, package._rels.xml)]
+        for part in parts:
+            members.append((part.partname.membername, part.blob))
+            if part._rels:
+                members.append((part.partname.rels_uri.membername, part.rels.xml))
+
+        with self._lock:
+            sources = {}
+            for source_path in (template_path, path):
+                if source_path and os.path.isfile(source_path):
+                    sources.update(self._index(source_path))
+            stats = self._write(path, members, sources)
+            self.last_stats = stats
+            return stats
+
+    def _index(self, path):
+        stat = os.stat(path)
+        cached = self._indexes.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        try:
+            members = index_archive(path)
+        except (zipfile.BadZipFile, OSError, struct.error):
+            members = {}
+        self._indexes[path] = (stat.st_mtime_ns, stat.st_size, members)
+        return members
+
+    def _write(self, path, members, sources):
+        dos_time, dos_date = _dos_timestamp()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        entries = []
+        stats = {"reused": 0, "compressed": 0, "bytes_written": 0}
+        try:
+            with contextlib.ExitStack() as stack:
+                out = stack.enter_context(open(tmp_path, "wb"))
+                handles = {}
+                for name, blob in members:
+                    crc = zlib.crc32(blob)
+                    ref = sources.get(name)
+                    if ref is not None and ref.crc == crc and ref.file_size == len(blob):
+                        if ref.path not in handles:
+                            handles[ref.path] = stack.enter_context(open(ref.path, "rb"))
+                        handle = handles[ref.path]
+                        handle.seek(ref.offset)
+                        data, method = handle.read(ref.compress_size), ref.method
+                        stats["reused"] += 1
+                    else:
+                        data, method = self._compress(name, blob)
+                        stats["compressed"] += 1
+
+                    offset = out.tell()
+                    if offset > _ZIP32_LIMIT or len(blob) > _ZIP32_LIMIT:
+                        raise ValueError("deck too large for the incremental writer (ZIP64 is not supported)")
+                    encoded = name.encode("utf-8")
+                    flags = 0 if encoded.isascii() else 0x800
+                    out.write(_LOCAL_HEADER.pack(b"PK\x03\x04", 20, flags, method, dos_time, dos_date,
+                                                 crc, len(data), len(blob), len(encoded), 0))
+                    out.write(encoded)
+                    out.write(data)
+                    entries.append((encoded, flags, method, crc, len(data), len(blob), offset))
+
+                directory_offset = out.tell()
+                for encoded, flags, method, crc, compress_size, file_size, offset in entries:
+                    out.write(_CENTRAL_HEADER.pack(b"PK\x01\x02", 20, 20, flags, method, dos_time, dos_date,
+                                                   crc, compress_size, file_size, len(encoded), 0, 0, 0, 0,
+                                                   0o600 << 16, offset))
+                    out.write(encoded)
+                directory_size = out.tell() - directory_offset
+                out.write(_END_RECORD.pack(b"PK\x05\x06", 0, 0, len(entries), len(entries),
+                                           directory_size, directory_offset, 0))
+                stats["bytes_written"] = out.tell()
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return stats
+
+    def _compress(self, name, blob):
+        if name.lower().endswith(STORED_EXTENSIONS):
+            return blob, zipfile.ZIP_STORED
+        compressor = zlib.compressobj(self.compresslevel, zlib.DEFLATED, -15)
+        return compressor.compress(blob) + compressor.flush(), zipfile.ZIP_DEFLATED
+
+
+def _dos_timestamp():
+    t = time.localtime()
+    dos_time = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+    dos_date = (max(t.tm_year, 1980) - 1980) << 9 | (t.tm_mon << 5) | t.tm_mday
+    return dos_time, dos_date
@@ -0,0 +1,212 @@
+"""
+Record the tool calls of a run as a plan and replay it against new data without the LLM.
+
+A plan is a JSON file listing the executed tool calls in order:
+
+    {"query": "...", "template": null, "input": "input/presentation.pptx", "config": {}, "output": "output/...",
+     "steps": [{"tool": "add_bar_chart", "args": {...}}, ...]}
+
+`input` is the deck the plan was recorded against; slide indices in the steps (move_slide,
+delete_slide, duplicate_slide, insert_at) refer to it, so replays start from the same deck.
+
+String arguments may contain {{field}} placeholders, which are filled from a data binding on
+replay. Binding keys of the form "<step>.<arg>" (1-based step number) replace an argument of
+one step outright, so a recorded plan can be refreshed without editing it:
+
+    {"month": "December", "3.series_data_str": "Sales: 5, 7, 9", "3.title": "December Sales"}
+
+Usage:
+    python plan.py record plan.json --template month_end_closing [--llm gemini | --replay recordings.jsonl]
+    python plan.py record plan.json --query "Create a bar chart of ..." --input input/presentation.pptx
+    python plan.py replay plan.json --data december.json --set month=December --output output/december.pptx
+"""
+import argparse
+import json
+import re
+import sys
+from chart_data import ChartDataError
+from deck_spec import DeckSpecError, build_deck
+from session import DEFAULT_CONFIG, PresentationSession
+
+PLACEHOLDER = re.compile(r"\{\{\s*([\w.-]+)\s*\}\}")
+
+
+class PlanBindingError(ValueError):
+    """
+    Raised when a data binding does not fit a plan; lists every problem found
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__("Invalid plan binding:\n" + "\n".join(f"  - {error}" for error in errors))
+
+
+def make_plan(steps, query=None, template=None, input_path=None, config=None, output_path=None):
+    """
+    Plan from executed steps ({"tool", "args"}), as recorded in PresentationAgent.last_plan
+    or TemplateWorkflow.last_plan
+    Args:
+        input_path: Deck the steps were executed against, None for a blank presentation
+        config: Overrides of session.DEFAULT_CONFIG the steps were executed with
+        output_path: Where the recorded deck was written, the default output of replays
+    """
+    return {"query": query, "template": template, "input": input_path, "config": dict(config or {}),
+            "output": output_path,
+            "steps": [{"tool": step["tool"], "args": dict(step["args"])} for step in steps]}
+
+
+def _session_plan(steps, session, query=None, template=None):
+    overrides = {key: value for key, value in session.config.items() if DEFAULT_CONFIG.get(key) != value}
+    return make_plan(steps, query=query, template=template, input_path=session.input_path, config=overrides,
+                     output_path=session.save_path)
+
+
+def save_plan(plan, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(plan, f, indent=2)
+
+
+def load_plan(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def placeholders(plan):
+    """
+    Names of all {{field}} placeholders used in a plan
+    """
+    names = set()
+    for step in plan["steps"]:
+        for value in step["args"].values():
+            if isinstance(value, str):
+                names.update(PLACEHOLDER.findall(value))
+    return names
+
+
+def bind_plan(plan, bindings=None):
+    """
+    Steps of a plan with placeholders filled and step overrides applied.
+    An argument that is exactly one placeholder takes the bound value as is (e.g. a list or array),
+    placeholders inside longer strings are replaced by the text of the value.
+    Raises:
+        PlanBindingError: for unbound placeholders and overrides of unknown steps
+    """
+    bindings = dict(bindings or {})
+    steps = [{"tool": step["tool"], "args": dict(step["args"])} for step in plan["steps"]]
+    errors = []
+
+    for key in [key for key in bindings if "." in key and key.split(".", 1)[0].isdigit()]:
+        index, arg = key.split(".", 1)
+        index = int(index)
+        if not 1 <= index <= len(steps):
+            errors.append(f"override {key!r}: the plan has {len(steps)} steps")
+            continue
+        steps[index - 1]["args"][arg] = bindings.pop(key)
+
+    for i, step in enumerate(steps, start=1):
+        for arg, value in step["args"].items():
+            if not isinstance(value, str):
+                continue
+            missing = [name for name in PLACEHOLDER.findall(value) if name not in bindings]
+            if missing:
+                errors.extend(f"step {i} ({step['tool']}).{arg}: no value for {{{{{name}}}}}" for name in missing)
+                continue
+            whole = PLACEHOLDER.fullmatch(value.strip())
+            if whole:
+                step["args"][arg] = bindings[whole.group(1)]
+            else:
+                step["args"][arg] = PLACEHOLDER.sub(lambda match: str(bindings[match.group(1)]), value)
+
+    if errors:
+        raise PlanBindingError(errors)
+    return steps
+
+
+def replay_plan(plan, bindings=None, session=None, output_path=None, input_path=None):
+    """
+    Rebuild a deck from a plan and a data binding, with no model calls. The deck starts from
+    the plan's input deck (or input_path) with the plan's config, unless a session is given.
+    Returns:
+        Path the deck was saved to
+    """
+    spec = {"input": input_path or plan.get("input"), "config": plan.get("config"), "output": plan.get("output"),
+            "slides": bind_plan(plan, bindings)}
+    return build_deck(spec, session=session, output_path=output_path)
+
+
+def record_plan(query=None, template=None, llm="gemini", session=None, input_path=None, config=None):
+    """
+    Build a deck with the LLM once and return the plan of the tool calls it executed
+    Args:
+        session: Session to build into; by default one is created from input_path and config
+    """
+    if session is None:
+        session = PresentationSession.for_mode(template or "normal", input_path=input_path, config=config)
+
+    if template is not None:
+        from workflow import TemplateWorkflow
+        workflow = TemplateWorkflow(llm=llm)
+        workflow.run(template, session=session)
+        return _session_plan(workflow.last_plan, session, template=template)
+
+    from ppt_agent import PresentationAgent
+    agent = PresentationAgent(llm=llm, session=session)
+    agent.execute_tool_calls(agent.plan_query(query))
+    return _session_plan(agent.last_plan, session, query=query)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record tool-call plans and replay them without the LLM")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="Build a deck with the LLM and save its plan")
+    record.add_argument("plan", help="Plan file to write")
+    source = record.add_mutually_exclusive_group(required=True)
+    source.add_argument("--query", help="Query for the presentation agent")
+    source.add_argument("--template", help="Template name from TEMPLATE_PROMPTS")
+    record.add_argument("--llm", default="gemini", help="Provider (gemini or llama)")
+    record.add_argument("--replay", help="Use recorded tool calls from this JSONL instead of a provider")
+    record.add_argument("--input", help="Existing deck or template to build on")
+    record.add_argument("--config", help="JSON file with overrides of the session config")
+
+    replay = commands.add_parser("replay", help="Rebuild a deck from a plan and new data")
+    replay.add_argument("plan", help="Plan file")
+    replay.add_argument("--data", help="JSON file with the data binding")
+    replay.add_argument("--set", action="append", metavar="NAME=VALUE", help="Bind one field or step.arg")
+    replay.add_argument("--output", help="Output path")
+    replay.add_argument("--input", help="Deck to start from instead of the plan's input deck")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        llm = args.llm
+        if args.replay:
+            from fake_llm import ReplayChatModel
+            llm = ReplayChatModel.from_jsonl(args.replay)
+        config = None
+        if args.config:
+            with open(args.config, encoding="utf-8") as f:
+                config = json.load(f)
+        plan = record_plan(query=args.query, template=args.template, llm=llm, input_path=args.input, config=config)
+        save_plan(plan, args.plan)
+        print(f"Recorded {len(plan['steps'])} steps to {args.plan}")
+    else:
+        bindings = {}
+        if args.data:
+            with open(args.data, encoding="utf-8") as f:
+                bindings.update(json.load(f))
+        for item in args.set or []:
+            name, sep, value = item.partition("=")
+            if not sep:
+                parser.error(f"--set expects NAME=VALUE, got {item!r}")
+            bindings[name] = value
+        plan = load_plan(args.plan)
+        try:
+            save_path = replay_plan(plan, bindings, output_path=args.output, input_path=args.input)
+        except (PlanBindingError, DeckSpecError, ChartDataError) as e:
+            print(f"{args.plan}: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"{args.plan} -> {save_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,34 +1,151 @@
 from tools import Presentationtools
-from langchain_groq import ChatGroq
-from langchain_google_genai import ChatGoogleGenerativeAI
+from llm_cache import ResponseCache, model_settings, tool_schemas
+from deck_index import DECK_INDEX, describe, summary_line
+import tracing
 import os
+import json
+import queue
+import threading
+import time
 from load_dotenv import load_dotenv
-from langchain_core.messages import HumanMessage, SystemMessage
 load_dotenv()
 
+
+def create_chat_model(llm="gemini"):
+    """
+    Create the chat model for a provider name ("gemini" or "llama").
+    Any chat model object with bind_tools/invoke (e.g. fake_llm.ReplayChatModel) is returned unchanged.
+    """
+    if not isinstance(llm, str):
+        return llm
+    if llm == "llama":
+        # Providers are imported on demand so only the selected one is loaded
+        from langchain_groq import ChatGroq
+        return ChatGroq(
+            model="llama3-70b-8192", 
+            temperature=0.1,
+            api_key=os.environ["GROQ_API_KEY"]
+        )
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    return ChatGoogleGenerativeAI(
+            model="gemini-1.5-flash", 
+            temperature=0.1,
+            api_key=os.environ["GOOGLE_API_KEY"]
+        )
+
+
+def _cache_enabled_by_env():
+    return os.environ.get("PPT_LLM_CACHE", "1").strip().lower() not in ("0", "false", "off", "no")
+
+
+def _stream_enabled_by_env():
+    return os.environ.get("PPT_LLM_STREAM", "0").strip().lower() in ("1", "true", "on", "yes")
+
+
+def _parse_tool_call_chunk(chunk):
+    """
+    Tool call from the merged fragments of a complete tool call in a streamed response
+    """
+    args = chunk.get("args") or "{}"
+    return {"name": chunk.get("name"), "args": json.loads(args) if isinstance(args, str) else args, "id": chunk.get("id")}
+
+
+class _StreamReader:
+    """
+    Reads a streamed model response on a background thread and yields each tool call to the
+    caller as soon as its arguments are complete. Tool calls run on the caller's thread, which
+    may already hold the session lock through an open batch.
+    An error in the stream is raised again once the calls read before it have been yielded.
+    Call close() when the calls are abandoned (e.g. one of them failed) to stop reading the
+    response; the reader stops at the next chunk the provider sends and closes the stream.
+    """
+
+    def __init__(self, llm, messages):
+        self.calls = []
+        self.content = []
+        self.error = None
+        self.finished_at = None
+        self._queue = queue.Queue()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(llm, messages), name="llm-stream-reader", daemon=True)
+        self._thread.start()
+
+    def _run(self, llm, messages):
+        streamed_calls = []
+        stream = None
+        try:
+            stream = llm.stream(messages)
+            for chunk in stream:
+                if self._closed.is_set():
+                    return
+                if isinstance(chunk.content, str):
+                    self.content.append(chunk.content)
+                # Fragments are merged by hand: adding up message chunks re-parses every partial call
+                for fragment in chunk.tool_call_chunks:
+                    index = fragment.get("index")
+                    if index is None or not streamed_calls or streamed_calls[-1]["index"] != index:
+                        streamed_calls.append({"name": fragment.get("name"), "args": fragment.get("args") or "",
+                                               "id": fragment.get("id"), "index": index})
+                    else:
+                        current = streamed_calls[-1]
+                        current["name"] = current["name"] or fragment.get("name")
+                        current["args"] += fragment.get("args") or ""
+                        current["id"] = current["id"] or fragment.get("id")
+                # A tool call is complete once the model has started the next one
+                while len(self.calls) < len(streamed_calls) - 1:
+                    self._emit(streamed_calls[len(self.calls)])
+            for streamed_call in streamed_calls[len(self.calls):]:
+                self._emit(streamed_call)
+        except Exception as e:
+            self.error = e
+        finally:
+            if hasattr(stream, "close"):
+                stream.close()
+            self.finished_at = time.perf_counter()
+            self._queue.put(None)
+
+    def _emit(self, streamed_call):
+        self.calls.append(_parse_tool_call_chunk(streamed_call))
+        self._queue.put(self.calls[-1])
+
+    def __iter__(self):
+        yield from iter(self._queue.get, None)
+        if self.error is not None:
+            raise self.error
+
+    def close(self):
+        self._closed.set()
+
+
 class PresentationAgent:
-    def __init__(self, llm="gemini", mode="normal"):
-        if mode != "normal":
-            self.presentationtools = Presentationtools(mode=mode)
-        else:
-            self.presentationtools = Presentationtools()
-
-        if llm == "llama":
-            self.llm = ChatGroq(
-                model="llama3-70b-8192", 
-                temperature=0.1,
-                api_key=os.environ["GROQ_API_KEY"]
-            )
-        else:
-            self.llm = ChatGoogleGenerativeAI(
-                    model="gemini-1.5-flash", 
-                    temperature=0.1,
-                    api_key=os.environ["GOOGLE_API_KEY"]
-                )
+    def __init__(self, llm="gemini", mode="normal", session=None, cache=None, stream=None):
+        # Bound to one PresentationSession; use one agent per session to build decks concurrently
+        self.presentationtools = Presentationtools(mode=mode, session=session)
+        self.session = self.presentationtools.session
+
+        self.llm = create_chat_model(llm)
         self.tools = self.presentationtools.get_tools()
         # print("Available Tools:", self.tools)
 
         self.llm_with_tools = self.llm.bind_tools(self.tools)
+
+        # Response cache: a ResponseCache, True for the default on-disk cache or False to bypass it.
+        # By default only provider models (llm given by name) are cached, unless PPT_LLM_CACHE=0.
+        if cache is None:
+            cache = isinstance(llm, str) and _cache_enabled_by_env()
+        if cache is True:
+            cache = ResponseCache()
+        self.response_cache = cache or None
+        self._tool_schemas = tool_schemas(self.tools) if self.response_cache else None
+
+        # Streaming execution: build each slide as soon as its tool call is complete in the streamed response.
+        # Off unless stream=True is passed or PPT_LLM_STREAM=1 is set for provider models.
+        if stream is None:
+            stream = isinstance(llm, str) and _stream_enabled_by_env()
+        self.stream = bool(stream) and hasattr(self.llm_with_tools, "stream")
+
+        # Tool calls executed by the last execute_tool_calls, as plan steps ({"tool", "args"}), see plan.py
+        self.last_plan = []
         self.system_prompt = """
         You are an Expert Presentation Maker Agent. You have access to specialized tools for creating PowerPoint slides. Based on the user's request, you can use one or more tools in sequence to build the presentation.
 
@@ -50,6 +167,9 @@ class PresentationAgent:
         - add_line_chart
         - add_pie_chart
         - add_waterfall_chart
+        - move_slide
+        - delete_slide
+        - duplicate_slide
         - add_title_slide
         ---
 
@@ -138,47 +258,168 @@ class PresentationAgent:
         """
 
 
-    def process_query(self, query, mode="normal"):
-        messages = [SystemMessage(content=self.system_prompt), HumanMessage(content=query)]
+    def deck_context(self):
+        """
+        Outline of the deck being edited (titles, layouts, charts and tables per slide) for the system prompt,
+        empty when building a new deck
+        """
+        path = self.session.deck_path
+        if path is None or not os.path.exists(path):
+            return ""
+        return f"""
+        ### Current Presentation:
+        The presentation already has these slides. Use their indices for `insert_at`, `move_slide`, `delete_slide` and `duplicate_slide`.
+{describe(DECK_INDEX.get(path))}
+        """
 
-        try:
-            print("Sending Query to LLM...")
-            response = self.llm_with_tools.invoke(messages)
-            print("Tool invoked successfully.")
-            print("Tool Calls:", response.tool_calls)
+    def _messages(self, query):
+        from langchain_core.messages import HumanMessage, SystemMessage
 
-            tool_calls = response.additional_kwargs.get('tool_calls', [])
-            if not tool_calls:
-                print("No tool calls found.")
-                tool_calls = response.tool_calls
-                
+        return [SystemMessage(content=self.system_prompt + self.deck_context()), HumanMessage(content=query)]
 
-            results = []
+    def _cached_response(self, messages):
+        """
+        (cache key, cached response or None); the key is None when caching is off
+        """
+        if self.response_cache is None:
+            return None, None
+        cache_key = self.response_cache.key(messages, self._tool_schemas, model_settings(self.llm))
+        return cache_key, self.response_cache.get(cache_key)
+
+    def plan_query(self, query):
+        """
+        Ask the LLM which tools to call for a query, without executing them.
+        Safe to call from several threads at once.
+        Args:
+            query: User query
+        Returns:
+            List of tool calls in the order the LLM emitted them
+        """
+        messages = self._messages(query)
+
+        with tracing.span("llm.invoke", "llm", query_chars=len(query)) as sp:
+            cache_key, response = self._cached_response(messages)
+            cached = response is not None
+
+            if response is None:
+                print("Sending Query to LLM...")
+                response = self.llm_with_tools.invoke(messages)
+                print("Tool invoked successfully.")
+                if cache_key is not None:
+                    self.response_cache.put(cache_key, response)
+            else:
+                print("Using cached LLM response.")
+            if sp:
+                sp.set(model=model_settings(self.llm)["model"], cached=cached, tool_calls=len(response.tool_calls))
+        print("Tool Calls:", response.tool_calls)
+
+        tool_calls = response.additional_kwargs.get('tool_calls', [])
+        if not tool_calls:
+            print("No tool calls found.")
+            tool_calls = response.tool_calls
+        return tool_calls
+
+    def execute_tool_calls(self, tool_calls):
+        """
+        Run tool calls against the presentation in the given order.
+        Args:
+            tool_calls: Tool calls as returned by plan_query
+        Returns:
+            Result of the last tool call
+        """
+        results = []
+        self.last_plan = []
 
+        # Slides are saved once at the end of the query instead of after every tool call
+        with self.presentationtools.batch():
             # Process ALL tool calls in sequence
             for i, call in enumerate(tool_calls, start=1):
-                print(f"Processing Tool Call {i}/{len(tool_calls)}: {call}")
-
-                # Extract tool name and arguments
-                tool_name = call.get('name') or call.get('function', {}).get('name')
-                args = call.get('args') or call.get('function', {}).get('arguments')
-
-                # Handle JSON string arguments
-                if isinstance(args, str):
-                    import json
-                    args = json.loads(args)
-
-                # Check if the tool exists
-                if hasattr(self.presentationtools, tool_name):
-                    tool_func = getattr(self.presentationtools, tool_name)
-                    result = tool_func(**args)
-                    print(f"Result from {tool_name}: {result}")
-                    results.append(result)
-                else:
-                    print(f"Tool '{tool_name}' not found.")
-                    results.append(f"Tool '{tool_name}' not found.")
+                results.append(self._execute_tool_call(i, call, len(tool_calls)))
 
-            return results[-1]
+        return results[-1]
+
+    def _execute_tool_call(self, i, call, total=None):
+        """
+        Run one tool call and record it in last_plan
+        """
+        print(f"Processing Tool Call {i}/{total or '?'}: {call}")
+
+        # Extract tool name and arguments
+        tool_name = call.get('name') or call.get('function', {}).get('name')
+        args = call.get('args') or call.get('function', {}).get('arguments')
+
+        # Handle JSON string arguments
+        if isinstance(args, str):
+            args = json.loads(args)
+
+        # Check if the tool exists
+        if not hasattr(self.presentationtools, tool_name):
+            print(f"Tool '{tool_name}' not found.")
+            return f"Tool '{tool_name}' not found."
+
+        tool_func = getattr(self.presentationtools, tool_name)
+        with tracing.span(f"tool.{tool_name}", "tool") as sp:
+            if sp:
+                sp.set(tool=tool_name, arg_sizes=tracing.arg_sizes(args))
+            result = tool_func(**args)
+        self.last_plan.append({"tool": tool_name, "args": dict(args)})
+        print(f"Result from {tool_name}: {result}")
+        return result
+
+    def stream_query(self, query):
+        """
+        Plan and execute a query at the same time: each tool call is executed as soon as its
+        arguments are complete in the streamed response, while the model is still emitting the
+        next ones. Calls run one at a time in the order they were emitted, so slide order is the
+        same as with execute_tool_calls.
+        Args:
+            query: User query
+        Returns:
+            Result of the last tool call
+        """
+        from langchain_core.messages import AIMessage
+
+        messages = self._messages(query)
+        cache_key, response = self._cached_response(messages)
+        if response is not None:
+            print("Using cached LLM response.")
+            return self.execute_tool_calls(response.tool_calls)
+
+        self.last_plan = []
+        results = []
+        first_result_at = None
+        start = time.perf_counter()
+        with tracing.span("llm.stream", "llm", query_chars=len(query)) as sp:
+            with self.presentationtools.batch():
+                print("Streaming Query to LLM...")
+                reader = _StreamReader(self.llm_with_tools, messages)
+                try:
+                    for i, call in enumerate(reader, start=1):
+                        results.append(self._execute_tool_call(i, call))
+                        if first_result_at is None:
+                            first_result_at = time.perf_counter()
+                finally:
+                    # Stops the reader when a tool call failed; a no-op once the stream has ended
+                    reader.close()
+                print("Tool Calls:", reader.calls)
+            if sp:
+                sp.set(model=model_settings(self.llm)["model"], tool_calls=len(reader.calls),
+                       stream_seconds=reader.finished_at - start,
+                       first_slide_seconds=first_result_at - start if first_result_at else None)
+
+        if cache_key is not None:
+            self.response_cache.put(cache_key, AIMessage(content="".join(reader.content), tool_calls=reader.calls))
+        if not results:
+            print("No tool calls found.")
+            return None
+        return results[-1]
+
+    def process_query(self, query, mode="normal"):
+        try:
+            if self.stream:
+                return self.stream_query(query)
+            tool_calls = self.plan_query(query)
+            return self.execute_tool_calls(tool_calls)
 
         except Exception as e:
             print(f"Error invoking tool: {e}")
@@ -211,16 +452,16 @@ def main():
 
         if query.strip().lower() == "show":
             if os.path.exists("input"):
-                files = os.listdir("input")
-                ppt_files = [file for file in files if file.endswith(".pptx")]
+                decks = DECK_INDEX.scan("input")
+                ppt_files = [deck["name"] for deck in decks]
                 if ppt_files:
                     print("Select a file to edit:")
-                    for i, file in enumerate(ppt_files, start=1):
-                        print(f"{i}. {file}")
+                    for i, deck in enumerate(decks, start=1):
+                        print(f"{i}. {summary_line(deck)}")
                     selected_file = int(input("Enter the number corresponding to the file: "))
                     if selected_file in range(1, len(ppt_files)+1):
                         print(f"Opening {ppt_files[selected_file-1]} for editing...")
-                        Presentationtools.use_presentation(folder_path="input", file_path=ppt_files[selected_file-1])
+                        agent.presentationtools.use_presentation(folder_path="input", file_path=ppt_files[selected_file-1])
                     else:
                         print("Invalid selection.")
                 else:
@@ -0,0 +1,132 @@
+import os
+import threading
+from template_cache import TEMPLATE_CACHE
+from package_writer import IncrementalPackageWriter
+from slide_order import SlideOrder
+import tracing
+
+DEFAULT_SAVE_PATH = "output/presentation_test.pptx"
+
+DEFAULT_CONFIG = {
+    "title_font_size": 40,
+    "slide_width": 13.33,
+    "slide_height": 7.5,
+    # "native" builds an editable PowerPoint chart, "image" embeds a matplotlib rendering
+    "waterfall_renderer": "native",
+    # Images are resampled to their picture box at this DPI before embedding, None embeds originals
+    "image_dpi": 150,
+    # Font text is measured with when sizing it to fit its box (the theme body font of the default template)
+    "body_font": "Calibri",
+    # Default point budget for line and scatter charts, None renders every point
+    "max_chart_points": None,
+    # Reuse the compressed members of the previous save (or the input template) that did not change
+    "incremental_save": True,
+    # Reuse previously built text-only slides (title, bullet, two-column, table) for identical arguments
+    "slide_cache": True
+}
+
+
+class PresentationSession:
+    """
+    One deck build: the input template, the output path, the in-memory Presentation and its config.
+
+    Sessions share no state, so a long-lived process can build many decks concurrently by
+    giving each build its own session (and Presentationtools / PresentationAgent bound to it).
+    """
+
+    def __init__(self, input_path=None, save_path=DEFAULT_SAVE_PATH, config=None):
+        """
+        Args:
+            input_path: Template or existing deck to start from, None for a blank presentation
+            save_path: Where the deck is written
+            config: Overrides for DEFAULT_CONFIG
+        """
+        self.input_path = input_path
+        self.save_path = save_path
+        self.config = {**DEFAULT_CONFIG, **(config or {})}
+        # Held while a batch of slides is built, so a session is only mutated by one thread at a time
+        self.lock = threading.RLock()
+
+        self._prs = None
+        # Deferred (write-behind) saving: while a batch is open, save requests
+        # only mark the deck dirty and are coalesced into a single write.
+        self.batch_depth = 0
+        self.dirty = False
+        self.skipped_saves = 0
+        self.image_bytes_saved = 0
+        self.writes = 0
+        self.package_writer = IncrementalPackageWriter()
+        # Slide insertions, moves and deletions of the current batch, applied in one pass before writing
+        self.slide_order = SlideOrder()
+
+    @classmethod
+    def for_mode(cls, mode="normal", **kwargs):
+        """
+        Session writing to the path used for a template mode (output/<mode>.pptx)
+        """
+        if mode == "normal":
+            return cls(**kwargs)
+        return cls(save_path=f"output/{mode}.pptx", **kwargs)
+
+    @property
+    def presentation(self):
+        """
+        The Presentation being built, loaded from the input template on first use
+        """
+        if self._prs is None:
+            with self.lock:
+                if self._prs is None:
+                    self._prs = TEMPLATE_CACHE.load(self.input_path)
+        return self._prs
+
+    def write(self):
+        """
+        Apply the pending slide order and write the presentation to save_path
+        """
+        with self.lock, tracing.span("save", "io", path=self.save_path) as sp:
+            self.slide_order.apply(self.presentation)
+            if self.config["incremental_save"]:
+                stats = self.package_writer.save(self.presentation, self.save_path, template_path=self.input_path)
+                if sp:
+                    sp.set(**stats)
+            else:
+                # Written next to the deck and renamed, so a failed save never leaves a partial file
+                tmp_path = f"{self.save_path}.{os.getpid()}.tmp"
+                try:
+                    self.presentation.save(tmp_path)
+                    os.replace(tmp_path, self.save_path)
+                except BaseException:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                    raise
+                if sp:
+                    sp.set(bytes_written=os.path.getsize(self.save_path))
+            self.dirty = False
+            self.writes += 1
+            return self.save_path
+
+    @property
+    def deck_path(self):
+        """
+        File holding the current state of the deck: the last save, or the input deck before the first save
+        """
+        if self.writes and os.path.exists(self.save_path):
+            return self.save_path
+        return self.input_path
+
+    def use_presentation(self, folder_path: str, file_path: str):
+        """
+        Start editing an existing presentation file; it will be saved under output/ with the same name
+        Args:
+            folder_path: Folder containing the presentation
+            file_path: Name of the presentation file
+        """
+        with self.lock:
+            self.input_path = os.path.join(folder_path, file_path)
+            self.save_path = os.path.join("output", file_path)
+            self._prs = None
+            self.slide_order.reset()
+            self.dirty = False
+            self.writes = 0
+        print(f"Presentation loaded from: {self.input_path}")
+        print(f"Presentation will be saved to: {self.save_path}")
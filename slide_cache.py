@@ -0,0 +1,86 @@
+import hashlib
+import json
+import os
+from lxml import etree
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from cache import LRUBytesCache
+
+
+class SlideCache:
+    """
+    Memo cache of finished slides for tools that only produce text and tables, such as the
+    agenda, title and static bullet slides that every template run builds the same way.
+
+    Entries hold the serialized shape tree of the slide and are keyed by tool, normalized
+    arguments, layout, template identity and config. A slide is only stored when its sole
+    relationship is its layout, so cloning the shape tree into a new slide on the same layout
+    reproduces it exactly.
+    """
+
+    def __init__(self, max_entries=512, max_bytes=32 * 1024 * 1024):
+        self.cache = LRUBytesCache(max_entries=max_entries, max_bytes=max_bytes)
+        self.uncacheable = 0
+
+    @staticmethod
+    def key(tool, args, layout_index, template_path=None, config=None):
+        """
+        Cache key for a tool invocation
+        Args:
+            tool: Tool name
+            args: Tool arguments, excluding the insertion position
+            layout_index: Slide layout the tool uses
+            template_path: Template the deck was loaded from, None for the default template
+            config: Session config
+        """
+        if template_path is None:
+            template = "default"
+        else:
+            path = os.path.abspath(template_path)
+            try:
+                stat = os.stat(path)
+                template = f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+            except OSError:
+                template = path
+        normalized = {name: value.strip() if isinstance(value, str) else value for name, value in args.items()}
+        payload = json.dumps([tool, normalized, layout_index, template, config or {}], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def restore(self, key, slide):
+        """
+        Replace the shapes of a freshly added slide with the cached ones.
+        Returns:
+            True on a hit, False if the slide is not cached
+        """
+        data = self.cache.get(key) if key is not None else None
+        if data is None:
+            return False
+        sp_tree = slide.shapes._spTree
+        cached = parse_xml(data)
+        for child in list(sp_tree):
+            sp_tree.remove(child)
+        sp_tree.extend(list(cached))
+        return True
+
+    def store(self, key, slide):
+        """
+        Cache a finished slide if it has no relationships besides its layout
+        Returns:
+            Whether the slide was stored
+        """
+        if key is None:
+            return False
+        if any(rel.reltype != RT.SLIDE_LAYOUT for rel in slide.part.rels.values()):
+            self.uncacheable += 1
+            return False
+        self.cache.put(key, etree.tostring(slide.shapes._spTree))
+        return True
+
+    def clear(self):
+        self.cache.clear()
+
+    def stats(self):
+        return {**self.cache.stats(), "uncacheable": self.uncacheable}
+
+
+SLIDE_CACHE = SlideCache()
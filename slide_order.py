@@ -0,0 +1,218 @@
+import copy
+import re
+from collections import defaultdict
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+R_NAMESPACE = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+# Parts a slide owns rather than shares; a duplicated slide gets its own copy of these
+OWNED_RELTYPES = {
+    RT.CHART, RT.OLE_OBJECT, RT.PACKAGE,
+    RT.DIAGRAM_DATA, RT.DIAGRAM_LAYOUT, RT.DIAGRAM_QUICK_STYLE, RT.DIAGRAM_COLORS,
+    "http://schemas.microsoft.com/office/2007/relationships/diagramDrawing",
+}
+# Relationships that are not carried over to a duplicate
+SKIPPED_RELTYPES = {RT.SLIDE_LAYOUT, RT.NOTES_SLIDE}
+
+
+class SlideOrder:
+    """
+    Pending slide insertions, moves, deletions and duplicates of a deck, applied in one pass.
+
+    Every position and index refers to the slide order at the time the first pending operation
+    was recorded (the deck the model saw when it planned its tool calls), not to a list that has
+    already shifted under earlier operations. A position is where the slide ends up among the
+    original slides: inserting at 2 places the slide before original slide 2, positions past the
+    end (and None) append. Slides placed at the same position keep the order they were added in.
+
+    New slides are appended to the deck right away so they can be built; apply() moves every
+    slide to its final place by rewriting the slide id list once.
+    """
+
+    def __init__(self):
+        self._original = None
+        self._placed = []
+        self._removed = set()
+        self._deleted = []
+
+    def __bool__(self):
+        return self._original is not None
+
+    def _begin(self, prs):
+        if self._original is None:
+            self._original = list(prs.slides._sldIdLst)
+            # python-pptx names a new slide after the slide count, which clashes with an existing
+            # part when the numbering has gaps (e.g. in a deck saved after a deletion elsewhere)
+            if not _slide_parts_numbered(prs):
+                _renumber_slide_parts(prs)
+
+    def _check_index(self, index):
+        if not 0 <= index < len(self._original):
+            raise IndexError(f"slide index {index} is out of range, the deck has {len(self._original)} slides")
+        if index in self._removed:
+            raise ValueError(f"slide {index} has already been moved or deleted")
+
+    def add_slide(self, prs, layout, position=None):
+        """
+        Add a slide with the given layout, placed at `position` when the order is applied
+        """
+        self._begin(prs)
+        slide = prs.slides.add_slide(layout)
+        self._placed.append((position, prs.slides._sldIdLst[-1]))
+        return slide
+
+    def move(self, prs, index, position):
+        """
+        Move original slide `index` so that it ends up at `position`
+        """
+        self._begin(prs)
+        self._check_index(index)
+        # The slide leaves its old place, so positions after it are one further along in the original order
+        if position is not None and position > index:
+            position += 1
+        self._removed.add(index)
+        self._placed.append((position, self._original[index]))
+
+    def delete(self, prs, index):
+        """
+        Remove original slide `index` from the deck
+        """
+        self._begin(prs)
+        self._check_index(index)
+        self._removed.add(index)
+        self._deleted.append(self._original[index])
+
+    def duplicate(self, prs, index, position=None):
+        """
+        Copy original slide `index` (shapes, background, charts and media) and place the copy at
+        `position`, right after the original by default
+        Returns:
+            The new slide
+        """
+        self._begin(prs)
+        if not 0 <= index < len(self._original):
+            raise IndexError(f"slide index {index} is out of range, the deck has {len(self._original)} slides")
+        source = prs.slides.get(int(self._original[index].get("id")))
+        slide = self.add_slide(prs, source.slide_layout, index + 1 if position is None else position)
+        clone_slide_content(source, slide)
+        return slide
+
+    def apply(self, prs):
+        """
+        Put every slide in its final place and drop deleted slides.
+        Returns:
+            Whether there was anything to apply
+        """
+        if self._original is None:
+            return False
+        sld_id_lst = prs.slides._sldIdLst
+        count = len(self._original)
+
+        placed_before = defaultdict(list)
+        tail = []
+        for position, sld_id in self._placed:
+            if position is None or position >= count:
+                tail.append(sld_id)
+            else:
+                placed_before[max(0, position)].append(sld_id)
+
+        order = []
+        for index, sld_id in enumerate(self._original):
+            order.extend(placed_before.get(index, ()))
+            if index not in self._removed:
+                order.append(sld_id)
+        order.extend(tail)
+        # Slides added to the deck without going through this order stay at the end
+        known = {id(sld_id) for sld_id in order}
+        known.update(id(sld_id) for sld_id in self._deleted)
+        order.extend(sld_id for sld_id in sld_id_lst if id(sld_id) not in known)
+
+        sld_id_lst[:] = order
+        for sld_id in self._deleted:
+            prs.part.drop_rel(sld_id.rId)
+        _renumber_slide_parts(prs)
+        self.reset()
+        return True
+
+    def reset(self):
+        """
+        Forget pending operations without applying them
+        """
+        self._original = None
+        self._placed = []
+        self._removed = set()
+        self._deleted = []
+
+
+def _slide_parts_numbered(prs):
+    """
+    Whether the slide parts are named slide1.xml to slideN.xml, so the next slide gets a free name
+    """
+    names = {str(prs.part.related_part(sld_id.rId).partname) for sld_id in prs.slides._sldIdLst}
+    return names == {f"/ppt/slides/slide{number}.xml" for number in range(1, len(names) + 1)}
+
+
+def _renumber_slide_parts(prs):
+    """
+    Name the slide parts slide1.xml to slideN.xml in deck order
+    """
+    prs.part.rename_slide_parts([sld_id.rId for sld_id in prs.part._element.sldIdLst])
+    # Relationships cache their target's partname on first save; drop it so renamed parts are referenced by their new names
+    for part in prs.part.package.iter_parts():
+        for rel in part.rels.values():
+            rel.__dict__.pop("target_partname", None)
+            rel.__dict__.pop("target_ref", None)
+
+
+def _copy_part(part, copies):
+    """
+    Copy of a part under a new partname, with the parts it owns copied as well
+    """
+    if part in copies:
+        return copies[part]
+    package = part.package
+    template = re.sub(r"\d*(\.\w+)$", r"%d\1", str(part.partname))
+    clone = type(part).load(package.next_partname(template), part.content_type, package, part.blob)
+    copies[part] = clone
+    rid_map = _relate_copies(part, clone, copies, skipped=())
+    if rid_map and hasattr(clone, "_element"):
+        _remap_rids(clone._element, rid_map)
+    return clone
+
+
+def _relate_copies(source, target, copies, skipped):
+    """
+    Give `target` the relationships of `source`, copying owned parts.
+    Returns:
+        {source rId: target rId}
+    """
+    rid_map = {}
+    for rId, rel in source.rels.items():
+        if rel.reltype in skipped:
+            continue
+        if rel.is_external:
+            rid_map[rId] = target.rels.get_or_add_ext_rel(rel.reltype, rel.target_ref)
+            continue
+        part = rel.target_part
+        if rel.reltype in OWNED_RELTYPES or part in copies:
+            part = _copy_part(part, copies)
+        rid_map[rId] = target.relate_to(part, rel.reltype)
+    return rid_map
+
+
+def _remap_rids(element, rid_map):
+    for node in element.iter():
+        for name, value in node.attrib.items():
+            if name.startswith(R_NAMESPACE) and value in rid_map:
+                node.set(name, rid_map[value])
+
+
+def clone_slide_content(source, slide):
+    """
+    Replace the content of `slide` with a copy of `source`: shapes, background and the parts they use.
+    Images and media are shared between both slides, charts and embedded objects are copied.
+    """
+    rid_map = _relate_copies(source.part, slide.part, {}, skipped=SKIPPED_RELTYPES)
+    element = slide._element
+    element.replace(element.cSld, copy.deepcopy(source._element.cSld))
+    _remap_rids(element.cSld, rid_map)
@@ -0,0 +1,73 @@
+import csv
+import itertools
+
+
+def open_table_source(source, delimiter=None, batch_size=1024):
+    """
+    Open tabular data for streaming.
+
+    Args:
+        source: Path to a .csv/.tsv/.txt or .parquet file, or an iterable of rows whose first row is the header
+        delimiter: CSV delimiter, defaults to a tab for .tsv files and a comma otherwise
+        batch_size: Rows read per Parquet batch
+    Returns:
+        (headers, rows) where rows is an iterator of lists of strings; only one batch is held in memory
+    """
+    if isinstance(source, str):
+        lower = source.lower()
+        if lower.endswith((".parquet", ".pq")):
+            return _open_parquet(source, batch_size)
+        if delimiter is None:
+            delimiter = "\t" if lower.endswith(".tsv") else ","
+        return _open_csv(source, delimiter)
+
+    rows = iter(source)
+    headers = [str(value).strip() for value in next(rows, [])]
+    return headers, ([_cell(value) for value in row] for row in rows)
+
+
+def _open_csv(path, delimiter):
+    f = open(path, newline="", encoding="utf-8-sig")
+    reader = csv.reader(f, delimiter=delimiter)
+    headers = [value.strip() for value in next(reader, [])]
+
+    def rows():
+        with f:
+            for row in reader:
+                if row:
+                    yield [value.strip() for value in row]
+
+    return headers, rows()
+
+
+def _open_parquet(path, batch_size):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Reading Parquet tables requires pyarrow (pip install pyarrow)") from e
+
+    parquet_file = pq.ParquetFile(path)
+    headers = list(parquet_file.schema_arrow.names)
+
+    def rows():
+        for batch in parquet_file.iter_batches(batch_size=batch_size):
+            columns = [batch.column(i).to_pylist() for i in range(batch.num_columns)]
+            for row in zip(*columns):
+                yield [_cell(value) for value in row]
+
+    return headers, rows()
+
+
+def _cell(value):
+    return "" if value is None else str(value).strip()
+
+
+def paginate(rows, page_size):
+    """
+    Yield lists of at most page_size rows, holding a single page in memory
+    """
+    while True:
+        page = list(itertools.islice(rows, page_size))
+        if not page:
+            return
+        yield page
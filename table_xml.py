@@ -0,0 +1,76 @@
+import re
+from xml.sax.saxutils import escape
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.util import Inches, Pt
+
+# Characters that are not allowed in XML 1.0
+_ILLEGAL_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def column_widths(headers, values, min_width=1.5, inches_per_char=0.15, max_total=11):
+    """
+    Width of every column in inches from the longest text in that column, so one long cell
+    only widens its own column. Columns are scaled down together if the table is wider than max_total.
+    """
+    import numpy as np
+
+    cols = len(headers)
+    header_lengths = np.char.str_len(np.array(headers, dtype=np.str_))
+    if values:
+        padded = [row[:cols] + [""] * (cols - len(row)) if len(row) != cols else row for row in values]
+        lengths = np.char.str_len(np.array(padded, dtype=np.str_)).max(axis=0)
+        lengths = np.maximum(lengths, header_lengths)
+    else:
+        lengths = header_lengths
+
+    widths = np.maximum(min_width, lengths * inches_per_char)
+    total = widths.sum()
+    if total > max_total:
+        widths *= max_total / total
+    return widths.tolist()
+
+
+def fill_table(table, headers, values, col_widths, row_height, header_size=12, body_size=11,
+               margin_x=Inches(0.1), margin_y=Inches(0.05), align="l", anchor="t"):
+    """
+    Replace the rows of a python-pptx table with header + values, written as XML in one pass
+    instead of through per-cell proxies. Produces the same markup as setting cell.text,
+    paragraph.font and the cell margins / anchor one cell at a time.
+
+    Args:
+        table: python-pptx Table (its existing rows are discarded)
+        headers: Header texts, bold
+        values: Rows of cell texts; short rows are padded with empty cells
+        col_widths: Column widths in inches
+        row_height: Row height in inches
+    """
+    cols = len(headers)
+    tc_pr = f'<a:tcPr marL="{margin_x}" marR="{margin_x}" marT="{margin_y}" marB="{margin_y}" anchor="{anchor}"/>'
+    header_ppr = f'<a:pPr algn="{align}"><a:defRPr sz="{Pt(header_size).centipoints}" b="1"/></a:pPr>'
+    body_ppr = f'<a:pPr algn="{align}"><a:defRPr sz="{Pt(body_size).centipoints}"/></a:pPr>'
+    height = Inches(row_height)
+
+    parts = [f"<a:tbl {nsdecls('a')}>"]
+    for r, row in enumerate([headers] + list(values)):
+        ppr = header_ppr if r == 0 else body_ppr
+        parts.append(f'<a:tr h="{height}">')
+        for c in range(cols):
+            text = str(row[c]) if c < len(row) else ""
+            parts.append("<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>")
+            for line in text.split("\n"):
+                line = _ILLEGAL_XML_CHARS.sub("", line)
+                run = f"<a:r><a:t>{escape(line)}</a:t></a:r>" if line else ""
+                parts.append(f"<a:p>{ppr}{run}</a:p>")
+            parts.append(f"</a:txBody>{tc_pr}</a:tc>")
+        parts.append("</a:tr>")
+    parts.append("</a:tbl>")
+    rows_xml = parse_xml("".join(parts))
+
+    tbl = table._tbl
+    for grid_col, width in zip(tbl.tblGrid.gridCol_lst, col_widths):
+        grid_col.set("w", str(Inches(width)))
+    for tr in tbl.tr_lst:
+        tbl.remove(tr)
+    tbl.extend(rows_xml.tr_lst)
+    return table
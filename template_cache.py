@@ -0,0 +1,51 @@
+import io
+import os
+import zipfile
+from pptx import Presentation
+from pptx.api import _default_pptx_path
+from cache import LRUBytesCache
+
+
+class TemplateCache:
+    """
+    Keeps recently used .pptx templates in memory, keyed by path and mtime, so every session
+    gets its own Presentation without reading the file from disk again. Templates are kept
+    re-packed without compression, which also saves inflating every part on each load.
+    Editing a template on disk changes its mtime and therefore invalidates the cached copy.
+    """
+
+    def __init__(self, max_entries=16, max_bytes=256 * 1024 * 1024):
+        self.cache = LRUBytesCache(max_entries=max_entries, max_bytes=max_bytes)
+
+    def load(self, path=None):
+        """
+        Return an independent Presentation parsed from the cached template bytes.
+        Args:
+            path: Path to a .pptx file, None for the python-pptx default template
+        """
+        return Presentation(io.BytesIO(self.get_bytes(path)))
+
+    def get_bytes(self, path=None):
+        path = os.path.abspath(path or _default_pptx_path())
+        stat = os.stat(path)
+        key = f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+        data = self.cache.get(key)
+        if data is None:
+            data = self._repack_stored(path)
+            self.cache.put(key, data)
+        return data
+
+    @staticmethod
+    def _repack_stored(path):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(path) as src, zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as dst:
+            for info in src.infolist():
+                dst.writestr(info.filename, src.read(info), compress_type=zipfile.ZIP_STORED)
+        return buffer.getvalue()
+
+    def stats(self):
+        return self.cache.stats()
+
+
+TEMPLATE_CACHE = TemplateCache()
@@ -1,5 +1,3 @@
-from ppt_agent import PresentationAgent
-
 TEMPLATE_PROMPTS = {
     "month_end_closing": [
         "Create a title slide for November 2024 Financial Review with just text, no logos",
@@ -31,6 +29,8 @@ TEMPLATE_PROMPTS = {
 
 
 def main():
+    from ppt_agent import PresentationAgent
+
     ppt = PresentationAgent()
     info_for_user = """Available Templates:
     1. Month End Closing
@@ -0,0 +1,36 @@
+import pytest
+
+from pptx import Presentation
+from session import PresentationSession
+from tools import Presentationtools
+
+
+@pytest.fixture
+def make_tools(tmp_path):
+    """
+    Factory of Presentationtools on a new session saving to tmp_path/<name>, optionally
+    starting with `slides` bullet slides titled "Slide 0", "Slide 1", ...
+    """
+    def make(slides=0, name="deck.pptx", **session_args):
+        tools = Presentationtools(session=PresentationSession(save_path=str(tmp_path / name), **session_args))
+        if slides:
+            with tools.batch():
+                for i in range(slides):
+                    tools.add_bullet_slide(f"Slide {i}", "First point; Second point")
+        return tools
+    return make
+
+
+@pytest.fixture
+def tools(make_tools):
+    return make_tools()
+
+
+@pytest.fixture
+def titles():
+    """
+    Function returning the slide titles of a saved deck, in order
+    """
+    def slide_titles(path):
+        return [slide.shapes.title.text for slide in Presentation(path).slides]
+    return slide_titles
@@ -0,0 +1,21 @@
+import pytest
+
+
+def test_batch_writes_once_on_normal_exit(tmp_path, tools):
+    with tools.batch():
+        with tools.batch():
+            tools.add_bullet_slide("First", "Point")
+        tools.add_bullet_slide("Second", "Point")
+        assert not (tmp_path / "deck.pptx").exists()
+    assert (tmp_path / "deck.pptx").exists()
+    assert tools.session.skipped_saves == 1
+    assert tools.session.writes == 1
+
+
+def test_failed_batch_writes_nothing(tmp_path, tools):
+    with pytest.raises(RuntimeError):
+        with tools.batch():
+            tools.add_bullet_slide("First", "Point")
+            raise RuntimeError("tool failed")
+    assert not (tmp_path / "deck.pptx").exists()
+    assert tools.session.batch_depth == 0
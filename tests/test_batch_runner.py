@@ -0,0 +1,56 @@
+import json
+
+import pytest
+from pptx import Presentation
+
+from batch_runner import load_jobs, run_job
+from fake_llm import ReplayChatModel
+
+INPUT_DECK = "input/presentation.pptx"
+SLIDES = [{"tool": "add_title_slide", "title": "Review"}]
+
+
+def test_load_jobs_rejects_incomplete_jobs(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    path.write_text(json.dumps({"spec": SLIDES, "output": "a.pptx"}) + "\n\n" + json.dumps({"query": "Deck"}) + "\n")
+    with pytest.raises(ValueError, match="jobs.jsonl:3: a job needs an output path"):
+        load_jobs(str(path))
+
+
+def test_spec_job(tmp_path):
+    result = run_job({"id": "na", "spec": SLIDES, "output": str(tmp_path / "na.pptx")}, retries=0)
+
+    assert (result["status"], result["attempts"]) == ("ok", 1)
+    assert len(Presentation(result["output"]).slides) == 1
+
+
+def test_failing_job_is_retried(tmp_path):
+    job = {"id": "bad", "spec": [{"tool": "add_chart_slide"}], "output": str(tmp_path / "bad.pptx")}
+
+    result = run_job(job, retries=1, backoff=0)
+
+    assert (result["status"], result["attempts"]) == ("failed", 2)
+    assert result["error"].startswith("DeckSpecError")
+
+
+def test_template_job_with_failing_prompts_is_retried_and_fails(tmp_path, monkeypatch):
+    # Every planning call raises: strict replay models know no queries
+    monkeypatch.setattr("batch_runner._make_llm", lambda llm_name, replay_path: ReplayChatModel(strict=True))
+    job = {"id": "emea", "template": "month_end_closing", "output": str(tmp_path / "emea.pptx")}
+
+    result = run_job(job, retries=1, backoff=0)
+
+    assert result["status"] == "failed"
+    assert result["attempts"] == 2
+    assert "template prompts failed" in result["error"]
+
+
+def test_spec_job_keeps_the_input_and_config_of_the_spec(tmp_path):
+    spec = {"input": INPUT_DECK, "config": {"title_font_size": 20},
+            "slides": [{"tool": "add_title_slide", "title": "Appended"}]}
+    job = {"id": "na", "spec": spec, "output": str(tmp_path / "na.pptx")}
+
+    result = run_job(job, retries=0)
+
+    assert result["status"] == "ok"
+    assert len(Presentation(result["output"]).slides) == len(Presentation(INPUT_DECK).slides) + 1
@@ -0,0 +1,41 @@
+import pytest
+
+from chart_data import ChartDataError, load_category_data
+from tools import parse_waterfall_data
+
+BAD_CALLS = {
+    "add_bar_chart": {"categories_str": "Q1, Q2", "series_data_str": "Sales: 1, x", "title": "Bar"},
+    "add_line_chart": {"categories_str": "Q1, Q2", "series_data_str": "Sales: 1, 2, 3", "title": "Line"},
+    "add_pie_chart": {"categories_str": "A, B", "values_str": "1, x", "right_content": "Point", "title": "Pie",
+                      "plot_name": "Share"},
+    "add_area_chart": {"categories_str": "A, B", "values_str": "1, nan", "title": "Area", "plot_name": "Area"},
+    "add_waterfall_chart": {"categories_str": "Start, Change, End", "values_str": "100, 20, 120",
+                            "totals_str": "100, None", "title": "Waterfall"},
+}
+
+
+def test_category_data_from_series_string():
+    data = load_category_data("Q1, Q2, Q3", "Sales: 1, 2, 3; Costs: 4, 5, 6")
+    assert data.categories == ["Q1", "Q2", "Q3"]
+    assert data.names == ["Sales", "Costs"]
+    assert data.values.tolist() == [[1, 2, 3], [4, 5, 6]]
+
+
+def test_category_data_lists_every_problem():
+    with pytest.raises(ChartDataError) as raised:
+        load_category_data("Q1, Q2", "Sales: 1, x; 3, 4")
+    assert len(raised.value.errors) == 2
+
+
+@pytest.mark.parametrize("tool", sorted(BAD_CALLS))
+def test_bad_chart_data_adds_no_slide(make_tools, tool):
+    tools = make_tools(slides=1)
+    with pytest.raises(ChartDataError):
+        getattr(tools, tool)(**BAD_CALLS[tool])
+    assert len(tools.prs.slides) == 1
+
+
+def test_waterfall_totals_must_match_the_categories():
+    with pytest.raises(ChartDataError, match="3 categories but 2 totals"):
+        parse_waterfall_data("Start, Change, End", "100, 20, 120", "100, None")
+    assert parse_waterfall_data("Start, Change, End", "100, 20, 120", "100, None, 120")[2] == [100, None, 120]
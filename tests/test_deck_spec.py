@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from deck_spec import DeckSpecError, build_deck
+
+
+def _spec(tmp_path, *slides):
+    return {"output": str(tmp_path / "deck.pptx"), "slides": list(slides)}
+
+
+def test_slides_are_built_in_spec_order(tmp_path, titles):
+    path = build_deck(_spec(
+        tmp_path,
+        {"tool": "add_bullet_slide", "title": "Agenda", "content": "Revenue; Costs"},
+        {"tool": "add_table_slide", "table_data": "A, B; 1, 2", "title": "Table"},
+        {"tool": "add_bullet_slide", "title": "Summary", "content": "Point"},
+    ))
+    assert titles(path) == ["Agenda", "Table", "Summary"]
+
+
+def test_every_invalid_slide_is_reported(tmp_path):
+    spec = _spec(
+        tmp_path,
+        {"tool": "add_chart_slide", "title": "Unknown"},
+        {"tool": "add_bullet_slide", "title": "Missing content"},
+        {"tool": "add_bullet_slide", "title": "Bad position", "content": "Point", "insert_at": "top"},
+        {"tool": "add_image_slide", "image_path": "input/missing.png", "caption": "None", "title": "Image"},
+    )
+    with pytest.raises(DeckSpecError) as raised:
+        build_deck(spec)
+
+    errors = raised.value.errors
+    assert len(errors) == 4
+    assert errors[0].startswith("slide 1: unknown tool 'add_chart_slide'")
+    assert errors[1].startswith("slide 2 (add_bullet_slide)") and "content" in errors[1]
+    assert errors[2] == "slide 3 (add_bullet_slide): insert_at must be an integer, got 'top'"
+    assert errors[3] == "slide 4 (add_image_slide): image_path 'input/missing.png' does not exist"
+    assert not os.path.exists(tmp_path / "deck.pptx")
+
+
+def test_bad_chart_and_table_data_is_reported_before_building(tmp_path):
+    spec = _spec(
+        tmp_path,
+        {"tool": "add_title_slide", "title": "Review"},
+        {"tool": "add_bar_chart", "categories_str": "Q1, Q2", "series_data_str": "S: 1, x", "title": "Sales"},
+        {"tool": "add_scatter_chart", "input_x": "X; 1, 2", "input_y": "Y; a, b", "title": "XY", "plot_title": "XY"},
+        {"tool": "add_table_slide", "table_data": "A, B; 1, 2, 3", "title": "Table"},
+    )
+    with pytest.raises(DeckSpecError) as raised:
+        build_deck(spec)
+
+    errors = raised.value.errors
+    assert len(errors) == 3
+    assert errors[0].startswith("slide 2 (add_bar_chart)")
+    assert errors[1].startswith("slide 3 (add_scatter_chart)")
+    assert errors[2] == "slide 4 (add_table_slide): table row 1 has 3 cells but there are 2 headers"
+    assert not os.path.exists(tmp_path / "deck.pptx")
+
+
+def test_failing_slide_leaves_the_previous_deck(tmp_path):
+    build_deck(_spec(tmp_path, {"tool": "add_title_slide", "title": "First"}))
+    before = (tmp_path / "deck.pptx").read_bytes()
+
+    with pytest.raises(DeckSpecError, match="slide 2 \\(delete_slide\\)"):
+        build_deck(_spec(tmp_path, {"tool": "add_title_slide", "title": "Second"}, {"tool": "delete_slide", "index": 5}))
+
+    assert (tmp_path / "deck.pptx").read_bytes() == before
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from downsample import downsample_indices, lttb_indices
+from pptx import Presentation
+
+POINTS = 200
+
+
+def _chart_points(path):
+    chart = next(shape.chart for shape in Presentation(path).slides[0].shapes if shape.has_chart)
+    return len(list(chart.plots[0].series[0].values))
+
+
+@pytest.mark.parametrize("max_points", [50, "50"])
+def test_line_chart_max_points(tools, max_points):
+    categories = ", ".join(f"D{i}" for i in range(POINTS))
+    series = "S: " + ", ".join(str(i % 17) for i in range(POINTS))
+    tools.add_line_chart(categories, series, "Line", max_points=max_points)
+    assert _chart_points(tools.get_save_path()) == 50
+
+
+@pytest.mark.parametrize("tool, args", [
+    ("add_line_chart", ("A, B", "S: 1, 2", "Line")),
+    ("add_scatter_chart", ("X; 1, 2", "Y; 3, 4", "Scatter", "XY")),
+])
+def test_bad_max_points_raises_without_adding_a_slide(tools, tool, args):
+    with pytest.raises(ValueError):
+        getattr(tools, tool)(*args, max_points="many")
+    assert len(tools.prs.slides) == 0
+
+
+@pytest.mark.parametrize("max_points", [40, "40"])
+def test_scatter_chart_max_points(tools, max_points):
+    x = "X; " + ", ".join(str(i) for i in range(POINTS))
+    y = "Y; " + ", ".join(str(i % 23) for i in range(POINTS))
+    tools.add_scatter_chart(x, y, "Scatter", "XY", max_points=max_points)
+    assert _chart_points(tools.get_save_path()) == 40
+
+
+def test_lttb_keeps_the_endpoints_and_the_peak():
+    x = np.arange(1000, dtype=float)
+    y = np.zeros(1000)
+    y[567] = 10
+    keep = lttb_indices(x, y, 10)
+    assert len(keep) == 10
+    assert keep[0] == 0 and keep[-1] == 999
+    assert 567 in keep
+
+
+@pytest.mark.parametrize("series", [1, 4, 40, 300])
+@pytest.mark.parametrize("max_points", [2, 10, 100])
+def test_downsample_indices_stay_within_budget(series, max_points):
+    x = np.arange(1000, dtype=float)
+    ys = np.sin(x / (np.arange(series)[:, np.newaxis] + 7))
+    keep = downsample_indices(x, ys, max_points)
+    assert 0 < len(keep) <= max_points
+    assert np.all(np.diff(keep) > 0)
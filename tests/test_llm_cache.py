@@ -0,0 +1,36 @@
+import os
+
+from langchain_core.messages import AIMessage
+
+from llm_cache import RESCAN_EVERY, ResponseCache
+
+
+def _cache_bytes(directory):
+    return sum(os.path.getsize(os.path.join(root, file)) for root, _, files in os.walk(directory) for file in files)
+
+
+def test_round_trip(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    message = AIMessage(content="", tool_calls=[{"name": "add_title_slide", "args": {"title": "Q4"}, "id": "call_0"}])
+    cache.put("ab" * 32, message)
+    assert cache.get("ab" * 32).tool_calls == message.tool_calls
+    assert cache.get("cd" * 32) is None
+    assert cache.stats() == {"hits": 1, "misses": 1}
+
+
+def test_puts_do_not_walk_the_directory_until_it_is_full(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_bytes=10 ** 9)
+    for i in range(RESCAN_EVERY - 1):
+        cache.put(f"{i:064x}", AIMessage(content=f"answer {i}"))
+    assert cache.scans == 1
+
+
+def test_eviction_keeps_the_cache_under_max_bytes(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_bytes=20_000)
+    for i in range(200):
+        cache.put(f"{i:064x}", AIMessage(content="x" * 500))
+        assert _cache_bytes(str(tmp_path)) <= cache.max_bytes
+    # Oldest entries go first
+    assert cache.get(f"{0:064x}") is None
+    assert cache.get(f"{199:064x}") is not None
+    assert cache.scans < 50
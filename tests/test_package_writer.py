@@ -0,0 +1,75 @@
+import zipfile
+
+from pptx import Presentation
+
+from package_writer import IncrementalPackageWriter
+
+
+def _members(path):
+    with zipfile.ZipFile(path) as archive:
+        assert archive.testzip() is None
+        return {name: archive.read(name) for name in archive.namelist()}
+
+
+def _assert_matches_native_save(tools, tmp_path):
+    native = str(tmp_path / "native.pptx")
+    tools.prs.save(native)
+    incremental = _members(tools.get_save_path())
+    assert incremental == _members(native)
+    assert len(Presentation(tools.get_save_path()).slides) == len(tools.prs.slides)
+
+
+def test_save_after_edit_matches_native_save(tmp_path, make_tools):
+    tools = make_tools(slides=3)
+    tools.add_table_slide("A, B; 1, 2; 3, 4", "Table")
+    tools.add_bar_chart("Q1, Q2", "Sales: 1, 2", "Chart")
+    _assert_matches_native_save(tools, tmp_path)
+
+
+def test_unchanged_parts_are_reused(make_tools):
+    tools = make_tools(slides=3)
+    writer = tools.session.package_writer
+    tools.add_bullet_slide("Added", "Point")
+    stats = writer.last_stats
+    # The new slide, its rels, the presentation part and its rels, and [Content_Types].xml change
+    assert stats["compressed"] <= 6
+    assert stats["reused"] > stats["compressed"]
+
+    tools.session.write()
+    assert writer.last_stats["compressed"] == 0
+
+
+def test_dropped_slide_parts_are_not_carried_over(tmp_path, make_tools):
+    tools = make_tools(slides=3)
+    tools.add_bar_chart("Q1, Q2", "Sales: 1, 2", "Chart")
+    prs = tools.prs
+    sld_id = prs.slides._sldIdLst[-1]
+    prs.slides._sldIdLst.remove(sld_id)
+    prs.part.drop_rel(sld_id.rId)
+    tools.session.write()
+
+    assert not any(name.startswith("ppt/charts/") for name in _members(tools.get_save_path()))
+    _assert_matches_native_save(tools, tmp_path)
+
+
+def test_deleted_and_renamed_parts_are_not_carried_over(tmp_path, make_tools):
+    tools = make_tools(slides=4)
+    tools.add_bar_chart("Q1, Q2", "Sales: 1, 2", "Chart")
+    tools.delete_slide(0)
+    tools.delete_slide(3)
+
+    members = _members(tools.get_save_path())
+    assert "ppt/slides/slide5.xml" not in members
+    assert not any(name.startswith("ppt/charts/") for name in members)
+    _assert_matches_native_save(tools, tmp_path)
+
+
+def test_deck_loaded_from_a_template_is_copied_without_recompressing(tmp_path):
+    prs = Presentation("input/presentation.pptx")
+    path = str(tmp_path / "copy.pptx")
+    stats = IncrementalPackageWriter().save(prs, path, template_path="input/presentation.pptx")
+    native = str(tmp_path / "native.pptx")
+    prs.save(native)
+
+    assert stats["compressed"] == 0
+    assert _members(path) == _members(native)
@@ -0,0 +1,60 @@
+import pytest
+from pptx import Presentation
+
+from fake_llm import ReplayChatModel
+from plan import (PlanBindingError, bind_plan, load_plan, make_plan, placeholders, record_plan, replay_plan,
+                  save_plan)
+from session import PresentationSession
+
+INPUT_DECK = "input/presentation.pptx"
+QUERY = "Monthly review"
+CHART_CALLS = [
+    {"name": "add_bullet_slide", "args": {"title": "October review", "content": "Revenue; Costs"}},
+    {"name": "add_bar_chart", "args": {"categories_str": "Q1, Q2", "series_data_str": "Sales: 1, 2", "title": "Sales"}},
+]
+REFRESH_CALLS = [
+    {"name": "delete_slide", "args": {"index": 1}},
+    {"name": "move_slide", "args": {"index": 0, "insert_at": 3}},
+    {"name": "add_bullet_slide", "args": {"title": "November summary", "content": "Revenue; Costs", "insert_at": "2"}},
+]
+
+
+def _slide_texts(path):
+    return [[shape.text_frame.text for shape in slide.shapes if shape.has_text_frame]
+            for slide in Presentation(path).slides]
+
+
+def test_replay_applies_step_overrides(tmp_path, titles):
+    session = PresentationSession(save_path=str(tmp_path / "recorded.pptx"))
+    plan = record_plan(query=QUERY, llm=ReplayChatModel({QUERY: CHART_CALLS}), session=session)
+    assert [step["tool"] for step in plan["steps"]] == ["add_bullet_slide", "add_bar_chart"]
+
+    save_path = replay_plan(plan, {"1.title": "November review"}, output_path=str(tmp_path / "replayed.pptx"))
+    assert titles(save_path) == ["November review", "Sales"]
+
+
+def test_placeholders_are_bound_or_reported():
+    plan = make_plan([{"tool": "add_bar_chart", "args": {"categories_str": "{{months}}",
+                                                         "series_data_str": "Sales: {{sales}}", "title": "Sales"}}])
+    assert placeholders(plan) == {"months", "sales"}
+    assert bind_plan(plan, {"months": "Q1, Q2", "sales": "1, 2"})[0]["args"]["series_data_str"] == "Sales: 1, 2"
+
+    with pytest.raises(PlanBindingError) as raised:
+        bind_plan(plan, {"months": "Q1, Q2", "9.title": "Missing"})
+    assert len(raised.value.errors) == 2
+
+
+def test_replay_against_the_recorded_input_deck(tmp_path):
+    session = PresentationSession(input_path=INPUT_DECK, save_path=str(tmp_path / "recorded.pptx"),
+                                  config={"title_font_size": 32})
+    plan = record_plan(query=QUERY, llm=ReplayChatModel({QUERY: REFRESH_CALLS}), session=session)
+    save_plan(plan, str(tmp_path / "plan.json"))
+    plan = load_plan(str(tmp_path / "plan.json"))
+    assert plan["input"] == INPUT_DECK
+    assert plan["config"] == {"title_font_size": 32}
+
+    save_path = replay_plan(plan, output_path=str(tmp_path / "replayed.pptx"))
+
+    recorded = _slide_texts(str(tmp_path / "recorded.pptx"))
+    assert len(recorded) == len(Presentation(INPUT_DECK).slides)
+    assert _slide_texts(save_path) == recorded
@@ -0,0 +1,74 @@
+import os
+import shutil
+
+import pytest
+from lxml import etree
+
+from slide_cache import SLIDE_CACHE
+
+INPUT_DECK = "input/presentation.pptx"
+BULLETS = {"title": "Agenda", "content": "Key Financial Metrics; Variance Analysis; Action Items"}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    SLIDE_CACHE.clear()
+    yield
+    SLIDE_CACHE.clear()
+
+
+@pytest.fixture
+def hits():
+    """
+    Function returning the number of cache hits since the test started
+    """
+    before = SLIDE_CACHE.stats()["hits"]
+    return lambda: SLIDE_CACHE.stats()["hits"] - before
+
+
+def _slide_xml(tools):
+    return etree.tostring(tools.prs.slides[-1].shapes._spTree)
+
+
+def test_hit_reproduces_the_cold_render(make_tools, hits):
+    cold = make_tools(name="cold.pptx", config={"slide_cache": False})
+    cold.add_bullet_slide(**BULLETS)
+    first = make_tools(name="first.pptx")
+    first.add_bullet_slide(**BULLETS)
+    hit = make_tools(name="hit.pptx")
+    hit.add_bullet_slide(**BULLETS)
+
+    assert hits() == 1
+    assert _slide_xml(hit) == _slide_xml(first) == _slide_xml(cold)
+
+
+def test_config_change_misses(make_tools, hits):
+    make_tools(name="a.pptx").add_bullet_slide(**BULLETS)
+    make_tools(name="b.pptx", config={"title_font_size": 28}).add_bullet_slide(**BULLETS)
+    assert hits() == 0
+
+
+def test_template_change_misses(tmp_path, make_tools, hits):
+    template = str(tmp_path / "template.pptx")
+    shutil.copy(INPUT_DECK, template)
+    make_tools(name="a.pptx").add_bullet_slide(**BULLETS)
+    make_tools(name="b.pptx", input_path=template).add_bullet_slide(**BULLETS)
+    assert hits() == 0
+
+    make_tools(name="c.pptx", input_path=template).add_bullet_slide(**BULLETS)
+    assert hits() == 1
+    # An edited template (new mtime) is a different template
+    stat = os.stat(template)
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    make_tools(name="d.pptx", input_path=template).add_bullet_slide(**BULLETS)
+    assert hits() == 1
+
+
+def test_slide_with_other_relationships_is_not_stored(tools):
+    tools.add_image_slide("input/logo.png", "Logo", "Logo")
+    slide = tools.prs.slides[-1]
+    key = SLIDE_CACHE.key("add_image_slide", {"image_path": "input/logo.png"}, 5)
+
+    assert not SLIDE_CACHE.store(key, slide)
+    assert SLIDE_CACHE.uncacheable >= 1
+    assert SLIDE_CACHE.stats()["entries"] == 0
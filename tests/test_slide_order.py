@@ -0,0 +1,45 @@
+import collections
+import zipfile
+
+
+def _duplicate_members(path):
+    with zipfile.ZipFile(path) as archive:
+        return [name for name, count in collections.Counter(archive.namelist()).items() if count > 1]
+
+
+def test_add_after_delete_writes_unique_members(make_tools, titles):
+    tools = make_tools(slides=5)
+    tools.delete_slide(3)
+    tools.add_bullet_slide("Added", "Point")
+    tools.duplicate_slide(0)
+
+    path = tools.get_save_path()
+    assert _duplicate_members(path) == []
+    assert titles(path) == ["Slide 0", "Slide 0", "Slide 1", "Slide 2", "Slide 4", "Added"]
+
+
+def test_add_to_deck_with_gaps_in_slide_numbering(tmp_path, make_tools, titles):
+    source = make_tools(slides=5, name="source.pptx")
+    source.delete_slide(1)
+    # Reopen the saved deck after removing a slide without renumbering, as other editors may leave it
+    prs = source.prs
+    sld_id = prs.slides._sldIdLst[0]
+    prs.slides._sldIdLst.remove(sld_id)
+    prs.part.drop_rel(sld_id.rId)
+    prs.save(str(tmp_path / "gaps.pptx"))
+
+    tools = make_tools(name="out.pptx", input_path=str(tmp_path / "gaps.pptx"))
+    tools.add_bullet_slide("Added", "Point")
+    assert _duplicate_members(tools.get_save_path()) == []
+    assert titles(tools.get_save_path()) == ["Slide 2", "Slide 3", "Slide 4", "Added"]
+
+
+def test_positions_refer_to_the_original_order(make_tools, titles):
+    tools = make_tools(slides=5)
+    with tools.batch():
+        tools.add_bullet_slide("New first", "Point", insert_at="0")
+        tools.move_slide(4, 1)
+        tools.delete_slide(2)
+        tools.add_bullet_slide("New second", "Point", insert_at="2")
+
+    assert titles(tools.get_save_path()) == ["New first", "Slide 0", "Slide 4", "Slide 1", "New second", "Slide 3"]
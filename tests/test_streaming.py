@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+
+from fake_llm import ReplayChatModel
+from ppt_agent import PresentationAgent, _stream_enabled_by_env
+
+QUERY = "Three slides"
+CALLS = [{"name": "add_bullet_slide", "args": {"title": f"Slide {i}", "content": "First; Second"}} for i in range(3)]
+
+
+def _agent(tools):
+    return PresentationAgent(llm=ReplayChatModel({QUERY: CALLS}), session=tools.session, cache=False, stream=True)
+
+
+def test_stream_query_builds_slides_in_emitted_order(tools, titles):
+    agent = _agent(tools)
+    agent.stream_query(QUERY)
+
+    assert [step["args"]["title"] for step in agent.last_plan] == ["Slide 0", "Slide 1", "Slide 2"]
+    assert titles(agent.presentationtools.get_save_path()) == ["Slide 0", "Slide 1", "Slide 2"]
+
+
+def test_stream_query_inside_open_batch(tools, titles):
+    agent = _agent(tools)
+
+    def run():
+        with agent.presentationtools.batch():
+            agent.stream_query(QUERY)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout=30)
+    assert not thread.is_alive(), "stream_query blocked on the session lock held by the caller's batch"
+    assert agent.session.writes == 1
+    assert titles(agent.presentationtools.get_save_path()) == ["Slide 0", "Slide 1", "Slide 2"]
+
+
+class _WatchedStreamModel(ReplayChatModel):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.chunks = 0
+        self.closed = threading.Event()
+
+    def stream(self, messages, **kwargs):
+        try:
+            for chunk in super().stream(messages, **kwargs):
+                self.chunks += 1
+                yield chunk
+        finally:
+            self.closed.set()
+
+
+def test_failing_tool_call_stops_the_stream_reader(tools):
+    failing = {"name": "add_line_chart", "args": {"categories_str": "A, B", "series_data_str": "S: 1, 2",
+                                                  "title": "Line", "max_points": "many"}}
+    llm = _WatchedStreamModel({QUERY: [failing] + CALLS * 20}, latency=2.0)
+    agent = PresentationAgent(llm=llm, session=tools.session, cache=False, stream=True)
+
+    with pytest.raises(ValueError):
+        agent.stream_query(QUERY)
+
+    assert llm.closed.wait(timeout=5)
+    assert llm.chunks < 2 * (1 + len(CALLS) * 20)
+    assert len(tools.prs.slides) == 0
+
+
+def test_streaming_is_off_unless_enabled(monkeypatch):
+    monkeypatch.delenv("PPT_LLM_STREAM", raising=False)
+    assert not _stream_enabled_by_env()
+    monkeypatch.setenv("PPT_LLM_STREAM", "1")
+    assert _stream_enabled_by_env()
@@ -0,0 +1,21 @@
+from pptx import Presentation
+
+from table_xml import column_widths
+
+
+def test_table_cells_match_the_data(tools):
+    tools.add_table_slide("Item, Amount; Revenue & other income, <1.5M; Costs, 3", "Table")
+
+    table = next(shape.table for shape in Presentation(tools.get_save_path()).slides[0].shapes if shape.has_table)
+    assert [[cell.text for cell in row.cells] for row in table.rows] == [
+        ["Item", "Amount"], ["Revenue & other income", "<1.5M"], ["Costs", "3"]]
+    assert table.cell(0, 0).text_frame.paragraphs[0].font.bold
+    assert not table.cell(1, 0).text_frame.paragraphs[0].font.bold
+
+
+def test_long_cell_only_widens_its_own_column():
+    widths = column_widths(["Name", "Qty", "Note"], [["A", "1", "x" * 40], ["B", "2", ""]])
+    assert widths[0] == widths[1] == 1.5
+    assert widths[2] == 40 * 0.15
+
+    assert sum(column_widths(["A"] * 4, [["x" * 40] * 4])) <= 11
@@ -0,0 +1,65 @@
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import tracing
+from batch_runner import _init_worker, run_job
+
+
+def test_spans_and_nesting(tmp_path):
+    tracing.configure(str(tmp_path / "trace.jsonl"))
+    try:
+        with tracing.span("outer", "test") as outer:
+            with tracing.span("inner", "test", size=3):
+                pass
+            outer.set(done=True)
+    finally:
+        tracing.configure(None)
+    with open(tmp_path / "trace.jsonl", encoding="utf-8") as f:
+        inner, outer = [json.loads(line) for line in f]
+    assert (inner["name"], inner["parent"], inner["attrs"]) == ("inner", outer["id"], {"size": 3})
+    assert outer["attrs"] == {"done": True}
+    assert not tracing.span("off")
+
+
+def test_chrome_trace_has_an_event_per_span_and_thread(tmp_path):
+    running = threading.Barrier(3)
+
+    def work():
+        with tracing.span("tool.add_bullet_slide", "tool"):
+            running.wait(timeout=5)
+
+    tracing.configure(str(tmp_path / "trace.json"))
+    try:
+        threads = [threading.Thread(target=work) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        tracing.configure(None)
+    with open(tmp_path / "trace.json", encoding="utf-8") as f:
+        events = json.load(f)["traceEvents"]
+    assert [event["ph"] for event in events] == ["X"] * 3
+    assert len({event["tid"] for event in events}) == 3
+
+
+def test_chrome_trace_includes_batch_worker_spans(tmp_path):
+    path = str(tmp_path / "trace.json")
+    tracing.configure(path)
+    job = {"id": "spec", "spec": {"slides": [{"tool": "add_title_slide", "title": "Worker"}]},
+           "output": str(tmp_path / "deck.pptx")}
+    try:
+        with ProcessPoolExecutor(max_workers=1, initializer=_init_worker,
+                                 initargs=(None, False, tracing.settings())) as pool:
+            assert pool.submit(run_job, job, retries=0).result()["status"] == "ok"
+        assert tracing.merge_worker_traces() > 0
+    finally:
+        tracing.configure(None)
+
+    with open(path, encoding="utf-8") as f:
+        events = json.load(f)["traceEvents"]
+    worker_events = [event for event in events if event["pid"] != os.getpid()]
+    assert "tool.add_title_slide" in {event["name"] for event in worker_events}
+    assert sorted(os.listdir(tmp_path)) == ["deck.pptx", "trace.json"]
@@ -0,0 +1,218 @@
+import os
+import re
+import threading
+from functools import lru_cache
+
+# Where TrueType files are looked up on Windows, macOS and Linux
+FONT_DIRS = [
+    os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts"),
+    os.path.join(os.environ.get("LOCALAPPDATA", ""), "Microsoft", "Windows", "Fonts"),
+    "/Library/Fonts",
+    "/System/Library/Fonts",
+    "/System/Library/Fonts/Supplemental",
+    os.path.expanduser("~/Library/Fonts"),
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    os.path.expanduser("~/.fonts"),
+    os.path.expanduser("~/.local/share/fonts"),
+]
+
+# Metric-compatible substitutes tried after the family itself
+FONT_ALIASES = {
+    "calibri": ["carlito"],
+    "arial": ["liberationsans", "arimo"],
+    "helvetica": ["arial", "liberationsans", "arimo"],
+    "timesnewroman": ["times", "liberationserif", "tinos"],
+    "couriernew": ["liberationmono", "cousine"],
+}
+
+# File name suffixes used for each style by the common font packages
+STYLE_SUFFIXES = {
+    (False, False): ["", "regular", "r"],
+    (True, False): ["bold", "bd", "b"],
+    (False, True): ["italic", "i", "it", "oblique"],
+    (True, True): ["bolditalic", "bi", "z", "boldoblique"],
+}
+
+# Advance widths in em used when no font file is found
+_NARROW = set("iIjlt.,;:!|'`()[]{}")
+_WIDE = set("mwMW@%")
+_SPACE_EM = 0.28
+_NARROW_EM = 0.3
+_WIDE_EM = 0.85
+_UPPER_EM = 0.65
+_DEFAULT_EM = 0.52
+
+REFERENCE_SIZE = 1000  # Pixel size fonts are loaded at, widths are divided by it to get em
+POINTS_PER_INCH = 72
+
+
+class FontMetrics:
+    """
+    Advance widths of one font face. The font file is read once and the width of every
+    character is cached after its first lookup. Without a font file, widths come from a
+    heuristic by character class.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._font = None
+        if path is not None:
+            from PIL import ImageFont
+            self._font = ImageFont.truetype(path, REFERENCE_SIZE)
+        self._advances = {}
+        self._lock = threading.Lock()
+
+    def advance(self, char):
+        """
+        Width of a character in em
+        """
+        width = self._advances.get(char)
+        if width is None:
+            if self._font is not None:
+                with self._lock:
+                    width = self._font.getlength(char) / REFERENCE_SIZE
+            else:
+                width = _heuristic_advance(char)
+            self._advances[char] = width
+        return width
+
+    def text_width(self, text, size):
+        """
+        Width of a single line of text in points at the given font size
+        """
+        advances = self._advances
+        em = 0.0
+        for char in text:
+            width = advances.get(char)
+            em += width if width is not None else self.advance(char)
+        return em * size
+
+
+def _heuristic_advance(char):
+    if char.isspace():
+        return _SPACE_EM
+    if char in _NARROW:
+        return _NARROW_EM
+    if char in _WIDE:
+        return _WIDE_EM
+    if char.isupper():
+        return _UPPER_EM
+    if ord(char) > 0x2E80:  # CJK and other full width scripts
+        return 1.0
+    return _DEFAULT_EM
+
+
+def _normalize(name):
+    return re.sub(r"[\s_\-]", "", name).lower()
+
+
+@lru_cache(maxsize=1)
+def _font_index():
+    """
+    Map of normalized file name (without extension) to path for every font file found
+    """
+    index = {}
+    for font_dir in FONT_DIRS:
+        if not font_dir or not os.path.isdir(font_dir):
+            continue
+        for root, _, files in os.walk(font_dir):
+            for file in files:
+                stem, ext = os.path.splitext(file)
+                if ext.lower() in (".ttf", ".otf"):
+                    index.setdefault(_normalize(stem), os.path.join(root, file))
+    return index
+
+
+def find_font_file(family, bold=False, italic=False):
+    """
+    Path of the TrueType file for a font family and style, or None if it is not installed
+    """
+    index = _font_index()
+    family = _normalize(family)
+    for name in [family] + FONT_ALIASES.get(family, []):
+        for suffix in STYLE_SUFFIXES[(bool(bold), bool(italic))]:
+            path = index.get(name + suffix)
+            if path is not None:
+                return path
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_metrics(family="Calibri", bold=False, italic=False):
+    """
+    Shared FontMetrics for a font family and style, loaded once per process
+    """
+    path = find_font_file(family, bold, italic)
+    try:
+        return FontMetrics(path)
+    except (OSError, ImportError):
+        return FontMetrics(None)
+
+
+def count_lines(text, metrics, size, width):
+    """
+    Number of lines a paragraph wraps to
+    Args:
+        text: Paragraph text, "\\n" forces a line break
+        metrics: FontMetrics to measure with
+        size: Font size in points
+        width: Available width in points
+    """
+    space = metrics.advance(" ") * size
+    lines = 0
+    for segment in text.split("\n"):
+        lines += 1
+        line_width = 0.0
+        for word in segment.split():
+            word_width = metrics.text_width(word, size)
+            if line_width == 0.0:
+                line_width = word_width
+            elif line_width + space + word_width <= width:
+                line_width += space + word_width
+            else:
+                lines += 1
+                line_width = word_width
+            # Words longer than a line are broken across lines
+            while line_width > width:
+                lines += 1
+                line_width -= width
+    return lines
+
+
+def text_height(paragraphs, width, size, family="Calibri", bold=False, italic=False,
+                line_spacing=1.2, space_before=0, space_after=0):
+    """
+    Height in inches of paragraphs laid out in a box of the given width (inches)
+    """
+    metrics = get_metrics(family, bold, italic)
+    width_pt = width * POINTS_PER_INCH
+    lines = sum(count_lines(paragraph, metrics, size, width_pt) for paragraph in paragraphs)
+    spacing = (space_before + space_after) * len(paragraphs)
+    return (lines * size * line_spacing + spacing) / POINTS_PER_INCH
+
+
+def fit_font_size(paragraphs, width, height, max_size, min_size=8, family="Calibri", bold=False, italic=False,
+                  line_spacing=1.2, space_before=0, space_after=0, inset_x=0.1, inset_y=0.05):
+    """
+    Largest whole font size, at most max_size, at which the paragraphs fit a text box.
+    Args:
+        paragraphs: Paragraph texts
+        width: Box width in inches
+        height: Box height in inches
+        max_size: Preferred font size in points
+        min_size: Smallest size returned, even if the text still overflows
+        space_before: Paragraph space before in points
+        space_after: Paragraph space after in points
+        inset_x: Left and right text frame inset in inches
+        inset_y: Top and bottom text frame inset in inches
+    Returns:
+        Font size in points
+    """
+    width -= 2 * inset_x
+    height -= 2 * inset_y
+    for size in range(int(max_size), int(min_size), -1):
+        if text_height(paragraphs, width, size, family, bold, italic,
+                       line_spacing, space_before, space_after) <= height:
+            return size
+    return int(min_size)
@@ -105,6 +105,23 @@ TOOL_DESCRIPTIONS = {
         **Usage**:
         add_table_slide(title='Comparison Table', table_data='Header1, Header2; Value1, Value2; Value3, Value4', insert_at="5")
     """,
+    "add_table_from_source": """
+        Purpose: Add a table read from a CSV or Parquet file, split across as many slides as needed.
+
+        **Key Use Cases**:
+        - Presenting tables that are too long for a single slide.
+        - Showing data exported to a file instead of typed into the prompt.
+
+        **Input Format**:
+        - `source`: Path to a .csv, .tsv or .parquet file; the first row (or the schema) gives the headers.
+        - `title`: Title of the first slide; continuation slides get "(cont.)".
+        - `rows_per_slide`: Optional number of data rows per slide (default 15).
+        - `insert_at`: Optional parameter specifying the slide index where the first slide should be inserted. (e.g., insert_at="2")
+          Use this parameter only when the prompt explicitly says "insert a slide at X index."
+
+        **Usage**:
+        add_table_from_source(source='data/regional_sales.csv', title='Regional Sales', rows_per_slide=12)
+    """,
     "add_bar_chart": """
         Purpose: Create a slide with a clustered bar chart for comparing multiple data series.
 
@@ -135,6 +152,7 @@ TOOL_DESCRIPTIONS = {
         - `title`: Title of the slide.
         - `insert_at`: Optional parameter specifying the slide index where the slide should be inserted. (e.g., insert_at="2")
           Use this parameter only when the prompt explicitly says "insert a slide at X index."
+        - `max_points`: Optional point budget for very long data (e.g., max_points=2000); extra points are downsampled keeping peaks and shape.
 
         **Usage**:
         add_line_chart(categories_str='Q1 Sales, Q2 Sales, Q3 Sales', series_data_str='West: 30, 28, 35; East: 25, 30, 20; Midwest: 20, 18, 25', title='Line Chart Slide', insert_at="3")
@@ -190,8 +208,39 @@ TOOL_DESCRIPTIONS = {
         - `plot_title`: Title of the scatter plot.
         - `insert_at`: Optional parameter specifying the slide index where the slide should be inserted. (e.g., insert_at="2")
           Use this parameter only when the prompt explicitly says "insert a slide at X index."
+        - `max_points`: Optional point budget for very long data (e.g., max_points=2000); extra points are downsampled keeping peaks and shape.
 
         **Usage**:
         add_scatter_chart(input_x='Production; 100, 200, 300', input_y='Defects; 2, 3, 1', title='Production vs Defects', plot_title='Scatter Plot', insert_at="2")
+    """,
+    "move_slide": """
+        Purpose: Move an existing slide to another position.
+
+        **Input Format**:
+        - `index`: 0-based index of the slide to move.
+        - `insert_at`: 0-based position the slide should end up at.
+          Indices always refer to the deck as it was before this request, even after earlier slides were inserted or moved.
+
+        **Usage**:
+        move_slide(index=5, insert_at=1)
+    """,
+    "delete_slide": """
+        Purpose: Delete an existing slide.
+
+        **Input Format**:
+        - `index`: 0-based index of the slide to delete, in the deck as it was before this request.
+
+        **Usage**:
+        delete_slide(index=3)
+    """,
+    "duplicate_slide": """
+        Purpose: Copy an existing slide, including its charts, tables and images.
+
+        **Input Format**:
+        - `index`: 0-based index of the slide to copy, in the deck as it was before this request.
+        - `insert_at`: Optional 0-based position of the copy; by default it is placed right after the original.
+
+        **Usage**:
+        duplicate_slide(index=2, insert_at=6)
     """
 }
@@ -1,28 +1,101 @@
 # from langchain_core.tools import tool
-from pptx import Presentation
-from pptx.chart.data import XyChartData
 from pptx.chart.data import CategoryChartData, ChartData
 from pptx.enum.chart import XL_CHART_TYPE, XL_DATA_LABEL_POSITION
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.chart import XL_LABEL_POSITION, XL_LEGEND_POSITION
+from pptx.oxml.ns import qn
+from pptx.oxml.xmlchemy import OxmlElement
 from typing import Optional
-import matplotlib.pyplot as plt
-import numpy as np
-from abc import ABC
-# import Annotated
-from typing import Annotated
-from pydantic import BaseModel
-from langchain.tools import tool
-from langchain.tools import StructuredTool
+from contextlib import contextmanager
 from tool_descriptions import TOOL_DESCRIPTIONS
+from chart_render import render_waterfall_png, waterfall_layout, waterfall_label
+from image_pipeline import IMAGE_PIPELINE
+from session import PresentationSession
+from table_source import open_table_source, paginate
+from table_xml import column_widths, fill_table
+from text_layout import fit_font_size
+from chart_data import ChartDataError, load_axis, load_category_data, load_values, xy_chart_data
+from downsample import downsample_indices, lttb_indices
+from slide_cache import SLIDE_CACHE
+import numpy as np
 
+import io
 import os
 from load_dotenv import load_dotenv
 load_dotenv()
 
-SAVE_PATH = "output/presentation_test.pptx"
-INPUT_PATH = None
+# Slide builders exposed to the agent and to declarative deck specs
+SLIDE_TOOLS = (
+    "add_image_slide",
+    "add_text_with_image_slide",
+    "add_bullet_slide",
+    "add_two_content_bullet_slide",
+    "add_table_slide",
+    "add_table_from_source",
+    "add_bar_chart",
+    "add_line_chart",
+    "add_pie_chart",
+    "add_area_chart",
+    "add_scatter_chart",
+    "add_waterfall_chart",
+    "add_title_slide",
+)
+
+# Operations on existing slides; indices refer to the deck as it was when the batch started
+DECK_TOOLS = (
+    "move_slide",
+    "delete_slide",
+    "duplicate_slide",
+)
+
+
+def parse_table_data(table_data):
+    """
+    Headers and rows of cell texts from "header1, header2; value1, value2; value3, value4"
+    """
+    rows = table_data.split(';')
+    headers = [header.strip() for header in rows[0].split(',')]
+    values = [[value.strip() for value in row.split(',')] for row in rows[1:]]
+    return headers, values
+
+
+def parse_waterfall_data(categories_str, values_str, totals_str=None):
+    """
+    Categories, incremental values and totals of a waterfall chart; totals are calculated when
+    not given, "None" marks a bar that is not a total
+    Raises:
+        ChartDataError: when values or totals are not numeric or do not match the categories
+    """
+    categories = [c.strip() for c in categories_str.split(",")]
+    values = load_values(values_str).tolist()
+    errors = []
+    if len(values) != len(categories):
+        errors.append(f"{len(categories)} categories but {len(values)} values")
+    if totals_str:
+        try:
+            totals = [float(v.strip()) if v.strip().lower() != "none" else None for v in totals_str.split(",")]
+        except ValueError as e:
+            raise ChartDataError([f"totals: {e}"]) from None
+        if len(totals) != len(categories):
+            errors.append(f"{len(categories)} categories but {len(totals)} totals")
+    else:
+        # Auto-calculate totals
+        totals = []
+        cumulative_sum = values[0]
+        for i, value in enumerate(values):
+            if i == 0:
+                totals.append(value)
+            elif value == cumulative_sum:
+                totals.append(value)
+                cumulative_sum = value
+            else:
+                totals.append(None)
+                cumulative_sum += value
+    if errors:
+        raise ChartDataError(errors)
+    return categories, values, totals
+
 
 class Presentationtools:
     """
@@ -31,33 +104,72 @@ class Presentationtools:
     name: str = "presentation_tools"
     description: str = "Tools for interacting with PowerPoint slides"
 
-    def __init__(self, mode="normal"):
-        self.config = {
-            "title_font_size": 40,
-            "slide_width": 13.33,
-            "slide_height": 7.5
-        }
+    def __init__(self, mode="normal", session=None):
+        """
+        Args:
+            mode: "normal" or a template name; templates are saved to output/<mode>.pptx
+            session: PresentationSession to build into, a new one is created if not given
+        """
         self.mode = mode
+        self.session = session if session is not None else PresentationSession.for_mode(mode)
 
-    @staticmethod
-    def use_presentation(folder_path: str, file_path: str):
+    @property
+    def config(self):
+        return self.session.config
+
+    @property
+    def prs(self):
+        return self.session.presentation
+
+    @property
+    def skipped_saves(self):
+        return self.session.skipped_saves
+
+    @property
+    def image_bytes_saved(self):
+        return self.session.image_bytes_saved
+
+    def use_presentation(self, folder_path: str, file_path: str):
         """
         Load an existing presentation file
         Args:
-            file_path: Path to the presentation file
+            folder_path: Folder containing the presentation
+            file_path: Name of the presentation file
         """
-        global INPUT_PATH, SAVE_PATH
-        INPUT_PATH = folder_path + "/" + file_path
-        SAVE_PATH = "output/" + file_path
-        print(f"Presentation loaded from: {INPUT_PATH}")
-        print(f"Presentation will be saved to: {SAVE_PATH}")
+        self.session.use_presentation(folder_path, file_path)
+
+    def _new_slide(self, insert_at=None, layout_index=5):
+        """
+        Add a slide using the given layout, appended or inserted at `insert_at`.
+        Positions refer to the deck as it was when the batch started and are applied when it is saved.
+        """
+        self.prs.slide_width = Inches(self.config['slide_width'])
+        self.prs.slide_height = Inches(self.config['slide_height'])
+        position = None if insert_at is None else int(insert_at)
+        return self.session.slide_order.add_slide(self.prs, self.prs.slide_layouts[layout_index], position)
+
+    def _slide_key(self, tool, layout_index=5, **args):
+        """
+        Slide cache key for a text-only tool invocation, None when the cache is disabled
+        """
+        if not self.config["slide_cache"]:
+            return None
+        return SLIDE_CACHE.key(tool, args, layout_index, self.session.input_path, self.config)
 
     @staticmethod
-    def get_presentation():
-        if INPUT_PATH is not None:
-            return Presentation(INPUT_PATH)
-        else:
-            return Presentation()
+    def _add_downsampling_note(slide, original_points, rendered_points):
+        """
+        Record in the slide notes that a chart shows fewer points than its data has
+        """
+        notes = slide.notes_slide.notes_text_frame
+        line = f"Chart downsampled with LTTB: {original_points} points in the data, {rendered_points} rendered."
+        notes.text = f"{notes.text}\n{line}" if notes.text else line
+
+    def _fit_font_size(self, paragraphs, width, height, max_size, **kwargs):
+        """
+        Largest font size up to max_size at which the paragraphs fit a text box of width x height inches
+        """
+        return fit_font_size(paragraphs, width, height, max_size, family=self.config["body_font"], **kwargs)
 
 
     def add_image_slide(self, image_path: str, caption: str, title: str, insert_at: str = None):
@@ -68,16 +180,7 @@ class Presentationtools:
             caption: caption text
             title: Title of the slide
         """
-        if not hasattr(self, "prs"):
-            self.prs = self.get_presentation()
-
-        self.prs.slide_width = Inches(13.33) 
-        self.prs.slide_height = Inches(7.5)
-
-        if insert_at is None:
-            slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])
-        else:
-            slide = self.insert_slide(self.prs, layout_index=5, position=int(insert_at))
+        slide = self._new_slide(insert_at)
 
         title_shape = slide.shapes.title
         title_shape.text = title  
@@ -93,7 +196,7 @@ class Presentationtools:
         width = 4
         height = 4
         pic = slide.shapes.add_picture(
-            image_path,
+            self.prepare_image(image_path, width, height),
             Inches(left),
             top,
             width=Inches(width),
@@ -109,7 +212,13 @@ class Presentationtools:
             txBox = slide.shapes.add_textbox(Inches(left), top, width, height)
             tf = txBox.text_frame
             tf.text = caption
-            tf.fit_text(font_family="Arial", max_size=12, italic=True)
+            tf.word_wrap = True
+            size = fit_font_size(caption.split("\n"), 4, 1, max_size=12, family="Arial", italic=True)
+            for paragraph in tf.paragraphs:
+                for run in paragraph.runs:
+                    run.font.name = "Arial"
+                    run.font.size = Pt(size)
+                    run.font.italic = True
             
         return self.save_presentation()
     
@@ -123,16 +232,7 @@ class Presentationtools:
             image_path: Path to the image file.
             title: Title of the slide.
         """
-        if not hasattr(self, "prs"):
-            self.prs = self.get_presentation()
-
-        self.prs.slide_width = Inches(self.config['slide_width']) 
-        self.prs.slide_height = Inches(self.config['slide_height'])
-
-        if insert_at is None:
-            slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])
-        else:
-            slide = self.insert_slide(self.prs, layout_index=5, position=int(insert_at))
+        slide = self._new_slide(insert_at)
 
         title_shape = slide.shapes.title
         title_shape.text = title
@@ -143,21 +243,23 @@ class Presentationtools:
         text_frame = left_text_box.text_frame
         text_frame.word_wrap = True
 
-        paragraphs = text_content.split('\n\n')
+        paragraphs = [paragraph.strip() for paragraph in text_content.split('\n\n')]
+        font_size = self._fit_font_size(paragraphs, 4, 4.5, max_size=14, space_after=10)
         for i, paragraph in enumerate(paragraphs):
             if i == 0:
                 p = text_frame.paragraphs[0] 
             else:
                 p = text_frame.add_paragraph()
-            p.text = paragraph.strip()
-            p.font.size = Pt(14)
+            p.text = paragraph
+            p.font.size = Pt(font_size)
             p.space_after = Pt(10) 
 
         img_left = Inches(5)  
         img_top = Inches(2)
         img_width = Inches(4) 
         img_height = Inches(4.5)
-        slide.shapes.add_picture(image_path, img_left, img_top, width=img_width, height=img_height)
+        image = self.prepare_image(image_path, img_width.inches, img_height.inches)
+        slide.shapes.add_picture(image, img_left, img_top, width=img_width, height=img_height)
 
         # Save the presentation
         file_path = self.save_presentation()
@@ -171,16 +273,10 @@ class Presentationtools:
             content: String of bullet points separated by semicolons
             Example: "First point; Second point; Third point"
         """
-        if not hasattr(self, "prs"):
-            self.prs = self.get_presentation()
-
-        self.prs.slide_width = Inches(self.config['slide_width']) 
-        self.prs.slide_height = Inches(self.config['slide_height'])
-            
-        if insert_at is None:
-            slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])  # Use blank layout
-        else:
-            slide = self.insert_slide(self.prs, layout_index=5, position=int(insert_at))
+        slide = self._new_slide(insert_at)
+        memo_key = self._slide_key("add_bullet_slide", title=title, content=content)
+        if SLIDE_CACHE.restore(memo_key, slide):
+            return self.save_presentation()
 
         # Add title
         title_shape = slide.shapes.title
@@ -200,18 +296,20 @@ class Presentationtools:
         text_frame.word_wrap = True
         
         # Add bullet points
-        bullet_points = [point.strip() for point in content.split(';')]
+        bullet_points = ["• " + point.strip() for point in content.split(';')]
+        font_size = self._fit_font_size(bullet_points, 10, 5, max_size=20, space_after=12)
         
         for i, point in enumerate(bullet_points):
             if i == 0:
                 p = text_frame.paragraphs[0]
             else:
                 p = text_frame.add_paragraph()
-            p.text = "• " + point
-            p.font.size = Pt(20)
+            p.text = point
+            p.font.size = Pt(font_size)
             # p.font.name = 'Arial'
             p.space_after = Pt(12)
         
+        SLIDE_CACHE.store(memo_key, slide)
         return self.save_presentation()
     
     def add_two_content_bullet_slide(self, title: str, left_content: str, right_content: str, insert_at: str = None):
@@ -225,17 +323,11 @@ class Presentationtools:
                 left_content = "Point 1; Point 2; Point 3"
                 right_content = "Item A; Item B; Item C"
         """
-        if not hasattr(self, "prs"):
-            self.prs = self.get_presentation()
-        
-        # Set slide dimensions for 16:9 aspect ratio
-        self.prs.slide_width = Inches(13.33)
-        self.prs.slide_height = Inches(7.5)
-
-        if insert_at is None:
-            slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])  # Using blank layout
-        else:
-            slide = self.insert_slide(self.prs, layout_index=5, position=int(insert_at))
+        slide = self._new_slide(insert_at)
+        memo_key = self._slide_key("add_two_content_bullet_slide", title=title,
+                                   left_content=left_content, right_content=right_content)
+        if SLIDE_CACHE.restore(memo_key, slide):
+            return self.save_presentation()
         
         # Add title
         title_shape = slide.shapes.title
@@ -253,14 +345,20 @@ class Presentationtools:
         left_frame = left_box.text_frame
         left_frame.word_wrap = True
 
+        # Add bullet character, both columns share the size that fits the fuller one
+        left_points = ["• " + point.strip() for point in left_content.split(';')]
+        right_points = ["• " + point.strip() for point in right_content.split(';')]
+        font_size = min(self._fit_font_size(points, 5, 4, max_size=20, space_before=12)
+                        for points in (left_points, right_points))
+
         # Add left content with bullet points
-        for i, point in enumerate(left_content.split(';')):
+        for i, point in enumerate(left_points):
             if i == 0:
                 p = left_frame.paragraphs[0]
             else:
                 p = left_frame.add_paragraph()
-            p.text = "• " + point.strip()  # Add bullet character
-            p.font.size = Pt(20)
+            p.text = point
+            p.font.size = Pt(font_size)
             p.space_before = Pt(12)
         
         # Create right textbox
@@ -270,15 +368,16 @@ class Presentationtools:
         right_frame.word_wrap = True
 
         # Add right content with bullet points
-        for i, point in enumerate(right_content.split(';')):
+        for i, point in enumerate(right_points):
             if i == 0:
                 p = right_frame.paragraphs[0]
             else:
                 p = right_frame.add_paragraph()
-            p.text = "• " + point.strip()  # Add bullet character
-            p.font.size = Pt(20)
+            p.text = point
+            p.font.size = Pt(font_size)
             p.space_before = Pt(12)
         
+        SLIDE_CACHE.store(memo_key, slide)
         return self.save_presentation()
         
     def add_table_slide(self, table_data: str, title: str, insert_at: str = None):
@@ -289,56 +388,76 @@ class Presentationtools:
             title: Title of the slide
             Example: "Car, Bike; BMW, Harley; Audi, Ducati; Mercedes, Honda"
         """
-        if not hasattr(self, "prs"):
-            self.prs = self.get_presentation() 
+        headers, values = parse_table_data(table_data)
 
-        self.prs.slide_width = Inches(self.config['slide_width']) 
-        self.prs.slide_height = Inches(self.config['slide_height'])
+        slide = self._new_slide(insert_at)
+        memo_key = self._slide_key("add_table_slide", table_data=table_data, title=title)
+        if not SLIDE_CACHE.restore(memo_key, slide):
+            self._add_table_title(slide, title)
+            self._add_table(slide, headers, values)
+            SLIDE_CACHE.store(memo_key, slide)
 
-        rows = table_data.split(';')
-        headers = rows[0].split(',')
-        values = [row.split(',') for row in rows[1:]]
-        
-        table_data = {}
-        for i, header in enumerate(headers):
-            table_data[header] = [row[i] for row in values]
-        
-        if insert_at is None:
-            slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])
-        else:
-            slide = self.insert_slide(self.prs, layout_index=5, position=int(insert_at))
+        file_path = self.save_presentation()
+        return file_path
+
+    def add_table_from_source(self, source: str, title: str, rows_per_slide: int = 15, insert_at: str = None):
+        """
+        Add a table from a CSV/Parquet file (or an iterable of rows, header first), split across
+        as many slides as needed with the header repeated on each. Rows are streamed, so memory
+        use does not grow with the size of the input.
+        Args:
+            source: Path to a .csv, .tsv or .parquet file, or an iterable of rows
+            title: Title of the first slide; continuation slides get "(cont.)"
+            rows_per_slide: Data rows per slide
+        """
+        headers, rows = open_table_source(source)
+        rows_per_slide = max(1, int(rows_per_slide))
+
+        slides = 0
+        for page in paginate(rows, rows_per_slide):
+            # Slides inserted at the same position keep the order they were added in
+            slide = self._new_slide(insert_at)
+            self._add_table_title(slide, title if slides == 0 else f"{title} (cont.)")
+            self._add_table(slide, headers, page)
+            slides += 1
+
+        if slides == 0:
+            # Header only: still show the (empty) table
+            slide = self._new_slide(insert_at)
+            self._add_table_title(slide, title)
+            self._add_table(slide, headers, [])
+            slides = 1
 
+        file_path = self.save_presentation()
+        return f"Table split across {slides} slide(s) and saved at: {file_path}"
+
+    def _add_table_title(self, slide, title):
         title_shape = slide.shapes.title
         title_shape.text = title 
         title_shape.text_frame.paragraphs[0].font.size = Pt(self.config["title_font_size"])
         title_shape.text_frame.paragraphs[0].font.bold = True
         title_shape.text_frame.paragraphs[0].alignment = 1
 
+    @staticmethod
+    def _add_table(slide, headers, values):
+        """
+        Add a centered, styled table with a bold header row
+        Args:
+            headers: Header texts
+            values: Rows of cell texts; short rows are padded with empty cells
+        """
         # Calculate dimensions and position
-        rows = len(list(table_data.values())[0]) + 1
-        cols = len(table_data.keys())
+        rows = len(values) + 1
+        cols = len(headers)
         
-        # Calculate table width and height based on content
-        max_text_len = max(
-            max(len(str(val)) for vals in table_data.values() for val in vals),
-            max(len(str(key)) for key in table_data.keys())
-        )
-        
-        # Base cell dimensions
-        cell_width = max(1.5, max_text_len * 0.15)  # Minimum 1.5 inches
-        table_width = cell_width * cols
+        # Width of each column from the longest text in that column
+        col_widths = column_widths(headers, values)
+        table_width = sum(col_widths)
         cell_height = 0.4  # Base height per cell
         table_height = cell_height * rows
         
         # Maximum allowed dimensions
-        max_width = 11  # Maximum table width (leaving margins)
         max_height = 5  # Maximum table height (leaving space for title)
-        
-        # Only scale if table exceeds slide bounds
-        if table_width > max_width:
-            scale = max_width / table_width
-            table_width = max_width
-            cell_width *= scale
             
         if table_height > max_height:
             scale = max_height / table_height
@@ -349,34 +468,13 @@ class Presentationtools:
         left = (13.33 - table_width) / 2  # Center horizontally
         top = (7.5 - table_height) / 2 + 0.5  # Center vertically with offset for title
 
-        table = slide.shapes.add_table(rows, cols, Inches(left), Inches(top), 
+        table = slide.shapes.add_table(1, cols, Inches(left), Inches(top), 
                                      Inches(table_width), Inches(table_height)).table
         
-        # Style the table
-        for i, key in enumerate(table_data.keys()):
-            cell = table.cell(0, i)
-            cell.text = key.strip()
-            paragraph = cell.text_frame.paragraphs[0]
-            paragraph.font.bold = True
-            paragraph.font.size = Pt(12)
-            
-            for j, value in enumerate(table_data[key]):
-                cell = table.cell(j + 1, i)
-                cell.text = value.strip()
-                paragraph = cell.text_frame.paragraphs[0]
-                paragraph.font.size = Pt(11)
-        
-        # Apply cell padding and alignment
-        for row in table.rows:
-            for cell in row.cells:
-                cell.margin_left = cell.margin_right = Inches(0.1)
-                cell.margin_top = cell.margin_bottom = Inches(0.05)
-                cell.vertical_anchor = 1  # Center vertical alignment
-                for paragraph in cell.text_frame.paragraphs:
-                    paragraph.alignment = 1  # Center horizontal alignment
-        
-        file_path = self.save_presentation()
-        return file_path
+        # Write all cells, fonts, padding and alignment in one pass
+        fill_table(table, headers, values, col_widths, cell_height, header_size=12, body_size=11,
+                   margin_x=Inches(0.1), margin_y=Inches(0.05), align="l", anchor="t")
+        return table
 
 
     def add_bar_chart(self, categories_str: str, series_data_str: str, title: str, insert_at: str = None) -> str:
@@ -394,16 +492,11 @@ class Presentationtools:
             categories_str = "East, West, Midwest"
             series_data_str = "Q1: 19.2, 21.4, 16.7; Q2: 22.3, 28.6, 15.2; Q3: 20.4, 26.3, 14.2"
         """
-        if not hasattr(self, "prs"):
-            self.prs = self.get_presentation()
+        # Parse and validate the series data before the slide is added, so bad data leaves no empty slide
+        chart_data = load_category_data(categories_str, series_data_str).to_chart_data(ChartData)
 
-        self.prs.slide_width = Inches(self.config['slide_width']) 
-        self.prs.slide_height = Inches(self.config['slide_height'])
         # Create a new slide
-        if insert_at is None:
-            slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])
-        else:
-            slide = self.insert_slide(self.prs, layout_index=5, position=int(insert_at))
+        slide = self._new_slide(insert_at)
 
         # Set slide title with custom font size
         title_shape = slide.shapes.title
@@ -412,17 +505,6 @@ class Presentationtools:
         title_shape.text_frame.paragraphs[0].font.bold = True
         title_shape.text_frame.paragraphs[0].alignment = 1
 
-        # Initialize the chart data
-        chart_data = ChartData()
-        chart_data.categories = [c.strip() for c in categories_str.split(",")]
-
-        # Process multiple series data
-        series_entries = series_data_str.split(";")
-        for series_entry in series_entries:
-            series_name, series_values = series_entry.split(":")
-            values = [float(v.strip()) for v in series_values.split(",")]
-            chart_data.add_series(series_name.strip(), values)
-
         # Add the clustered bar chart
         x, y, cx, cy = Inches(2), Inches(2), Inches(6), Inches(4.5)
         chart = slide.shapes.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, x, y, cx, cy, chart_data).chart
@@ -446,7 +528,7 @@ class Presentationtools:
 
 
 
-    def add_line_chart(self, categories_str: str, series_data_str: str, title: str, insert_at: str = None, **kwargs) -> str:
+    def add_line_chart(self, categories_str: str, series_data_str: str, title: str, insert_at: str = None, max_points: int = None, **kwargs) -> str:
         """
         Create a slide with a multi-series line chart.
 
@@ -456,17 +538,14 @@ class Presentationtools:
             series_data_str: String of series data in the format:
                             "West: 30, 28, 35; East: 25, 30, 20; Midwest: 20, 18, 25"
             title: Title of the slide.
+            max_points: Optional point budget; longer series are downsampled with LTTB
         """
-        if not hasattr(self, "prs"):
-            self.prs = self.get_presentation()
-
-        self.prs.slide_width = Inches(self.config['slide_width']) 
-        self.prs.slide_height = Inches(self.config['slide_height'])
+        # Parsed before the slide is added so bad input does not leave an empty slide behind;
+        # max_points may arrive as a string from the model
+        data = load_category_data(categories_str, series_data_str)
+        max_points = int(max_points or self.config["max_chart_points"] or 0)
 
-        if insert_at is None:
-            slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])
-        else:
-            slide = self.insert_slide(self.prs, layout_index=5, position=int(insert_at))
+        slide = self._new_slide(insert_at)
 
         title_shape = slide.shapes.title
         title_shape.text = title 
@@ -474,14 +553,11 @@ class Presentationtools:
         title_shape.text_frame.paragraphs[0].font.bold = True
         title_shape.text_frame.paragraphs[0].alignment = 1
 
-        chart_data = CategoryChartData()
-        chart_data.categories = [c.strip() for c in categories_str.split(",")]
-
-        series_entries = series_data_str.split(";")
-        for series_entry in series_entries:
-            series_name, series_values = series_entry.split(":")
-            values = [float(v.strip()) for v in series_values.split(",")]
-            chart_data.add_series(series_name.strip(), values)
+        original_points = len(data)
+        if max_points and original_points > max_points:
+            data = data.take(downsample_indices(np.arange(original_points), data.values, max_points))
+            self._add_downsampling_note(slide, original_points, len(data))
+        chart_data = data.to_chart_data()
 
         x, y, cx, cy = Inches(3.5), Inches(2), Inches(6), Inches(4.5)
         slide.shapes.add_chart(XL_CHART_TYPE.LINE_MARKERS, x, y, cx, cy, chart_data)
@@ -501,16 +577,9 @@ class Presentationtools:
             title: Title of the slide
             plot_name: Title of the pie chart
         """
-        if not hasattr(self, "prs"):
-            self.prs = self.get_presentation()
+        chart_data = load_category_data(categories_str, values_str, name=plot_name).to_chart_data()
 
-        self.prs.slide_width = Inches(self.config['slide_width']) 
-        self.prs.slide_height = Inches(self.config['slide_height'])
-
-        if insert_at is None:
-            slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])
-        else:
-            slide = self.insert_slide(self.prs, layout_index=5, position=int(insert_at))
+        slide = self._new_slide(insert_at)
 
         title_shape = slide.shapes.title
         title_shape.text = title  
@@ -518,10 +587,6 @@ class Presentationtools:
         title_shape.text_frame.paragraphs[0].font.bold = True
         title_shape.text_frame.paragraphs[0].alignment = 1
 
-        chart_data = CategoryChartData()
-        chart_data.categories = [c.strip() for c in categories_str.split(",")]
-        chart_data.add_series(plot_name, (float(v.strip()) for v in values_str.split(",")))
-
         x, y, cx, cy = Inches(1), Inches(2), Inches(6), Inches(4.5)
         chart_shape = slide.shapes.add_chart(XL_CHART_TYPE.PIE, x, y, cx, cy, chart_data)
         chart = chart_shape.chart 
@@ -542,6 +607,8 @@ class Presentationtools:
 
         # Add bullet points
         right_points = [point.strip() for point in right_content.split(';')]
+        font_size = self._fit_font_size([f"{i+1}. " + point + "\n" for i, point in enumerate(right_points)],
+                                        4, 4.5, max_size=20)
         for i, point in enumerate(right_points):
             if i == 0:
                 # Set the first paragraph's text
@@ -554,7 +621,7 @@ class Presentationtools:
             
             # Format bullet points
             p.level = 0
-            p.font.size = Pt(20)  # Set consistent font size
+            p.font.size = Pt(font_size)  # Set consistent font size
 
         file_path = self.save_presentation()
         return f"Slide with pie chart created and saved at: {file_path}"
@@ -569,16 +636,9 @@ class Presentationtools:
             plot_name: Title of the area chart
             Example: "A, B, C, D", "1, 2, 3, 4", "Area Chart Slide"
         """
-        if not hasattr(self, "prs"):
-            self.prs = self.get_presentation()
+        chart_data = load_category_data(categories_str, values_str, name=plot_name).to_chart_data()
 
-        self.prs.slide_width = Inches(self.config['slide_width']) 
-        self.prs.slide_height = Inches(self.config['slide_height'])
-
-        if insert_at is None:
-            slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])
-        else:
-            slide = self.insert_slide(self.prs, layout_index=5, position=int(insert_at))
+        slide = self._new_slide(insert_at)
 
         title_shape = slide.shapes.title
         title_shape.text = title  
@@ -586,17 +646,13 @@ class Presentationtools:
         title_shape.text_frame.paragraphs[0].font.bold = True
         title_shape.text_frame.paragraphs[0].alignment = 1
 
-        chart_data = CategoryChartData()
-        chart_data.categories = [c.strip() for c in categories_str.split(",")]
-        chart_data.add_series(plot_name, (float(v.strip()) for v in values_str.split(",")))
-
         x, y, cx, cy = Inches(4), Inches(2.5), Inches(6), Inches(4.5)
         slide.shapes.add_chart(XL_CHART_TYPE.AREA, x, y, cx, cy, chart_data)
 
         file_path = self.save_presentation()
         return f"Slide with area chart created and saved at: {file_path}"
     
-    def add_scatter_chart(self, input_x: str, input_y: str, title: str, plot_title: str, insert_at: str = None) -> str:
+    def add_scatter_chart(self, input_x: str, input_y: str, title: str, plot_title: str, insert_at: str = None, max_points: int = None) -> str:
         """
     Creates a scatter plot slide with labeled axes.
 
@@ -605,6 +661,7 @@ class Presentationtools:
     - input_y (str): Y-axis label and values in the format "Label; 5, 6, 7, 8" or just "5, 6, 7, 8".
     - title (str): The title of the slide.
     - plot_title (str): The title of the scatter plot.
+    - max_points (int): Optional point budget; larger point sets are downsampled with LTTB.
     
     Returns:
     - str: The file path of the saved presentation slide.
@@ -614,31 +671,15 @@ class Presentationtools:
     - add_scatter_chart("1, 2, 3, 4", "5, 6, 7, 8", "Scatter Plot Slide", "Scatter Plot")
     """
         try:
-            if ";" in input_x:
-                x_label, x_values_str = input_x.split(";")
-            else:
-                x_label, x_values_str = "X-Axis", input_x
-            
-            if ";" in input_y:
-                y_label, y_values_str = input_y.split(";")
-            else:
-                y_label, y_values_str = "Y-Axis", input_y
-            
-            x_values = [float(x.strip()) for x in x_values_str.split(",")]
-            y_values = [float(y.strip()) for y in y_values_str.split(",")]
+            x_label, x_values = load_axis(input_x, "X-Axis")
+            y_label, y_values = load_axis(input_y, "Y-Axis")
+            points = min(len(x_values), len(y_values))
         except ValueError:
             return "Error: Inputs must be in the format 'Label; 1, 2, 3, 4' or '1, 2, 3, 4' with numeric values."
+        # Like the line chart, a max_points that is not an integer raises before the slide is added
+        max_points = int(max_points or self.config["max_chart_points"] or 0)
         
-        if not hasattr(self, "prs"):
-            self.prs = self.get_presentation()
-
-        self.prs.slide_width = Inches(self.config['slide_width']) 
-        self.prs.slide_height = Inches(self.config['slide_height'])
-
-        if insert_at is None:
-            slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])
-        else:
-            slide = self.insert_slide(self.prs, layout_index=5, position=int(insert_at))
+        slide = self._new_slide(insert_at)
 
         title_shape = slide.shapes.title
         title_shape.text = title
@@ -647,11 +688,13 @@ class Presentationtools:
         title_frame.paragraphs[0].font.bold = True
         title_frame.paragraphs[0].alignment = 1  
 
-        chart_data = XyChartData()
-        series = chart_data.add_series(plot_title)
-
-        for x, y in zip(x_values, y_values):
-            series.add_data_point(x, y)
+        x_values, y_values = x_values[:points], y_values[:points]
+        if max_points and points > max_points:
+            order = np.argsort(x_values, kind="stable")
+            keep = order[lttb_indices(x_values[order], y_values[order], max_points)]
+            x_values, y_values = x_values[keep], y_values[keep]
+            self._add_downsampling_note(slide, points, len(keep))
+        chart_data = xy_chart_data(plot_title, x_values, y_values)
 
         x, y, cx, cy = Inches(4), Inches(2.5), Inches(6), Inches(4.5)
         chart_shape = slide.shapes.add_chart(XL_CHART_TYPE.XY_SCATTER, x, y, cx, cy, chart_data)
@@ -661,8 +704,8 @@ class Presentationtools:
         value_axis = chart.value_axis
         category_axis.has_title = True
         value_axis.has_title = True
-        category_axis.axis_title.text_frame.text = x_label.strip()
-        value_axis.axis_title.text_frame.text = y_label.strip()
+        category_axis.axis_title.text_frame.text = x_label
+        value_axis.axis_title.text_frame.text = y_label
 
         file_path = self.save_presentation()
         return f"Slide with scatter chart (with axis labels) created and saved at: {file_path}"
@@ -685,36 +728,9 @@ class Presentationtools:
             totals_str: Comma-separated string of total values (e.g., "100, None, None, None, 130, None, None, 140").
                         If not provided, totals will be calculated automatically.
         """
-        # Parse inputs
-        categories = [c.strip() for c in categories_str.split(",")]
-        values = [float(v.strip()) for v in values_str.split(",")]
-        if totals_str:
-            totals = [float(v.strip()) if v.strip().lower() != "none" else None for v in totals_str.split(",")]
-        else:
-            # Auto-calculate totals
-            totals = []
-            cumulative_sum = values[0]
-            for i, value in enumerate(values):
-                if i == 0:
-                    totals.append(value)
-                elif value == cumulative_sum:
-                    totals.append(value)
-                    cumulative_sum = value
-                else:
-                    totals.append(None)
-                    cumulative_sum += value
-
-        plot_path = self.plot_waterfall_chart(categories, values, totals)
-
-        if not hasattr(self, "prs"):
-            self.prs = self.get_presentation()
-
-        self.prs.slide_width = Inches(self.config['slide_width']) 
-        self.prs.slide_height = Inches(self.config['slide_height'])   
-        if insert_at is None:
-            slide = self.prs.slides.add_slide(self.prs.slide_layouts[5])
-        else:
-            slide = self.insert_slide(self.prs, layout_index=5, position=int(insert_at))
+        categories, values, totals = parse_waterfall_data(categories_str, values_str, totals_str)
+
+        slide = self._new_slide(insert_at)
 
         title_shape = slide.shapes.title
         title_shape.text = title  
@@ -726,13 +742,17 @@ class Presentationtools:
         top = Inches(1.5)   
         width = 12
         height = 5.5
-        pic = slide.shapes.add_picture(
-            plot_path,
-            left,
-            top,
-            width=Inches(width),
-            height=Inches(height)
-        )
+        if self.config["waterfall_renderer"] == "native":
+            self.add_native_waterfall_chart(slide, categories, values, totals, left, top, Inches(width), Inches(height))
+        else:
+            png = render_waterfall_png(categories, values, totals)
+            pic = slide.shapes.add_picture(
+                io.BytesIO(png),
+                left,
+                top,
+                width=Inches(width),
+                height=Inches(height)
+            )
 
         file_path = self.save_presentation()
         return f"Slide with waterfall chart created and saved at: {file_path}"
@@ -744,17 +764,11 @@ class Presentationtools:
         Args:
             title: Title of the slide
         """
-        if not hasattr(self, "prs"):
-            self.prs = self.get_presentation()
-            
-        # Set slide dimensions for 16:9 aspect ratio 
-        self.prs.slide_width = Inches(13.33)
-        self.prs.slide_height = Inches(7.5)
-
-        if insert_at is None:
-            slide = self.prs.slides.add_slide(self.prs.slide_layouts[5]) # Use blank layout
-        else:
-            slide = self.insert_slide(self.prs, layout_index=5, position=int(insert_at))
+        slide = self._new_slide(insert_at)
+        memo_key = self._slide_key("add_title_slide", title=title)
+        if SLIDE_CACHE.restore(memo_key, slide):
+            file_path = self.save_presentation()
+            return f"Title slide created and saved at: {file_path}"
 
         # Calculate center position
         left = Inches(1)
@@ -773,25 +787,129 @@ class Presentationtools:
         p.font.bold = True
         p.alignment = 2 # Center alignment
         
+        SLIDE_CACHE.store(memo_key, slide)
         file_path = self.save_presentation()
         return f"Title slide created and saved at: {file_path}"
 
+    def move_slide(self, index: int, insert_at: int):
+        """
+        Move a slide to another position
+        Args:
+            index: 0-based index of the slide to move
+            insert_at: 0-based position the slide should end up at
+        """
+        try:
+            self.session.slide_order.move(self.prs, int(index), int(insert_at))
+        except (IndexError, ValueError) as e:
+            return f"Error: {e}"
+        file_path = self.save_presentation()
+        return f"Slide {index} moved to position {insert_at} and saved at: {file_path}"
+
+    def delete_slide(self, index: int):
+        """
+        Delete a slide
+        Args:
+            index: 0-based index of the slide to delete
+        """
+        try:
+            self.session.slide_order.delete(self.prs, int(index))
+        except (IndexError, ValueError) as e:
+            return f"Error: {e}"
+        file_path = self.save_presentation()
+        return f"Slide {index} deleted and saved at: {file_path}"
+
+    def duplicate_slide(self, index: int, insert_at: int = None):
+        """
+        Duplicate a slide, including its charts and images
+        Args:
+            index: 0-based index of the slide to copy
+            insert_at: 0-based position of the copy, right after the original by default
+        """
+        try:
+            self.session.slide_order.duplicate(self.prs, int(index), None if insert_at is None else int(insert_at))
+        except (IndexError, ValueError) as e:
+            return f"Error: {e}"
+        file_path = self.save_presentation()
+        return f"Slide {index} duplicated and saved at: {file_path}"
+
+
+    def prepare_image(self, image_path, width_in, height_in):
+        """
+        Downscale and recompress an image for a picture box of the given size in inches
+        """
+        if not self.config["image_dpi"]:
+            return image_path
+        image, original_size, embedded_size = IMAGE_PIPELINE.prepare(image_path, width_in, height_in, dpi=self.config["image_dpi"])
+        self.session.image_bytes_saved += original_size - embedded_size
+        return image
+
+    def get_save_path(self):
+        """
+        Path the presentation is written to
+        """
+        return self.session.save_path
 
     def save_presentation(self):
         """
-        Save the presentation to a file
+        Save the presentation to a file.
+        Inside a batch the write is deferred until the batch is flushed.
         """
-        if self.mode == "normal":
-            print(f"self.save_path: {SAVE_PATH}")
-            self.prs.save(SAVE_PATH)
-            return SAVE_PATH
-        else:
-            save_path = f"output/{self.mode}.pptx"
+        session = self.session
+        with session.lock:
+            save_path = session.save_path
+            if session.batch_depth > 0:
+                if session.dirty:
+                    session.skipped_saves += 1
+                session.dirty = True
+                return save_path
+
             print(f"self.save_path: {save_path}")
-            self.prs.save(save_path)
-            return save_path
+            return session.write()
+
+    def flush(self):
+        """
+        Write pending changes to disk, if any. Can be used as an explicit checkpoint inside a batch.
+        """
+        session = self.session
+        with session.lock:
+            if not session.dirty:
+                return None
+            save_path = session.save_path
+            print(f"self.save_path: {save_path} (coalesced, {session.skipped_saves} saves skipped so far)")
+            if session.image_bytes_saved:
+                print(f"Image preprocessing saved {session.image_bytes_saved / 1024:.1f} KiB in this deck")
+            stats = SLIDE_CACHE.stats()
+            if stats["hits"]:
+                print(f"Slide cache: {stats['hits']} hits, {stats['misses']} misses, {stats['entries']} slides cached")
+            return session.write()
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer saving while slides are being built; the deck is written once when the
+        outermost batch exits normally. If the batch raises, nothing is written: the
+        slides built so far stay in memory and go out with the next save.
+
+        Batches can be nested on the same thread. The session lock is held for the whole
+        batch, so other threads using the session wait until it exits; do not wait from
+        inside a batch on another thread that uses the same session.
+        """
+        session = self.session
+        with session.lock:
+            session.batch_depth += 1
+            completed = False
+            try:
+                yield self
+                completed = True
+            finally:
+                session.batch_depth -= 1
+                if completed and session.batch_depth == 0:
+                    self.flush()
     
     def get_tools(self):
+        # Imported here so that building decks without an agent does not pay for langchain
+        from langchain.tools import StructuredTool
+
         print("🔍 Binding tools...")
         return [
             StructuredTool.from_function(
@@ -819,6 +937,11 @@ class Presentationtools:
                 name="add_table_slide",
                 description=TOOL_DESCRIPTIONS.get("add_table_slide")
             ),
+            StructuredTool.from_function(
+                func=self.add_table_from_source,
+                name="add_table_from_source",
+                description=TOOL_DESCRIPTIONS.get("add_table_from_source")
+            ),
             StructuredTool.from_function(
                 func=self.add_bar_chart,
                 name="add_bar_chart",
@@ -853,66 +976,118 @@ class Presentationtools:
                 func=self.add_title_slide,
                 name="add_title_slide",
                 description="Add a title slide to the presentation"
+            ),
+            StructuredTool.from_function(
+                func=self.move_slide,
+                name="move_slide",
+                description=TOOL_DESCRIPTIONS.get("move_slide")
+            ),
+            StructuredTool.from_function(
+                func=self.delete_slide,
+                name="delete_slide",
+                description=TOOL_DESCRIPTIONS.get("delete_slide")
+            ),
+            StructuredTool.from_function(
+                func=self.duplicate_slide,
+                name="duplicate_slide",
+                description=TOOL_DESCRIPTIONS.get("duplicate_slide")
             )
         ]
 
     @staticmethod
-    def plot_waterfall_chart(categories, values, totals, filename="output/waterfall_chart.png"):
-        labels = [f"{v:+}" for v in values]  # Add "+" or "-" to the value labels
-
-        # Initialize cumulative values
-        cumulative = [0]  # Start from baseline (0)
-        bar_positions = []  # Track where each bar should start
+    def add_native_waterfall_chart(slide, categories, values, totals, x, y, cx, cy):
+        """
+        Add an editable waterfall chart: a stacked column chart whose first series is an
+        invisible base that lifts every bar to its starting point.
+        """
+        bottoms, kinds = waterfall_layout(values, totals)
+        kind_names = {"total": "Total", "increase": "Increase", "decrease": "Decrease"}
+
+        base = []
+        segments = {kind: [None] * len(values) for kind in kind_names}
+        # Bars crossing zero are split: the part below zero stacks downwards on its own
+        below_zero = {kind: [None] * len(values) for kind in kind_names}
+        for i, (bottom, value, kind) in enumerate(zip(bottoms, values, kinds)):
+            low, high = sorted((bottom, bottom + value))
+            if low >= 0:
+                base.append(low)
+                segments[kind][i] = high - low
+            elif high <= 0:
+                base.append(high)
+                segments[kind][i] = low - high
+            else:
+                base.append(0)
+                segments[kind][i] = high
+                below_zero[kind][i] = low
 
-        for i, value in enumerate(values):
-            if totals[i] is not None:  # Total bar resets to 0
-                cumulative.append(totals[i])
-                bar_positions.append(0)
-            else:  # Incremental values
-                bar_positions.append(cumulative[-1])
-                cumulative.append(cumulative[-1] + value)
+        chart_data = CategoryChartData()
+        chart_data.categories = categories
+        chart_data.add_series("Base", base)
+        series_kinds = []
+        for kind, name in kind_names.items():
+            if any(v is not None for v in segments[kind]):
+                chart_data.add_series(name, segments[kind])
+                series_kinds.append((kind, False))
+        for kind, name in kind_names.items():
+            if any(v is not None for v in below_zero[kind]):
+                chart_data.add_series(f"{name} (below zero)", below_zero[kind])
+                series_kinds.append((kind, True))
+
+        chart = slide.shapes.add_chart(XL_CHART_TYPE.COLUMN_STACKED, x, y, cx, cy, chart_data).chart
+        chart.has_title = False
+        plot = chart.plots[0]
+        plot.gap_width = 50
+        plot.overlap = 100
+        chart.value_axis.has_major_gridlines = True
 
         # Assign colors: green for totals, blue for increases, orange for decreases
-        colors = []
-        for i, value in enumerate(values):
-            if totals[i] is not None:  # Total
-                colors.append("green")
-            elif value > 0:  # Increase
-                colors.append("steelblue")
-            else:  # Decrease
-                colors.append("darkorange")
-
-        # Plot
-        fig, ax = plt.subplots(figsize=(16, 6))
-        bars = ax.bar(categories, values, bottom=bar_positions, color=colors)
-
-        # Add labels to each bar
-        for bar, label in zip(bars, labels):
-            height = bar.get_height()
-            if height > 0:
-                ax.text(bar.get_x() + bar.get_width() / 2, bar.get_y() + height - 10, label, ha="center", va="bottom", fontsize=10)
-            else:
-                ax.text(bar.get_x() + bar.get_width() / 2, bar.get_y() + height - 10, label, ha="center", va="top", fontsize=10)
-
-        # Add title and legend
-        ax.set_title("Waterfall Chart", fontsize=14)
-        ax.set_ylabel("Values", fontsize=12)
-        ax.legend(
-            handles=[
-                plt.Rectangle((0, 0), 1, 1, color="green", label="Total"),
-                plt.Rectangle((0, 0), 1, 1, color="steelblue", label="Increase"),
-                plt.Rectangle((0, 0), 1, 1, color="darkorange", label="Decrease"),
-            ],
-            loc="upper right",
-        )
+        colors = {
+            "total": RGBColor(0x00, 0x80, 0x00),
+            "increase": RGBColor(0x46, 0x82, 0xB4),
+            "decrease": RGBColor(0xFF, 0x8C, 0x00),
+        }
+        base_series = plot.series[0]
+        base_series.format.fill.background()
+        base_series.format.line.fill.background()
+
+        for series, (kind, is_spill) in zip(list(plot.series)[1:], series_kinds):
+            series.format.fill.solid()
+            series.format.fill.fore_color.rgb = colors[kind]
+            if is_spill:
+                continue
+            # Label each bar with its signed increment, like the image renderer
+            for i, value in enumerate(values):
+                if kinds[i] == kind:
+                    data_label = series.points[i].data_label
+                    data_label.text_frame.text = waterfall_label(value)
+                    data_label.font.size = Pt(10)
+                    data_label.position = XL_LABEL_POSITION.INSIDE_END
 
-        # Add grid
-        ax.grid(axis="y", linestyle="--", alpha=0.7)
+        # Only Total / Increase / Decrease appear in the legend
+        chart.has_legend = True
+        chart.legend.position = XL_LEGEND_POSITION.TOP
+        chart.legend.include_in_layout = False
+        legend_pos = chart.legend._element.find(qn("c:legendPos"))
+        hidden = [0] + [i + 1 for i, (_, is_spill) in enumerate(series_kinds) if is_spill]
+        for idx in reversed(hidden):
+            entry = OxmlElement("c:legendEntry")
+            entry_idx = OxmlElement("c:idx")
+            entry_idx.set("val", str(idx))
+            entry_delete = OxmlElement("c:delete")
+            entry_delete.set("val", "1")
+            entry.append(entry_idx)
+            entry.append(entry_delete)
+            legend_pos.addnext(entry)
+        return chart
 
-        # Show plot
-        plt.tight_layout()
-        plt.savefig(filename)
-        
+    @staticmethod
+    def plot_waterfall_chart(categories, values, totals, filename="output/waterfall_chart.png"):
+        """
+        Render a waterfall chart image to a file. Kept for callers that need a file on disk;
+        add_waterfall_chart embeds the cached in-memory rendering directly.
+        """
+        with open(filename, "wb") as f:
+            f.write(render_waterfall_png(categories, values, totals))
         return filename
     
     @staticmethod
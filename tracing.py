@@ -0,0 +1,259 @@
+"""
+Span tracing for LLM calls, tool calls, saves and workflow nodes.
+
+Tracing is off unless the PPT_TRACE environment variable names an output file (PPT_TRACE=1
+writes trace.jsonl):
+
+    PPT_TRACE=trace.jsonl python workflow.py      # one JSON object per finished span
+    PPT_TRACE=trace.json python workflow.py       # Chrome trace format (chrome://tracing, Perfetto)
+
+PPT_TRACE_FORMAT=jsonl|chrome overrides the format picked from the extension. When tracing is
+off, span() returns a shared no-op context manager, so instrumented code pays one global
+lookup per span.
+
+Chrome traces are written when the process exits. Worker processes (which may exit without
+running atexit handlers) call configure_worker() when they start and flush() after each unit
+of work; they write <trace>.<pid>.json files that merge_worker_traces() folds into the trace
+of the parent process.
+
+    with tracing.span("save", "io", path=path) as sp:
+        ...
+        if sp:  # only compute expensive attributes when tracing is on
+            sp.set(bytes_written=size)
+"""
+import atexit
+import glob
+import itertools
+import json
+import os
+import threading
+import time
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __bool__(self):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Span:
+    __slots__ = ("tracer", "name", "category", "attrs", "id", "parent", "start")
+
+    def __init__(self, tracer, name, category, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.attrs = attrs
+        self.id = None
+        self.parent = None
+        self.start = None
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        stack = self.tracer._stack()
+        self.id = next(self.tracer._ids)
+        self.parent = stack[-1] if stack else None
+        stack.append(self.id)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        self.tracer._stack().pop()
+        if exc_type is not None:
+            self.attrs["error"] = f"{exc_type.__name__}: {exc}"
+        self.tracer._record(self, end)
+        return False
+
+
+class Tracer:
+    """
+    Collects spans and writes them as JSON lines (as they finish) or as a Chrome trace (on export)
+    """
+
+    def __init__(self, path, fmt=None):
+        self.path = path
+        self.format = fmt or ("chrome" if path.endswith(".json") else "jsonl")
+        self.pid = os.getpid()
+        self.events = []
+        self._origin = time.perf_counter()
+        self._epoch = time.time()
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._file = None
+        if self.format == "jsonl":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._file = open(path, "a", encoding="utf-8")
+
+    def span(self, name, category="", **attrs):
+        return Span(self, name, category, attrs)
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, span, end):
+        tid = threading.get_ident()
+        if self.format == "jsonl":
+            record = {
+                "name": span.name, "cat": span.category, "id": span.id, "parent": span.parent,
+                "start": self._epoch + (span.start - self._origin), "duration": end - span.start,
+                "pid": self.pid, "tid": tid, "attrs": span.attrs,
+            }
+            line = json.dumps(record, default=str)
+            with self._lock:
+                self._file.write(line + "\n")
+                self._file.flush()
+        else:
+            event = {
+                "name": span.name, "cat": span.category, "ph": "X", "pid": self.pid, "tid": tid,
+                # Wall-clock timestamps, so spans of worker processes line up when traces are merged
+                "ts": (self._epoch + span.start - self._origin) * 1e6, "dur": (end - span.start) * 1e6,
+                "args": span.attrs,
+            }
+            with self._lock:
+                self.events.append(event)
+
+    def export(self):
+        """
+        Write the collected spans; JSON lines are already on disk, Chrome traces are written here
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                return self.path
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f, default=str)
+            return self.path
+
+    def close(self):
+        self.export()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+_TRACER = None
+
+
+def configure(path=None, fmt=None):
+    """
+    Turn tracing on (writing to path) or off (path None). Replaces the tracer set up from PPT_TRACE.
+    """
+    global _TRACER
+    if _TRACER is not None:
+        _TRACER.close()
+    _TRACER = Tracer(path, fmt) if path else None
+    return _TRACER
+
+
+def settings():
+    """
+    (path, format) of the current tracer, or None when tracing is off; pass it to configure_worker
+    """
+    return (_TRACER.path, _TRACER.format) if _TRACER is not None else None
+
+
+def _worker_path(path, pid):
+    root, ext = os.path.splitext(path)
+    return f"{root}.{pid}{ext}"
+
+
+def configure_worker(trace_settings):
+    """
+    Set up tracing in a worker process from the settings() of its parent. JSON lines are
+    appended to the parent's file; Chrome traces go to a file of their own for
+    merge_worker_traces(). A tracer inherited from the parent is dropped without exporting it.
+    """
+    global _TRACER
+    inherited = _TRACER
+    if inherited is not None and inherited._file is not None:
+        inherited._file.close()
+    _TRACER = None
+    if trace_settings is not None:
+        path, fmt = trace_settings
+        _TRACER = Tracer(_worker_path(path, os.getpid()) if fmt == "chrome" else path, fmt)
+    return _TRACER
+
+
+def flush():
+    """
+    Write the spans collected so far (the whole trace in Chrome format)
+    """
+    if _TRACER is not None:
+        _TRACER.export()
+
+
+def merge_worker_traces():
+    """
+    Add the spans from the Chrome traces of finished worker processes to this process's
+    trace and remove their files.
+    Returns:
+        Number of spans merged
+    """
+    tracer = _TRACER
+    if tracer is None or tracer.format != "chrome":
+        return 0
+    root, ext = os.path.splitext(tracer.path)
+    merged = 0
+    for path in sorted(glob.glob(f"{glob.escape(root)}.*{ext}")):
+        if not path[len(root) + 1:-len(ext) or None].isdigit():
+            continue
+        with open(path, encoding="utf-8") as f:
+            events = json.load(f)["traceEvents"]
+        with tracer._lock:
+            tracer.events.extend(events)
+        os.remove(path)
+        merged += len(events)
+    return merged
+
+
+def span(name, category="", **attrs):
+    """
+    Context manager timing a block as a span, a falsy no-op when tracing is off
+    """
+    tracer = _TRACER
+    if tracer is None:
+        return NULL_SPAN
+    return tracer.span(name, category, **attrs)
+
+
+def enabled():
+    return _TRACER is not None
+
+
+def arg_sizes(args):
+    """
+    Length of every argument as text, used as a cheap size attribute for tool spans
+    """
+    return {name: len(value) if isinstance(value, str) else len(str(value)) for name, value in args.items()}
+
+
+def _close_at_exit():
+    if _TRACER is not None:
+        _TRACER.close()
+
+
+_env_path = os.environ.get("PPT_TRACE", "").strip()
+if _env_path.lower() in ("1", "true", "on", "yes"):
+    _env_path = "trace.jsonl"
+if _env_path and _env_path.lower() not in ("0", "false", "off", "no"):
+    configure(_env_path, os.environ.get("PPT_TRACE_FORMAT"))
+atexit.register(_close_at_exit)
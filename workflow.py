@@ -1,32 +1,41 @@
-from typing import TypeVar, Annotated
-from langgraph.graph import StateGraph, Graph, START, END
 from pydantic import BaseModel
 from typing import Dict, List
 from ppt_agent import PresentationAgent
 from template_prompts import TEMPLATE_PROMPTS
-from langchain_groq import ChatGroq
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_community.agent_toolkits.polygon.toolkit import PolygonToolkit
-from langchain_community.utilities.polygon import PolygonAPIWrapper
+from concurrent.futures import ThreadPoolExecutor
+import tracing
 import os
 from load_dotenv import load_dotenv
 load_dotenv()
 
 class PolygonSearchAgent:
     def __init__(self, llm="gemini"):
+        # Providers and the Polygon toolkit are imported on demand, they are slow to load
         if llm.startswith("llama"):
+            from langchain_groq import ChatGroq
             self.llm = ChatGroq(
                 model="llama3-70b-8192", 
                 temperature=0.1,
                 api_key=os.environ["GROQ_API_KEY"]
             )
         else:
+            from langchain_google_genai import ChatGoogleGenerativeAI
             self.llm = ChatGoogleGenerativeAI(
                     model="gemini-1.5-flash", 
                     temperature=0.1,
                     api_key=os.environ["GOOGLE_API_KEY"]
             )
 
+        self._toolkit = None
+
+    @property
+    def toolkit(self):
+        if self._toolkit is None:
+            from langchain_community.agent_toolkits.polygon.toolkit import PolygonToolkit
+            from langchain_community.utilities.polygon import PolygonAPIWrapper
+            self._toolkit = PolygonToolkit.from_polygon_api_wrapper(PolygonAPIWrapper())
+        return self._toolkit
+
     def search(self, query):
         pass
 
@@ -34,16 +43,25 @@ class WorkflowState(BaseModel):
     selected_template: str = ""
     extracted_data: Dict[str, str] = {}
     template_path: str = ""
+    failed_prompts: Dict[str, str] = {}
 
 class TemplateWorkflow:
-    def __init__(self):
-        pass
-        
+    def __init__(self, max_concurrency=4, llm="gemini"):
+        # Number of template prompts planned by the LLM at the same time
+        self.max_concurrency = max_concurrency
+        self.llm = llm
+        # Tool calls executed by the last run, in order, as plan steps (see plan.py)
+        self.last_plan = []
+        # Prompts of the last run that could not be planned or executed, with their errors
+        self.failed_prompts = {}
+
 
     def create_graph(self):
+        from langgraph.graph import StateGraph, END
+
         self.workflow = StateGraph(WorkflowState)
-        self.workflow.add_node("extract_data", self.extract_data)
-        self.workflow.add_node("route_template", self.route_template)
+        self.workflow.add_node("extract_data", self._traced("extract_data", self.extract_data))
+        self.workflow.add_node("route_template", self._traced("route_template", self.route_template))
 
         self.workflow.add_edge("extract_data", "route_template")
         self.workflow.add_edge("route_template", END)
@@ -52,6 +70,13 @@ class TemplateWorkflow:
 
         return self.workflow
 
+    @staticmethod
+    def _traced(name, node):
+        def traced_node(state):
+            with tracing.span(f"workflow.{name}", "workflow"):
+                return node(state)
+        return traced_node
+
     def extract_data(self, state):
         # Simulate data extraction
         state.extracted_data = {"key": "value"}
@@ -60,16 +85,48 @@ class TemplateWorkflow:
     def route_template(self, state):
         # Template routing logic
         prompts = TEMPLATE_PROMPTS[state.selected_template]
-        for prompt in prompts:
-            file_path = self.ppt.process_query(prompt)
+
+        # LLM planning calls are independent of each other, so run them concurrently
+        with tracing.span("workflow.plan", "workflow", prompts=len(prompts)), \
+                ThreadPoolExecutor(max_workers=max(1, self.max_concurrency)) as executor:
+            plans = list(executor.map(self._plan_prompt, prompts))
+
+        # Apply the tool calls in the original prompt order so slide order stays deterministic.
+        # One write for the whole template instead of one per prompt
+        # A failing prompt is skipped and recorded in failed_prompts so callers can tell a partial deck apart
+        file_path = state.template_path
+        self.last_plan = []
+        self.failed_prompts = {}
+        with tracing.span("workflow.execute", "workflow"), self.ppt.presentationtools.batch():
+            for prompt, tool_calls in zip(prompts, plans):
+                if isinstance(tool_calls, Exception):
+                    print(f"Skipping prompt '{prompt}': {tool_calls}")
+                    self.failed_prompts[prompt] = f"{type(tool_calls).__name__}: {tool_calls}"
+                    continue
+                try:
+                    file_path = self.ppt.execute_tool_calls(tool_calls)
+                except Exception as e:
+                    print(f"Error invoking tool: {e}")
+                    self.failed_prompts[prompt] = f"{type(e).__name__}: {e}"
+                self.last_plan.extend(self.ppt.last_plan)
 
         state.template_path = file_path
+        state.failed_prompts = dict(self.failed_prompts)
 
         return state
 
-    def run(self, selected_template):
-
-        self.ppt = PresentationAgent(mode=selected_template)
+    def _plan_prompt(self, prompt):
+        try:
+            return self.ppt.plan_query(prompt)
+        except Exception as e:
+            return e
+
+    def run(self, selected_template, session=None):
+        """
+        Build the deck for a template. Runs keep their agent on the workflow, so use one
+        TemplateWorkflow (and PresentationSession) per concurrent build.
+        """
+        self.ppt = PresentationAgent(llm=self.llm, mode=selected_template, session=session)
 
         workflow = self.create_graph()
 